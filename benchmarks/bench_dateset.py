@@ -0,0 +1,51 @@
+"""
+Compare plain sets of PyDate with DateSet for availability calendars: building, intersecting across resources and
+memory use.
+
+Usage: python benchmarks/bench_dateset.py [resources] [days]
+"""
+import random
+import sys
+import time
+import tracemalloc
+from functools import reduce
+
+from dvrd_pydate import PyDate
+from dvrd_pydate.dateset import DateSet
+
+
+def build(calendars: list[list[PyDate]], factory) -> tuple[list, float, int]:
+    start = time.perf_counter()
+    result = [factory(days) for days in calendars]
+    elapsed = time.perf_counter() - start
+    # Measured separately, tracing slows down the build
+    del result
+    tracemalloc.start()
+    result = [factory(days) for days in calendars]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def main():
+    resources = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    days = int(sys.argv[2]) if len(sys.argv) > 2 else 730
+    rng = random.Random(1)
+    all_days = list(PyDate.iter(start=PyDate(2024, 1, 1), max_steps=days))
+    calendars = [[day for day in all_days if rng.random() < 0.995] for _ in range(resources)]
+    print(f'{resources} resources, {days} days')
+    print(f'{"type":<10}{"build (s)":>12}{"memory (KiB)":>14}{"intersect (ms)":>16}{"union (ms)":>12}')
+    for name, factory in (('set', set), ('DateSet', DateSet)):
+        values, build_time, memory = build(calendars, factory)
+        start = time.perf_counter()
+        common = reduce(lambda first, second: first & second, values)
+        intersect_time = time.perf_counter() - start
+        start = time.perf_counter()
+        reduce(lambda first, second: first | second, values)
+        union_time = time.perf_counter() - start
+        print(f'{name:<10}{build_time:>12.3f}{memory / 1024:>14.0f}{intersect_time * 1000:>16.2f}'
+              f'{union_time * 1000:>12.2f}  ({len(common)} common days)')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""
+Compare JSON encoding and decoding of payloads containing dates using stdlib json hooks and dvrd_pydate.json_io.
+
+Usage: python benchmarks/bench_json.py [records]
+"""
+import json
+import sys
+import time
+
+from dvrd_pydate import PyDate, PyDateTime, TimePart
+from dvrd_pydate.json_io import dumps, loads
+
+
+def build_payload(records: int) -> list[dict]:
+    moments = PyDateTime.iter(start=PyDateTime(2024, 1, 1), step=(37, TimePart.SECONDS), max_steps=records)
+    return [{'id': index, 'day': PyDate(moment), 'created': moment, 'tags': ['a', 'b']}
+            for index, moment in enumerate(moments)]
+
+
+def stdlib_default(value):
+    return value.isoformat()
+
+
+def stdlib_loads(text: str) -> list[dict]:
+    result = json.loads(text)
+    for record in result:
+        record['day'] = PyDate.from_value(record['day'])
+        record['created'] = PyDateTime.from_value(record['created'])
+    return result
+
+
+def timed(function, *args, repeat: int = 5, **kwargs) -> float:
+    # Best of repeat runs, a single run is dominated by noise and garbage collection of the previous result
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(*args, **kwargs)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    payload = build_payload(records)
+    text = dumps(payload)
+    size = len(text) / 1024 / 1024
+    fields = {'day': PyDate, 'created': PyDateTime}
+    print(f'{records} records, {size:.1f} MiB')
+    print(f'{"operation":<28}{"time (s)":>10}{"MiB/s":>10}')
+    for name, function, args, kwargs in (
+            ('stdlib dumps (default hook)', json.dumps, (payload,), {'default': stdlib_default}),
+            ('json_io dumps', dumps, (payload,), {}),
+            ('stdlib loads + walk', stdlib_loads, (text,), {}),
+            ('json_io loads (lazy)', loads, (text,), {'fields': fields}),
+            ('json_io loads (eager)', loads, (text,), {'fields': fields, 'lazy': False})):
+        elapsed = timed(function, *args, **kwargs)
+        print(f'{name:<28}{elapsed:>10.3f}{size / elapsed:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+Compare the default ISO text storage of dates in SQLite with the integer storage of dvrd_pydate.sqlite.
+
+Usage: python benchmarks/bench_sqlite.py [rows]
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from dvrd_pydate import PyDateTime, TimePart
+from dvrd_pydate.sqlite import register_sqlite
+
+
+def run(rows: int, integer_storage: bool) -> tuple[float, float, int]:
+    values = list(PyDateTime.iter(start=PyDateTime(2024, 1, 1), step=(37, TimePart.SECONDS), max_steps=rows))
+    if integer_storage:
+        register_sqlite()
+        column_type = 'PYDATETIME'
+        parameters = values
+    else:
+        column_type = 'TEXT'
+        parameters = [value.isoformat(' ') for value in values]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'bench.db')
+        connection = sqlite3.connect(path)
+        connection.execute(f'CREATE TABLE events (id INTEGER PRIMARY KEY, moment {column_type})')
+        connection.execute('CREATE INDEX events_moment ON events (moment)')
+        start = time.perf_counter()
+        connection.executemany('INSERT INTO events (moment) VALUES (?)', [(value,) for value in parameters])
+        connection.commit()
+        insert_time = time.perf_counter() - start
+
+        lower, upper = parameters[rows // 4], parameters[rows // 2]
+        start = time.perf_counter()
+        for _ in range(20):
+            connection.execute('SELECT count(*) FROM events WHERE moment >= ? AND moment < ?', (lower, upper)).fetchone()
+        query_time = (time.perf_counter() - start) / 20
+        connection.close()
+        size = os.path.getsize(path)
+    return insert_time, query_time, size
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    print(f'{rows} rows')
+    print(f'{"storage":<10}{"insert (s)":>12}{"range query (ms)":>18}{"file size (KiB)":>17}')
+    for name, integer_storage in (('text', False), ('integer', True)):
+        insert_time, query_time, size = run(rows, integer_storage)
+        print(f'{name:<10}{insert_time:>12.3f}{query_time * 1000:>18.2f}{size / 1024:>17.0f}')
+
+
+if __name__ == '__main__':
+    main()
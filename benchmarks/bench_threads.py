@@ -0,0 +1,79 @@
+"""
+Run add, iter, parsing and comparison workloads on 1 to N threads and report how throughput scales. On a GIL build
+the efficiency drops with every thread added; on a free-threaded build (e.g. 3.13t) it should stay close to 100%.
+
+Usage: python benchmarks/bench_threads.py [max threads] [operations per thread]
+"""
+import os
+import sys
+import threading
+import time
+from typing import Callable
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart, TimePart
+
+
+def add_workload(operations: int):
+    value = PyDate(2024, 1, 31)
+    for _ in range(operations):
+        value.add(1, DatePart.MONTH)
+        value.add(3, DatePart.DAYS)
+
+
+def iter_workload(operations: int):
+    for _ in PyDateTime.iter(start=PyDateTime(2024, 1, 1), step=(1, TimePart.MINUTE), max_steps=operations):
+        pass
+
+
+def parse_workload(operations: int):
+    values = ['2024-05-15T10:30:00', '2024-05-15', '2023-12-31T23:59:59.123456']
+    for index in range(operations):
+        PyDateTime(values[index % 3])
+
+
+def compare_workload(operations: int):
+    first, second = PyDate(2024, 1, 1), PyDate(2024, 1, 15)
+    for _ in range(operations):
+        first.is_before(second, DatePart.MONTH)
+        first.is_same_or_after(second, DatePart.WEEK)
+
+
+def run(workload: Callable[[int], None], thread_count: int, operations: int) -> float:
+    barrier = threading.Barrier(thread_count + 1)
+
+    def work():
+        barrier.wait()
+        workload(operations)
+
+    threads = [threading.Thread(target=work) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads:
+        thread.join()
+    return time.perf_counter() - start
+
+
+def main():
+    max_threads = int(sys.argv[1]) if len(sys.argv) > 1 else min(os.cpu_count() or 1, 8)
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil_enabled else "disabled"}, '
+          f'{operations} operations per thread')
+    print(f'{"workload":<10}{"threads":>8}{"time (s)":>10}{"ops/s":>12}{"efficiency":>12}')
+    for name, workload in (('add', add_workload), ('iter', iter_workload), ('parse', parse_workload),
+                           ('compare', compare_workload)):
+        single_rate = None
+        for thread_count in range(1, max_threads + 1):
+            elapsed = run(workload, thread_count, operations)
+            rate = thread_count * operations / elapsed
+            if single_rate is None:
+                single_rate = rate
+            # Throughput relative to perfect linear scaling from one thread
+            efficiency = rate / (single_rate * thread_count)
+            print(f'{name:<10}{thread_count:>8}{elapsed:>10.3f}{rate:>12.0f}{efficiency:>12.0%}')
+
+
+if __name__ == '__main__':
+    main()
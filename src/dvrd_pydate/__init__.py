@@ -1,3 +1,9 @@
 from .pydate import PyDate
-from .pydatetime import PyDateTime
-from .enums import DatePart, TimePart
\ No newline at end of file
+from .pydatetime import PyDateTime, LazyPyDateTime
+from .enums import DatePart, TimePart
+from .formatting import compile_formatter, format_many
+from .periods import FiscalCalendar
+from .offset import Offset
+from .interning import enable_interning, disable_interning, interning
+from .grid import MonthGrid
+from .dateset import DateSet
@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime, tzinfo
+from functools import update_wrapper
+from typing import Any, Callable, NamedTuple, TypeVar
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydatetime import PyDateTime
+
+Function = TypeVar('Function', bound=Callable)
+
+_kwargs_mark = object()
+
+
+class PeriodCacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+    # Start of the next period, when all entries expire. None if nothing is cached yet
+    expires_at: PyDateTime | None
+
+
+def cache_per_period(part: DatePart | TimePart = DatePart.DAY, *, maxsize: int = 128, tz: tzinfo | None = None,
+                     clock: Callable[[], datetime] = None) -> Callable[[Function], Function]:
+    """
+    Memoize a function per period, e.g. per day with DatePart.DAY: all results expire at the start of the next
+    period. The boundary is computed once per period, as start_of(part) plus one part; each call only compares the
+    current time with it. At most maxsize results (least recently used first out) are kept. Safe to use from multiple
+    threads; like lru_cache, concurrent calls with the same arguments may both call the function.
+    :param tz: timezone the periods are aligned to, local (naive) time if omitted
+    :param clock: function returning the current time, PyDateTime.now(tz) by default
+    """
+    if maxsize < 1:
+        raise ValueError('maxsize must be at least 1')
+    # Raises KeyError for unsupported parts
+    PyDateTime(2000, 1, 1).start_of(part)
+    if clock is None:
+        def clock() -> datetime:
+            return PyDateTime.now(tz)
+
+    def decorator(function: Function) -> Function:
+        lock = threading.Lock()
+        entries: OrderedDict[Any, Any] = OrderedDict()
+        # [period start, next period start, hits, misses]
+        state: list = [None, None, 0, 0]
+
+        def wrapper(*args, **kwargs):
+            key = args if not kwargs else args + (_kwargs_mark,) + tuple(kwargs.items())
+            now = clock()
+            with lock:
+                if state[0] is None or not state[0] <= now < state[1]:
+                    entries.clear()
+                    start = PyDateTime.from_value(now).start_of(part)
+                    if start.tzinfo is None and now.tzinfo is not None:
+                        # start_of of date parts drops the timezone
+                        start = start.replace(tzinfo=now.tzinfo)
+                    state[0], state[1] = start, start.add(1, part)
+                period_start = state[0]
+                if key in entries:
+                    entries.move_to_end(key)
+                    state[2] += 1
+                    return entries[key]
+                state[3] += 1
+            result = function(*args, **kwargs)
+            with lock:
+                # Don't store the result in a newer period than it was computed in
+                if state[0] == period_start:
+                    entries[key] = result
+                    if len(entries) > maxsize:
+                        entries.popitem(last=False)
+            return result
+
+        def cache_info() -> PeriodCacheInfo:
+            with lock:
+                return PeriodCacheInfo(state[2], state[3], maxsize, len(entries), state[1])
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+                state[:] = [None, None, 0, 0]
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return update_wrapper(wrapper, function)
+
+    return decorator
@@ -0,0 +1,214 @@
+from datetime import date
+from typing import Generator, Iterable
+
+from dvrd_pydate.pydate import PyDate
+
+
+class DateSet:
+    """
+    Set of days stored as the bits of an integer, relative to an ordinal origin (the first day in the set). Set
+    operations between DateSets are a few integer operations, regardless of the amount of days.
+
+    >>> available = DateSet.from_range('2024-01-01', '2024-01-08') - DateSet(['2024-01-03'])
+    >>> available.intervals()
+    [(PyDate(2024, 1, 1), PyDate(2024, 1, 3)), (PyDate(2024, 1, 4), PyDate(2024, 1, 8))]
+    """
+    __slots__ = ('_origin', '_bits')
+
+    def __init__(self, values: Iterable[date | str] = ()):
+        ordinals = [_ordinal(value) for value in values]
+        self._origin = origin = min(ordinals) if ordinals else 0
+        # Set the bits in a buffer, or-ing into a growing integer would copy it for every day
+        buffer = bytearray((max(ordinals) - origin) // 8 + 1 if ordinals else 0)
+        for ordinal in ordinals:
+            index = ordinal - origin
+            buffer[index >> 3] |= 1 << (index & 7)
+        self._bits = int.from_bytes(buffer, 'little')
+
+    @staticmethod
+    def from_range(start: date | str, end: date | str) -> "DateSet":
+        """
+        All days from start up to (excluding) end, like iter.
+        """
+        return DateSet.from_intervals([(start, end)])
+
+    @staticmethod
+    def from_intervals(intervals: Iterable[tuple[date | str, date | str]]) -> "DateSet":
+        """
+        :param intervals: (start, end) pairs, end excluded
+        """
+        result = DateSet()
+        for start, end in intervals:
+            start_ordinal = _ordinal(start)
+            length = _ordinal(end) - start_ordinal
+            if length > 0:
+                result._combine(start_ordinal, (1 << length) - 1, 'or')
+        return result
+
+    def intervals(self) -> list[tuple[PyDate, PyDate]]:
+        """
+        Runs of consecutive days as (start, end) pairs, end excluded, in order.
+        """
+        bits = self._bits
+        origin = self._origin
+        starts = _bit_indexes(bits & ~(bits << 1))
+        ends = _bit_indexes(bits & ~(bits >> 1))
+        return [(PyDate.fromordinal(origin + start), PyDate.fromordinal(origin + end + 1))
+                for start, end in zip(starts, ends)]
+
+    def add(self, value: date | str):
+        self._combine(_ordinal(value), 1, 'or')
+
+    def discard(self, value: date | str):
+        index = _ordinal(value) - self._origin
+        if index >= 0:
+            self._bits &= ~(1 << index)
+            self._normalize()
+
+    def first(self) -> PyDate | None:
+        return self.next_in(PyDate.fromordinal(self._origin)) if self._bits else None
+
+    def last(self) -> PyDate | None:
+        return PyDate.fromordinal(self._origin + self._bits.bit_length() - 1) if self._bits else None
+
+    def next_in(self, start: date | str) -> PyDate | None:
+        """
+        First day in the set on or after start, None if there is none.
+        """
+        index = max(_ordinal(start) - self._origin, 0)
+        rest = self._bits >> index
+        if not rest:
+            return None
+        return PyDate.fromordinal(self._origin + index + (rest & -rest).bit_length() - 1)
+
+    def next_free(self, start: date | str) -> PyDate:
+        """
+        First day not in the set on or after start.
+        """
+        ordinal = _ordinal(start)
+        index = ordinal - self._origin
+        if index < 0:
+            return PyDate.fromordinal(ordinal)
+        # Lowest zero bit from index onwards
+        inverted = ~(self._bits >> index)
+        return PyDate.fromordinal(ordinal + (inverted & -inverted).bit_length() - 1)
+
+    def union(self, *others: "DateSet") -> "DateSet":
+        return self._operation(others, 'or')
+
+    def intersection(self, *others: "DateSet") -> "DateSet":
+        return self._operation(others, 'and')
+
+    def difference(self, *others: "DateSet") -> "DateSet":
+        return self._operation(others, 'difference')
+
+    def symmetric_difference(self, other: "DateSet") -> "DateSet":
+        return self._operation((other,), 'xor')
+
+    def issubset(self, other: "DateSet") -> bool:
+        return not self.difference(other)
+
+    def issuperset(self, other: "DateSet") -> bool:
+        return other.issubset(self)
+
+    def copy(self) -> "DateSet":
+        result = DateSet()
+        result._origin, result._bits = self._origin, self._bits
+        return result
+
+    def __or__(self, other: "DateSet") -> "DateSet":
+        return self.union(other) if isinstance(other, DateSet) else NotImplemented
+
+    def __and__(self, other: "DateSet") -> "DateSet":
+        return self.intersection(other) if isinstance(other, DateSet) else NotImplemented
+
+    def __sub__(self, other: "DateSet") -> "DateSet":
+        return self.difference(other) if isinstance(other, DateSet) else NotImplemented
+
+    def __xor__(self, other: "DateSet") -> "DateSet":
+        return self.symmetric_difference(other) if isinstance(other, DateSet) else NotImplemented
+
+    def __le__(self, other: "DateSet") -> bool:
+        return self.issubset(other) if isinstance(other, DateSet) else NotImplemented
+
+    def __ge__(self, other: "DateSet") -> bool:
+        return self.issuperset(other) if isinstance(other, DateSet) else NotImplemented
+
+    def __contains__(self, value: date | str) -> bool:
+        index = _ordinal(value) - self._origin
+        return index >= 0 and bool(self._bits >> index & 1)
+
+    def __len__(self) -> int:
+        return self._bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __iter__(self) -> Generator[PyDate, None, None]:
+        origin = self._origin
+        for index in _bit_indexes(self._bits):
+            yield PyDate.fromordinal(origin + index)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, DateSet):
+            return NotImplemented
+        return self._bits == other._bits and (self._origin == other._origin or not self._bits)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'DateSet({[value.isoformat() for value in self]!r})'
+
+    def _operation(self, others: Iterable["DateSet"], operation: str) -> "DateSet":
+        result = self.copy()
+        for other in others:
+            result._combine(other._origin, other._bits, operation)
+        return result
+
+    def _combine(self, origin: int, bits: int, operation: str):
+        if not self._bits:
+            self._origin = origin
+            self._bits = 0
+        if not bits:
+            bits = 0
+            origin = self._origin
+        # Align both to the lowest origin
+        new_origin = min(self._origin, origin)
+        own = self._bits << (self._origin - new_origin)
+        bits <<= origin - new_origin
+        if operation == 'or':
+            own |= bits
+        elif operation == 'and':
+            own &= bits
+        elif operation == 'difference':
+            own &= ~bits
+        else:
+            own ^= bits
+        self._origin = new_origin
+        self._bits = own
+        self._normalize()
+
+    def _normalize(self):
+        # Keep the origin at the first day in the set
+        bits = self._bits
+        if bits and not bits & 1:
+            shift = (bits & -bits).bit_length() - 1
+            self._bits = bits >> shift
+            self._origin += shift
+
+
+def _ordinal(value: date | str) -> int:
+    if not isinstance(value, date):
+        value = PyDate.from_value(value)
+    return value.toordinal()
+
+
+def _bit_indexes(bits: int) -> Generator[int, None, None]:
+    # Indexes of the set bits in ascending order, scanning bytes instead of shifting the whole integer per bit
+    data = bits.to_bytes((bits.bit_length() + 7) // 8, 'little')
+    for byte_index, byte in enumerate(data):
+        if byte:
+            base = byte_index * 8
+            for bit in range(8):
+                if byte >> bit & 1:
+                    yield base + bit
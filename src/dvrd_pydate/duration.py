@@ -0,0 +1,191 @@
+import re
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Generator, NamedTuple
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydate import PyDate, months_in_year, microseconds_in_day
+from dvrd_pydate.pydatetime import PyDateTime
+
+_duration_pattern = re.compile(
+    r'([+-])?P(?:(\d+)Y)?(?:(\d+)M)?(?:(\d+)W)?(?:(\d+(?:[.,]\d+)?)D)?'
+    r'(?:T(?:(\d+(?:[.,]\d+)?)H)?(?:(\d+(?:[.,]\d+)?)M)?(?:(\d+(?:[.,]\d+)?)S)?)?')
+# Microseconds per day, hour, minute and second component
+_component_microseconds = (microseconds_in_day, 3_600_000_000, 60_000_000, 1_000_000)
+
+
+class Duration:
+    """
+    ISO 8601 duration, reduced to months, days and microseconds. Applying it adds the months (clamping the day to the
+    end of the month, like add_months) and then the days and microseconds, in one step. Durations are immutable.
+    """
+    __slots__ = ('months', 'days', 'microseconds')
+
+    def __init__(self, months: int = 0, days: int = 0, microseconds: int = 0):
+        object.__setattr__(self, 'months', months)
+        object.__setattr__(self, 'days', days)
+        object.__setattr__(self, 'microseconds', microseconds)
+
+    def apply(self, value: date | str) -> PyDate:
+        if isinstance(value, datetime):
+            if not isinstance(value, PyDateTime):
+                value = PyDateTime.from_value(value)
+        elif isinstance(value, date):
+            if self.microseconds:
+                raise TypeError('TimePart cannot be used in PyDate')
+            if not isinstance(value, PyDate):
+                value = PyDate.from_value(value)
+        else:
+            value = PyDateTime.from_value(value) if self.microseconds or len(value) > 10 else PyDate.from_value(value)
+        if self.months:
+            year, month = divmod(value.year * months_in_year + value.month - 1 + self.months, months_in_year)
+            month += 1
+            value = value.replace(year=year, month=month, day=min(value.day, monthrange(year, month)[1]))
+        if self.days or self.microseconds:
+            value = value + timedelta(days=self.days, microseconds=self.microseconds)
+        return value
+
+    __call__ = apply
+
+    def isoformat(self) -> str:
+        """
+        ISO 8601 text of the duration, which has a single sign. Days and microseconds are applied together, so they
+        are combined when their signs differ (P1D - PT1H gives PT23H). A ValueError is raised when months and the
+        rest have different signs (P1M - P1D), as those can't be written as one ISO 8601 duration.
+        """
+        months, days, microseconds = self.parts()
+        if days * microseconds < 0:
+            days, microseconds = divmod(days * microseconds_in_day + microseconds, microseconds_in_day)
+            if days < 0 < microseconds:
+                days, microseconds = days + 1, microseconds - microseconds_in_day
+        if not (months or days or microseconds):
+            return 'PT0S'
+        if months * days < 0 or months * microseconds < 0:
+            raise ValueError(f'{self!r} has months and days or time of different signs')
+        negative = months < 0 or days < 0 or microseconds < 0
+        if negative:
+            months, days, microseconds = -months, -days, -microseconds
+        years, months = divmod(months, months_in_year)
+        hours, microseconds = divmod(microseconds, 3_600_000_000)
+        minutes, microseconds = divmod(microseconds, 60_000_000)
+        seconds, microseconds = divmod(microseconds, 1_000_000)
+        text = ['-P' if negative else 'P']
+        text.extend(f'{value}{unit}' for value, unit in ((years, 'Y'), (months, 'M'), (days, 'D')) if value)
+        if hours or minutes or seconds or microseconds:
+            text.append('T')
+            text.extend(f'{value}{unit}' for value, unit in ((hours, 'H'), (minutes, 'M')) if value)
+            if seconds or microseconds:
+                text.append(f'{seconds}.{microseconds:06d}'.rstrip('0').rstrip('.') + 'S')
+        return ''.join(text)
+
+    def parts(self) -> tuple[int, int, int]:
+        return self.months, self.days, self.microseconds
+
+    def __add__(self, other: "Duration") -> "Duration":
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return Duration(self.months + other.months, self.days + other.days, self.microseconds + other.microseconds)
+
+    def __sub__(self, other: "Duration") -> "Duration":
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self + -other
+
+    def __neg__(self) -> "Duration":
+        return Duration(-self.months, -self.days, -self.microseconds)
+
+    def __bool__(self) -> bool:
+        return bool(self.months or self.days or self.microseconds)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Duration):
+            return NotImplemented
+        return self.parts() == other.parts()
+
+    def __hash__(self) -> int:
+        return hash(self.parts())
+
+    def __setattr__(self, name: str, value):
+        raise AttributeError('Duration is immutable')
+
+    def __delattr__(self, name: str):
+        raise AttributeError('Duration is immutable')
+
+    def __reduce__(self):
+        # Slots can't be restored through __setattr__, rebuild from the parts (pickle, copy)
+        return Duration, self.parts()
+
+    def __repr__(self) -> str:
+        return f'Duration(months={self.months}, days={self.days}, microseconds={self.microseconds})'
+
+    def __str__(self) -> str:
+        return self.isoformat()
+
+
+class Interval(NamedTuple):
+    start: PyDate
+    # Excluded
+    end: PyDate
+
+    def iter(self, step: DatePart | TimePart | tuple[int | float, DatePart | TimePart] | Duration = DatePart.DAY) -> \
+            Generator[PyDate, None, None]:
+        iterate = PyDateTime.iter if isinstance(self.start, datetime) else PyDate.iter
+        return iterate(start=self.start, end=self.end, step=step)
+
+    def __contains__(self, value: date) -> bool:
+        return self.start <= value < self.end
+
+
+@lru_cache(maxsize=1024)
+def parse_duration(text: str) -> Duration:
+    """
+    Parse an ISO 8601 duration such as 'P1M2DT3H' or '-PT0.5S'. Years are 12 months, weeks 7 days. Only days and time
+    components can have a fraction. Results are cached.
+    """
+    match = _duration_pattern.fullmatch(text.strip())
+    if match is None or text.strip().endswith('T') or not any(match.groups()[1:]):
+        raise ValueError(f'Invalid ISO 8601 duration {text!r}')
+    sign, years, months, weeks, *time_parts = match.groups()
+    total_months = int(years or 0) * months_in_year + int(months or 0)
+    days = int(weeks or 0) * 7
+    microseconds = 0
+    for value, unit_microseconds in zip(time_parts, _component_microseconds):
+        if value is None:
+            continue
+        number = float(value.replace(',', '.'))
+        if unit_microseconds == microseconds_in_day:
+            # Keep whole days as days, so the duration can be applied to PyDate
+            days += int(number)
+            number -= int(number)
+        microseconds += round(number * unit_microseconds)
+    if sign == '-':
+        return Duration(-total_months, -days, -microseconds)
+    return Duration(total_months, days, microseconds)
+
+
+@lru_cache(maxsize=1024)
+def parse_interval(text: str) -> Interval:
+    """
+    Parse an ISO 8601 interval: '<start>/<end>', '<start>/<duration>' or '<duration>/<end>'. Dates without a time are
+    returned as PyDate, others as PyDateTime. Dates combined with a duration that has time components (e.g.
+    '2024-01-01/PT12H') are returned as PyDateTime at midnight. Results are cached.
+    """
+    first, separator, second = text.strip().partition('/')
+    if not separator or not first or not second:
+        raise ValueError(f'Invalid ISO 8601 interval {text!r}')
+    if first.startswith('P'):
+        duration = parse_duration(first)
+        end = _parse_moment(second, bool(duration.microseconds))
+        return Interval((-duration)(end), end)
+    if second.startswith('P'):
+        duration = parse_duration(second)
+        start = _parse_moment(first, bool(duration.microseconds))
+        return Interval(start, duration(start))
+    return Interval(_parse_moment(first), _parse_moment(second))
+
+
+def _parse_moment(text: str, with_time: bool = False) -> PyDate:
+    if with_time or len(text) > 10:
+        return PyDateTime.fromisoformat(text)
+    return PyDate.fromisoformat(text)
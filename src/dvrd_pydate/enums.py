@@ -4,7 +4,12 @@ from enum import Enum
 class BaseEnum(Enum):
     @classmethod
     def get_item(cls, value: str):
-        return next((item for item in cls if item.value == value), None)
+        # Dict lookup instead of iterating all members, no per-call generator or shared state writes
+        try:
+            return cls._value2member_map_.get(value)
+        except TypeError:
+            # Unhashable value
+            return None
 
 
 class DatePart(BaseEnum):
@@ -14,8 +19,16 @@ class DatePart(BaseEnum):
     WEEKS = 'weeks'
     MONTH = 'month'
     MONTHS = 'months'
+    QUARTER = 'quarter'
+    QUARTERS = 'quarters'
     YEAR = 'year'
     YEARS = 'years'
+    ISO_YEAR = 'iso_year'
+    ISO_YEARS = 'iso_years'
+    FISCAL_QUARTER = 'fiscal_quarter'
+    FISCAL_QUARTERS = 'fiscal_quarters'
+    FISCAL_YEAR = 'fiscal_year'
+    FISCAL_YEARS = 'fiscal_years'
 
 
 class TimePart(BaseEnum):
@@ -0,0 +1,160 @@
+import io
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
+from operator import attrgetter, methodcaller
+from typing import Callable, Iterable, Any, TextIO, BinaryIO
+
+day_abbreviations = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+day_names = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+month_abbreviations = ('', 'Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+month_names = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October',
+               'November', 'December')
+
+time_directives = frozenset('HIMSfp')
+
+# strftime zero-pads years below 1000 on some platforms (e.g. macOS: 0035) but not on others (glibc: 35)
+_year_conversion = '%04d' if date(1, 1, 1).strftime('%Y') == '0001' else '%d'
+
+# Directive -> (%-style conversion, attribute name or getter)
+_directives: dict[str, tuple[str, str | Callable[[date], Any]]] = {
+    'Y': (_year_conversion, 'year'),
+    'y': ('%02d', lambda value: value.year % 100),
+    'm': ('%02d', 'month'),
+    'd': ('%02d', 'day'),
+    'j': ('%03d', lambda value: value.timetuple().tm_yday),
+    'a': ('%s', lambda value: day_abbreviations[value.weekday()]),
+    'A': ('%s', lambda value: day_names[value.weekday()]),
+    'w': ('%d', lambda value: value.isoweekday() % 7),
+    'u': ('%d', methodcaller('isoweekday')),
+    'b': ('%s', lambda value: month_abbreviations[value.month]),
+    'B': ('%s', lambda value: month_names[value.month]),
+    'H': ('%02d', 'hour'),
+    'I': ('%02d', lambda value: value.hour % 12 or 12),
+    'M': ('%02d', 'minute'),
+    'S': ('%02d', 'second'),
+    'f': ('%06d', 'microsecond'),
+    'p': ('%s', lambda value: 'AM' if value.hour < 12 else 'PM'),
+}
+
+# Values used for time directives when formatting a plain date, matching date.strftime
+_date_time_values: dict[str, Any] = {'H': 0, 'I': 12, 'M': 0, 'S': 0, 'f': 0, 'p': 'AM'}
+
+
+class CompiledFormatter:
+    """
+    strftime-compatible renderer for a single pattern. The pattern is translated once into a %-style template and a
+    field getter, so rendering a value is a single string interpolation. Patterns containing directives without a
+    fixed translation (e.g. %z, %c, %U) fall back to strftime. Years below 1000 are padded like the platform's strftime.
+    """
+    __slots__ = ('fmt', '_template', '_getter', '_date_getter')
+
+    def __init__(self, fmt: str):
+        self.fmt = fmt
+        self._template: str | None = None
+        self._getter: Callable[[date], Any] | None = None
+        self._date_getter: Callable[[date], Any] | None = None
+
+        tokens = tokenize_format(fmt)
+        if any(is_directive and text not in _directives for is_directive, text in tokens):
+            return
+        template = []
+        getters = []
+        date_getters = []
+        for is_directive, text in tokens:
+            if not is_directive:
+                template.append(text.replace('%', '%%'))
+                continue
+            conversion, getter = _directives[text]
+            template.append(conversion)
+            getters.append(getter)
+            date_getters.append(_constant(_date_time_values[text]) if text in time_directives else getter)
+        self._template = ''.join(template)
+        self._getter = _tuple_getter(getters)
+        self._date_getter = _tuple_getter(date_getters)
+
+    def __call__(self, value: date) -> str:
+        if self._template is None:
+            return value.strftime(self.fmt)
+        if isinstance(value, datetime):
+            return self._template % self._getter(value)
+        return self._template % self._date_getter(value)
+
+    def __repr__(self) -> str:
+        return f'CompiledFormatter({self.fmt!r})'
+
+
+@lru_cache(maxsize=256)
+def compile_formatter(fmt: str | None = None) -> Callable[[date], str]:
+    """
+    Get the cached renderer for given strftime pattern. If fmt is None, values are rendered with isoformat.
+    """
+    if fmt is None:
+        return methodcaller('isoformat')
+    return CompiledFormatter(fmt)
+
+
+def format_many(values: Iterable[date], fmt: str | None = None, *, out: TextIO | BinaryIO = None,
+                separator: str = '\n', chunk_size: int = 10_000, encoding: str = 'utf-8') -> str | None:
+    """
+    Render all values with the same pattern. Without out, a single string is returned. Otherwise the rendered values
+    are written to the file-like object in chunks of chunk_size values and None is returned.
+    """
+    formatter = compile_formatter(fmt)
+    if out is None:
+        return separator.join(map(formatter, values))
+    binary = isinstance(out, (io.RawIOBase, io.BufferedIOBase))
+    iterator = map(formatter, values)
+    first = True
+    while chunk := list(islice(iterator, chunk_size)):
+        text = separator.join(chunk)
+        if not first:
+            text = separator + text
+        first = False
+        out.write(text.encode(encoding) if binary else text)
+    return None
+
+
+def tokenize_format(fmt: str) -> list[tuple[bool, str]]:
+    """
+    Split a strftime pattern into (is_directive, text) tokens, e.g. [(True, 'Y'), (False, '-'), (True, 'm')].
+    """
+    tokens = []
+    literal = []
+    index = 0
+    length = len(fmt)
+    while index < length:
+        char = fmt[index]
+        if char == '%' and index + 1 < length:
+            directive = fmt[index + 1]
+            index += 2
+            if directive == '%':
+                literal.append('%')
+                continue
+            if literal:
+                tokens.append((False, ''.join(literal)))
+                literal = []
+            tokens.append((True, directive))
+            continue
+        literal.append(char)
+        index += 1
+    if literal:
+        tokens.append((False, ''.join(literal)))
+    return tokens
+
+
+def _constant(value: Any) -> Callable[[date], Any]:
+    return lambda _: value
+
+
+def _tuple_getter(getters: list[str | Callable[[date], Any]]) -> Callable[[date], tuple]:
+    if not getters:
+        return lambda _: ()
+    if all(isinstance(getter, str) for getter in getters):
+        # Single C-level call for pure attribute patterns such as '%Y-%m-%d %H:%M:%S'
+        if len(getters) == 1:
+            name = getters[0]
+            return lambda value: (getattr(value, name),)
+        return attrgetter(*getters)
+    getters = [attrgetter(getter) if isinstance(getter, str) else getter for getter in getters]
+    return lambda value: tuple([getter(value) for getter in getters])
@@ -0,0 +1,45 @@
+from calendar import monthrange
+from functools import lru_cache
+from typing import NamedTuple
+
+from dvrd_pydate.pydate import PyDate, days_in_week
+
+
+class MonthGrid(NamedTuple):
+    year: int
+    month: int
+    # Weekday the weeks start on, 0 (Monday) - 6 (Sunday)
+    week_start: int
+    # Weeks x days, including the days of adjacent months needed to fill the first and last week
+    weeks: tuple[tuple[PyDate, ...], ...]
+    # ISO week number of the Monday in each week
+    week_numbers: tuple[int, ...]
+    # Weeks x days, True if the day is in the requested month
+    in_month: tuple[tuple[bool, ...], ...]
+
+
+@lru_cache(maxsize=256)
+def month_grid(year: int, month: int, week_start: int = 0) -> MonthGrid:
+    """
+    Calendar page for given month. Results are immutable and cached per (year, month, week_start).
+    """
+    if not 0 <= week_start < days_in_week:
+        raise ValueError('week_start must be between 0 (Monday) and 6 (Sunday)')
+    first_ordinal = PyDate(year, month, 1).toordinal()
+    # Ordinal 1 (0001-01-01) is a Monday
+    leading_days = ((first_ordinal - 1) % days_in_week - week_start) % days_in_week
+    days_in_month = monthrange(year, month)[1]
+    week_count = -(-(leading_days + days_in_month) // days_in_week)
+    grid_start = first_ordinal - leading_days
+    monday_index = (days_in_week - week_start) % days_in_week
+    weeks = []
+    week_numbers = []
+    in_month = []
+    for week in range(week_count):
+        week_start_ordinal = grid_start + week * days_in_week
+        days = tuple(PyDate.fromordinal(ordinal) for ordinal in
+                     range(week_start_ordinal, week_start_ordinal + days_in_week))
+        weeks.append(days)
+        week_numbers.append(days[monday_index].isocalendar().week)
+        in_month.append(tuple(day.month == month for day in days))
+    return MonthGrid(year, month, week_start, tuple(weeks), tuple(week_numbers), tuple(in_month))
@@ -0,0 +1,181 @@
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from types import MappingProxyType
+from typing import Iterable, Literal, Mapping, NamedTuple, TypeAlias
+
+from dvrd_pydate.pydate import PyDate
+
+# 'nearest_weekday': Saturday moves to Friday, Sunday to Monday
+# 'next_weekday': weekend days move to the first following weekday that is not a holiday yet
+Substitute: TypeAlias = Literal['nearest_weekday', 'next_weekday'] | None
+
+
+class FixedHoliday(NamedTuple):
+    name: str
+    month: int
+    day: int
+    substitute: Substitute = None
+
+    def date_in(self, year: int) -> PyDate | None:
+        if self.day > monthrange(year, self.month)[1]:
+            return None
+        return PyDate(year, self.month, self.day)
+
+
+class EasterHoliday(NamedTuple):
+    name: str
+    # Days relative to Easter Sunday, e.g. -2 for Good Friday
+    days: int = 0
+    substitute: Substitute = None
+
+    def date_in(self, year: int) -> PyDate:
+        value = easter(year)
+        return value + timedelta(days=self.days) if self.days else value
+
+
+class NthWeekdayHoliday(NamedTuple):
+    name: str
+    month: int
+    # 0 is Monday
+    weekday: int
+    # 1 for the first, 2 for the second, ..., -1 for the last
+    n: int
+    substitute: Substitute = None
+
+    def date_in(self, year: int) -> PyDate | None:
+        days_in_month = monthrange(year, self.month)[1]
+        if self.n > 0:
+            first_weekday = date(year, self.month, 1).weekday()
+            day = 1 + (self.weekday - first_weekday) % 7 + (self.n - 1) * 7
+        else:
+            last_weekday = date(year, self.month, days_in_month).weekday()
+            day = days_in_month - (last_weekday - self.weekday) % 7 + (self.n + 1) * 7
+        if not 1 <= day <= days_in_month:
+            return None
+        return PyDate(year, self.month, day)
+
+
+HolidayRule: TypeAlias = FixedHoliday | EasterHoliday | NthWeekdayHoliday
+
+
+def easter(year: int) -> PyDate:
+    """
+    Easter Sunday in the Gregorian calendar, using the anonymous Gregorian computus (Meeus/Jones/Butcher).
+    """
+    golden = year % 19
+    century, year_of_century = divmod(year, 100)
+    leap_centuries, century_rest = divmod(century, 4)
+    correction = (century - (century + 8) // 25 + 1) // 3
+    epact = (19 * golden + century - leap_centuries - correction + 15) % 30
+    leap_years, year_rest = divmod(year_of_century, 4)
+    weekday_offset = (32 + 2 * century_rest + 2 * leap_years - epact - year_rest) % 7
+    adjustment = (golden + 11 * epact + 22 * weekday_offset) // 451
+    month, day = divmod(epact + weekday_offset - 7 * adjustment + 114, 31)
+    return PyDate(year, month, day + 1)
+
+
+class HolidayCalendar:
+    """
+    Set of holiday rules. The holidays of a year are computed once per calendar and kept on it, so is_holiday is a
+    dict and a set lookup.
+
+    >>> calendar = HolidayCalendar([FixedHoliday('Christmas Day', 12, 25), EasterHoliday('Easter Monday', 1)])
+    >>> calendar.is_holiday(PyDate(2024, 4, 1))
+    True
+    """
+    __slots__ = ('rules', '_days', '_names')
+
+    def __init__(self, rules: Iterable[HolidayRule]):
+        self.rules: tuple[HolidayRule, ...] = tuple(rules)
+        # Year -> holiday dates and year -> read-only mapping of date to name(s), filled by _year
+        self._days: dict[int, frozenset[date]] = {}
+        self._names: dict[int, Mapping[PyDate, str]] = {}
+
+    def holidays(self, year: int) -> Mapping[PyDate, str]:
+        """
+        Read-only mapping of date to holiday name(s) in year, in date order. Substitute days are named
+        '<name> (observed)'.
+        """
+        names = self._names.get(year)
+        if names is None:
+            self._year(year)
+            names = self._names[year]
+        return names
+
+    def is_holiday(self, value: date | str) -> bool:
+        value = _day(value)
+        days = self._days.get(value.year)
+        if days is None:
+            days = self._year(value.year)
+        return value in days
+
+    def holiday_name(self, value: date | str) -> str | None:
+        value = _day(value)
+        return self.holidays(value.year).get(value)
+
+    def between(self, start: date | str, end: date | str) -> list[tuple[PyDate, str]]:
+        """
+        Holidays from start up to (excluding) end, in date order.
+        """
+        start, end = PyDate.from_value(start), PyDate.from_value(end)
+        return [(day, name) for year in range(start.year, end.year + 1)
+                for day, name in self.holidays(year).items() if start <= day < end]
+
+    def __add__(self, other: "HolidayCalendar") -> "HolidayCalendar":
+        return HolidayCalendar(self.rules + other.rules)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, HolidayCalendar):
+            return NotImplemented
+        return self.rules == other.rules
+
+    def __hash__(self) -> int:
+        return hash(self.rules)
+
+    def __repr__(self) -> str:
+        return f'HolidayCalendar({list(self.rules)!r})'
+
+    def _year(self, year: int) -> frozenset[date]:
+        holidays: dict[PyDate, str] = {}
+        # Substitutes can cross a year boundary, e.g. Saturday January 1st observed on Friday December 31st
+        for rules_year in (year - 1, year, year + 1):
+            for value, name in _rule_holidays(self.rules, rules_year):
+                if value.year == year:
+                    _add(holidays, value, name)
+        # Names first, so a thread seeing the days also finds the names
+        self._names.setdefault(year, MappingProxyType(dict(sorted(holidays.items()))))
+        return self._days.setdefault(year, frozenset(holidays))
+
+
+def _rule_holidays(rules: tuple[HolidayRule, ...], year: int) -> tuple[tuple[PyDate, str], ...]:
+    # All holidays produced by the rules for year, including substitutes outside of year
+    holidays: dict[PyDate, str] = {}
+    substitutes: list[tuple[PyDate, str, Substitute]] = []
+    for rule in rules:
+        if (value := rule.date_in(year)) is None:
+            continue
+        _add(holidays, value, rule.name)
+        if rule.substitute is not None and value.weekday() >= 5:
+            substitutes.append((value, rule.name, rule.substitute))
+    # Substitutes are placed after all actual holidays are known, in date order
+    for value, name, substitute in sorted(substitutes, key=lambda item: item[0]):
+        if substitute == 'nearest_weekday':
+            observed = value - timedelta(days=1) if value.weekday() == 5 else value + timedelta(days=1)
+        else:
+            observed = value + timedelta(days=7 - value.weekday())
+            while observed in holidays:
+                observed += timedelta(days=1 if observed.weekday() < 4 else 7 - observed.weekday())
+        _add(holidays, observed, f'{name} (observed)')
+    return tuple(holidays.items())
+
+
+def _add(holidays: dict[PyDate, str], value: PyDate, name: str):
+    existing = holidays.get(value)
+    holidays[value] = name if existing is None else f'{existing}, {name}'
+
+
+def _day(value: date | str) -> date:
+    # Datetimes never equal dates, so lookups use the day of a datetime
+    if isinstance(value, datetime):
+        return date(value.year, value.month, value.day)
+    return value if isinstance(value, date) else PyDate.from_value(value)
@@ -0,0 +1,140 @@
+import sys
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date
+from typing import NamedTuple, Generator, TypeVar
+
+DateType = TypeVar('DateType', bound=date)
+
+
+class InternStats(NamedTuple):
+    size: int
+    maxsize: int
+    hits: int
+    misses: int
+    # Approximate amount of bytes not allocated for duplicate instances
+    saved_bytes: int
+
+
+class InternTable:
+    """
+    Table of canonical PyDate instances, keyed by ordinal. Once the table holds maxsize dates, new dates are no longer
+    added but existing entries are still shared. Tables can be shared by threads: hit/miss counters are kept per thread
+    and summed when read, so interning doesn't write to shared state on hits.
+    """
+
+    def __init__(self, maxsize: int = 65_536):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self._values: dict[int, date] = {}
+        self._local = threading.local()
+        # [hits, misses] of every thread that used the table
+        self._counters: list[list[int]] = []
+        self._counters_lock = threading.Lock()
+
+    @property
+    def hits(self) -> int:
+        return sum(counters[0] for counters in self._all_counters())
+
+    @property
+    def misses(self) -> int:
+        return sum(counters[1] for counters in self._all_counters())
+
+    def intern(self, value: DateType) -> DateType:
+        ordinal = value.toordinal()
+        existing = self._values.get(ordinal)
+        if existing is not None:
+            self._thread_counters()[0] += 1
+            return existing
+        self._thread_counters()[1] += 1
+        if len(self._values) < self.maxsize:
+            # Another thread may have added the same day meanwhile, setdefault keeps a single canonical instance
+            return self._values.setdefault(ordinal, value)
+        return value
+
+    def clear(self):
+        self._values.clear()
+        for counters in self._all_counters():
+            counters[0] = counters[1] = 0
+
+    def stats(self) -> InternStats:
+        instance_size = sys.getsizeof(next(iter(self._values.values()), None)) if self._values else 0
+        hits = self.hits
+        return InternStats(len(self._values), self.maxsize, hits, self.misses, hits * instance_size)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, value: date) -> bool:
+        return value.toordinal() in self._values
+
+    def _thread_counters(self) -> list[int]:
+        try:
+            return self._local.counters
+        except AttributeError:
+            counters = self._local.counters = [0, 0]
+            with self._counters_lock:
+                self._counters.append(counters)
+            return counters
+
+    def _all_counters(self) -> list[list[int]]:
+        with self._counters_lock:
+            return list(self._counters)
+
+
+_global_table: InternTable | None = None
+_scoped_table: ContextVar[InternTable | None] = ContextVar('dvrd_pydate_intern_table', default=None)
+# Amount of interning() contexts open in any thread
+_scope_count = 0
+_state_lock = threading.Lock()
+
+
+def enable_interning(maxsize: int = 65_536) -> InternTable:
+    """
+    Make PyDate construction and arithmetic return a shared instance per day, for all threads.
+    """
+    global _global_table
+    with _state_lock:
+        _global_table = table = InternTable(maxsize)
+        _update_enabled()
+    return table
+
+
+def disable_interning():
+    global _global_table
+    with _state_lock:
+        _global_table = None
+        _update_enabled()
+
+
+@contextmanager
+def interning(maxsize: int = 65_536) -> Generator[InternTable, None, None]:
+    """
+    Intern PyDate instances within the context only, using a fresh table. Takes precedence over enable_interning.
+    """
+    global _scope_count
+    table = InternTable(maxsize)
+    token = _scoped_table.set(table)
+    with _state_lock:
+        _scope_count += 1
+        _update_enabled()
+    try:
+        yield table
+    finally:
+        _scoped_table.reset(token)
+        with _state_lock:
+            _scope_count -= 1
+            _update_enabled()
+
+
+def active_intern_table() -> InternTable | None:
+    table = _scoped_table.get()
+    return _global_table if table is None else table
+
+
+def _update_enabled():
+    # PyDate only looks up the active table while a table exists, keeping construction cheap otherwise
+    from dvrd_pydate.pydate import _set_interning_enabled
+    _set_interning_enabled(_global_table is not None or _scope_count > 0)
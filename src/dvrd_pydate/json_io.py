@@ -0,0 +1,135 @@
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Mapping, TextIO, Iterable
+
+from dvrd_pydate.formatting import compile_formatter
+from dvrd_pydate.pydate import PyDate
+from dvrd_pydate.pydatetime import PyDateTime, LazyPyDateTime
+
+FieldTypes = Mapping[str, type[PyDate] | type[PyDateTime]]
+
+
+class PyDateJSONEncoder(json.JSONEncoder):
+    """
+    JSON encoder rendering date(time)s with a precompiled formatter (isoformat by default). Lazy values are written
+    using their raw string, without parsing them. Dates still reach the encoder through the default hook, the C
+    encoder has no other way to write them, so encoding costs about the same as a default=isoformat hook.
+    """
+
+    def __init__(self, *args, date_format: str = None, datetime_format: str = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # None renders with isoformat, called directly as that is cheaper than through a formatter
+        self._date_formatter = None if date_format is None else compile_formatter(date_format)
+        self._datetime_formatter = None if datetime_format is None else compile_formatter(datetime_format)
+        if date_format is None and datetime_format is None and type(self).default is PyDateJSONEncoder.default:
+            # A plain function is called by the C encoder with less overhead than the bound method
+            self.default = _isoformat_default(super().default)
+
+    def default(self, o: Any) -> Any:
+        # One isinstance check for the common case, datetime before date as it is a subclass
+        if isinstance(o, date):
+            formatter = self._datetime_formatter if isinstance(o, datetime) else self._date_formatter
+            return o.isoformat() if formatter is None else formatter(o)
+        elif isinstance(o, LazyPyDateTime):
+            return o.raw
+        return super().default(o)
+
+
+def dumps(obj: Any, *, date_format: str = None, datetime_format: str = None, **kwargs) -> str:
+    return PyDateJSONEncoder(date_format=date_format, datetime_format=datetime_format, **kwargs).encode(obj)
+
+
+def dump(obj: Any, fp: TextIO, *, date_format: str = None, datetime_format: str = None, chunk_size: int = 1000,
+         **kwargs):
+    """
+    Write obj as JSON to fp. Top-level lists are streamed: elements are encoded (by the C encoder, when available)
+    and written in chunks of chunk_size elements, so the full document is never held in memory at once.
+    """
+    encoder = PyDateJSONEncoder(date_format=date_format, datetime_format=datetime_format, **kwargs)
+    if not isinstance(obj, (list, tuple)) or encoder.indent is not None:
+        fp.write(encoder.encode(obj))
+        return
+    separator = encoder.item_separator
+    fp.write('[')
+    chunk = []
+    first = True
+    for item in obj:
+        chunk.append(encoder.encode(item))
+        if len(chunk) == chunk_size:
+            fp.write(('' if first else separator) + separator.join(chunk))
+            first = False
+            chunk = []
+    if chunk:
+        fp.write(('' if first else separator) + separator.join(chunk))
+    fp.write(']')
+
+
+def loads(s: str | bytes, *, fields: FieldTypes = None, lazy: bool = True, **kwargs) -> Any:
+    """
+    Parse JSON and convert the given date(time) fields.
+    :param fields: mapping of field to PyDate or PyDateTime. A plain key (e.g. 'created') converts that key in every
+    object. A dotted key path (e.g. 'items.*.created', '*' matching every list item or object value) only converts
+    values at that path.
+    :param lazy: convert PyDateTime fields to LazyPyDateTime, deferring parsing until the value is used
+    """
+    if not fields:
+        return json.loads(s, **kwargs)
+    key_fields = {key: _converter(value_type, lazy) for key, value_type in fields.items() if '.' not in key}
+    path_fields = [(key.split('.'), _converter(value_type, lazy)) for key, value_type in fields.items() if '.' in key]
+    if key_fields:
+        kwargs['object_hook'] = _object_hook(key_fields, kwargs.get('object_hook'))
+    result = json.loads(s, **kwargs)
+    for path, converter in path_fields:
+        result = _convert_path(result, path, converter)
+    return result
+
+
+def load(fp: TextIO, *, fields: FieldTypes = None, lazy: bool = True, **kwargs) -> Any:
+    return loads(fp.read(), fields=fields, lazy=lazy, **kwargs)
+
+
+def _isoformat_default(fallback: Callable[[Any], Any]) -> Callable[[Any], Any]:
+    def default(o: Any) -> Any:
+        if isinstance(o, date):
+            return o.isoformat()
+        elif isinstance(o, LazyPyDateTime):
+            return o.raw
+        return fallback(o)
+
+    return default
+
+
+def _converter(value_type: type, lazy: bool):
+    if issubclass(value_type, PyDateTime):
+        return LazyPyDateTime if lazy else PyDateTime.fromisoformat
+    elif issubclass(value_type, PyDate):
+        return PyDate.fromisoformat
+    raise TypeError(f'Unsupported field type {value_type}')
+
+
+def _object_hook(key_fields: dict, object_hook):
+    keys = tuple(key_fields.items())
+
+    def hook(obj: dict) -> Any:
+        for key, converter in keys:
+            if isinstance(value := obj.get(key), str):
+                obj[key] = converter(value)
+        return obj if object_hook is None else object_hook(obj)
+
+    return hook
+
+
+def _convert_path(value: Any, path: list[str], converter) -> Any:
+    if not path:
+        return converter(value) if isinstance(value, str) else value
+    key, rest = path[0], path[1:]
+    if key == '*':
+        items: Iterable = range(len(value)) if isinstance(value, list) else \
+            value.keys() if isinstance(value, dict) else ()
+        for item in items:
+            value[item] = _convert_path(value[item], rest, converter)
+    elif isinstance(value, dict) and key in value:
+        value[key] = _convert_path(value[key], rest, converter)
+    elif isinstance(value, list) and key.isdigit() and int(key) < len(value):
+        value[int(key)] = _convert_path(value[int(key)], rest, converter)
+    return value
@@ -0,0 +1,240 @@
+from datetime import date, datetime, timedelta
+from operator import methodcaller
+from typing import Callable, Iterable, Generator, Literal, TypeAlias
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydate import PyDate, CommonArg, months_in_year
+from dvrd_pydate.pydatetime import PyDateTime, _determine_key_and_value
+
+Action: TypeAlias = Literal['add', 'set', 'start_of', 'end_of', 'add_business_days', 'next_weekday',
+                            'previous_weekday']
+Step: TypeAlias = tuple[Action, DatePart | TimePart, int | float | None]
+
+fixed_deltas: dict[DatePart | TimePart, timedelta] = {
+    DatePart.WEEK: timedelta(weeks=1),
+    DatePart.WEEKS: timedelta(weeks=1),
+    DatePart.DAY: timedelta(days=1),
+    DatePart.DAYS: timedelta(days=1),
+    TimePart.HOUR: timedelta(hours=1),
+    TimePart.HOURS: timedelta(hours=1),
+    TimePart.MINUTE: timedelta(minutes=1),
+    TimePart.MINUTES: timedelta(minutes=1),
+    TimePart.SECOND: timedelta(seconds=1),
+    TimePart.SECONDS: timedelta(seconds=1),
+    TimePart.MICROSECOND: timedelta(microseconds=1),
+    TimePart.MICROSECONDS: timedelta(microseconds=1),
+}
+
+# Part -> (add function name, multiplier)
+calendar_adders: dict[DatePart, tuple[str, int]] = {
+    DatePart.MONTH: ('add_months', 1),
+    DatePart.MONTHS: ('add_months', 1),
+    DatePart.QUARTER: ('add_quarters', 1),
+    DatePart.QUARTERS: ('add_quarters', 1),
+    DatePart.FISCAL_QUARTER: ('add_quarters', 1),
+    DatePart.FISCAL_QUARTERS: ('add_quarters', 1),
+    DatePart.YEAR: ('add_years', 1),
+    DatePart.YEARS: ('add_years', 1),
+    DatePart.FISCAL_YEAR: ('add_months', months_in_year),
+    DatePart.FISCAL_YEARS: ('add_months', months_in_year),
+    DatePart.ISO_YEAR: ('add_iso_years', 1),
+    DatePart.ISO_YEARS: ('add_iso_years', 1),
+}
+
+setters: dict[DatePart | TimePart, str] = {
+    DatePart.DAY: 'set_day',
+    DatePart.DAYS: 'set_day',
+    DatePart.MONTH: 'set_month',
+    DatePart.MONTHS: 'set_month',
+    DatePart.YEAR: 'set_year',
+    DatePart.YEARS: 'set_year',
+    TimePart.HOUR: 'set_hour',
+    TimePart.HOURS: 'set_hour',
+    TimePart.MINUTE: 'set_minute',
+    TimePart.MINUTES: 'set_minute',
+    TimePart.SECOND: 'set_second',
+    TimePart.SECONDS: 'set_second',
+    TimePart.MICROSECOND: 'set_microsecond',
+    TimePart.MICROSECONDS: 'set_microsecond',
+}
+
+
+class Offset:
+    """
+    Immutable, reusable chain of add/subtract/set/start_of/end_of steps. Arguments are parsed and validated once when
+    the offset is built; consecutive fixed-length steps (weeks, days and time parts) are merged into a single
+    timedelta.
+
+    >>> offset = Offset().add(1, DatePart.MONTH).start_of(DatePart.WEEK).set(DatePart.DAY, 1)
+    >>> offset(PyDate(2024, 1, 15))
+    PyDate(2024, 2, 1)
+    """
+    __slots__ = ('_steps', '_operations', '_uses_time')
+
+    def __init__(self, steps: Iterable[Step] = ()):
+        self._steps: tuple[Step, ...] = tuple(steps)
+        self._operations = _compile(self._steps)
+        self._uses_time = any(isinstance(key, TimePart) for action, key, value in self._steps
+                              if action in ('add', 'set'))
+
+    @property
+    def steps(self) -> tuple[Step, ...]:
+        return self._steps
+
+    def add(self, value_or_key: CommonArg, key_or_value: CommonArg) -> "Offset":
+        key, value = _determine_key_and_value(value_or_key, key_or_value)
+        return self._with_step(('add', key, value))
+
+    def subtract(self, value_or_key: CommonArg, key_or_value: CommonArg) -> "Offset":
+        key, value = _determine_key_and_value(value_or_key, key_or_value)
+        return self._with_step(('add', key, -value))
+
+    def set(self, value_or_key: CommonArg, key_or_value: CommonArg) -> "Offset":
+        key, value = _determine_key_and_value(value_or_key, key_or_value)
+        return self._with_step(('set', key, value))
+
+    def add_business_days(self, days: int) -> "Offset":
+        """
+        Move days weekdays (Monday-Friday) forward, or backward if days is negative. Weekend values are first moved to
+        the adjacent business day in the direction of travel.
+        """
+        return self._with_step(('add_business_days', DatePart.DAYS, int(days)))
+
+    def next_weekday(self, weekday: int) -> "Offset":
+        """
+        Move to the first given weekday (0 is Monday) after the value, a week ahead if the value is on that weekday.
+        """
+        return self._with_step(('next_weekday', DatePart.DAY, _validate_weekday(weekday)))
+
+    def previous_weekday(self, weekday: int) -> "Offset":
+        return self._with_step(('previous_weekday', DatePart.DAY, _validate_weekday(weekday)))
+
+    def start_of(self, part: DatePart | TimePart) -> "Offset":
+        return self._with_step(('start_of', _validate_part(part), None))
+
+    def end_of(self, part: DatePart | TimePart) -> "Offset":
+        return self._with_step(('end_of', _validate_part(part), None))
+
+    def then(self, other: "Offset") -> "Offset":
+        return Offset(self._steps + other.steps)
+
+    __add__ = then
+
+    def __call__(self, value: date | str) -> PyDate:
+        if isinstance(value, datetime):
+            if not isinstance(value, PyDateTime):
+                value = PyDateTime.from_value(value)
+        elif isinstance(value, date):
+            if self._uses_time:
+                raise TypeError('TimePart cannot be used in PyDate')
+            if not isinstance(value, PyDate):
+                value = PyDate.from_value(value)
+        elif self._uses_time or (isinstance(value, str) and len(value) > 10):
+            value = PyDateTime.from_value(value)
+        else:
+            value = PyDate.from_value(value)
+        for operation in self._operations:
+            value = operation(value)
+        return value
+
+    def map(self, values: Iterable[date | str]) -> Generator[PyDate, None, None]:
+        for value in values:
+            yield self(value)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Offset):
+            return NotImplemented
+        return self._steps == other.steps
+
+    def __hash__(self) -> int:
+        return hash(self._steps)
+
+    def __repr__(self) -> str:
+        return f'Offset({list(self._steps)!r})'
+
+    def _with_step(self, step: Step) -> "Offset":
+        return Offset(self._steps + (step,))
+
+
+def _validate_part(part: DatePart | TimePart | str) -> DatePart | TimePart:
+    if isinstance(part, str):
+        part = DatePart.get_item(part) or TimePart.get_item(part)
+    if not isinstance(part, (DatePart, TimePart)):
+        raise KeyError(f'Unsupported part {part}')
+    return part
+
+
+def _validate_weekday(weekday: int) -> int:
+    if not 0 <= weekday <= 6:
+        raise ValueError('Weekday must be between 0 (Monday) and 6 (Sunday)')
+    return weekday
+
+
+def _compile(steps: tuple[Step, ...]) -> tuple[Callable[[PyDate], PyDate], ...]:
+    operations = []
+    pending_delta = None
+    for action, key, value in steps:
+        if action == 'add' and key in fixed_deltas:
+            delta = fixed_deltas[key] * value
+            pending_delta = delta if pending_delta is None else pending_delta + delta
+            continue
+        if pending_delta is not None:
+            operations.append(_delta_operation(pending_delta))
+            pending_delta = None
+        if action == 'add':
+            if key not in calendar_adders:
+                raise KeyError(f'Unsupported add part {key}')
+            function_name, multiplier = calendar_adders[key]
+            operations.append(methodcaller(function_name, value * multiplier))
+        elif action == 'add_business_days':
+            operations.append(_business_days_operation(value))
+        elif action in ('next_weekday', 'previous_weekday'):
+            operations.append(_weekday_operation(value, action == 'next_weekday'))
+        elif action == 'set':
+            if key not in setters:
+                raise KeyError(f'Unsupported set part {key}')
+            operations.append(methodcaller(setters[key], value))
+        else:
+            operations.append(methodcaller(action, key))
+    if pending_delta is not None:
+        operations.append(_delta_operation(pending_delta))
+    return tuple(operations)
+
+
+def _delta_operation(delta: timedelta) -> Callable[[PyDate], PyDate]:
+    return lambda value: value + delta
+
+
+def _business_days_operation(days: int) -> Callable[[PyDate], PyDate]:
+    return lambda value: value + timedelta(days=_business_days_delta(value.weekday(), days))
+
+
+def _business_days_delta(weekday: int, days: int) -> int:
+    if days == 0:
+        return 0
+    delta = 0
+    if days > 0:
+        if weekday >= 5:
+            # Continue from the preceding Friday
+            delta = 4 - weekday
+            weekday = 4
+        weeks, rest = divmod(days, 5)
+        delta += weeks * 7 + rest
+        if weekday + rest >= 5:
+            delta += 2
+    else:
+        if weekday >= 5:
+            # Continue from the following Monday
+            delta = 7 - weekday
+            weekday = 0
+        weeks, rest = divmod(-days, 5)
+        delta -= weeks * 7 + rest
+        if weekday - rest < 0:
+            delta -= 2
+    return delta
+
+
+def _weekday_operation(weekday: int, forward: bool) -> Callable[[PyDate], PyDate]:
+    if forward:
+        return lambda value: value + timedelta(days=(weekday - value.weekday() - 1) % 7 + 1)
+    return lambda value: value - timedelta(days=(value.weekday() - weekday - 1) % 7 + 1)
@@ -0,0 +1,192 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, datetime, MAXYEAR
+from typing import Generator, NamedTuple, TYPE_CHECKING
+
+from dvrd_pydate.enums import DatePart
+
+if TYPE_CHECKING:
+    from dvrd_pydate.pydate import PyDate
+
+quarters_in_year = 4
+months_in_quarter = 3
+
+quarter_parts = frozenset({DatePart.QUARTER, DatePart.QUARTERS})
+iso_year_parts = frozenset({DatePart.ISO_YEAR, DatePart.ISO_YEARS})
+fiscal_year_parts = frozenset({DatePart.FISCAL_YEAR, DatePart.FISCAL_YEARS})
+fiscal_quarter_parts = frozenset({DatePart.FISCAL_QUARTER, DatePart.FISCAL_QUARTERS})
+period_parts = quarter_parts | iso_year_parts | fiscal_year_parts | fiscal_quarter_parts
+
+# Ordinal following date.max, used as end of the periods running past year 9999
+_end_ordinal = date.max.toordinal() + 1
+
+# Start month of fiscal years used by the fiscal date parts, set per thread/task by FiscalCalendar.activate
+_fiscal_year_start_month: ContextVar[int] = ContextVar('dvrd_pydate_fiscal_year_start_month', default=1)
+
+
+class YearTable(NamedTuple):
+    # Ordinals of the first day of Q1-Q4 and of the next year's Q1
+    quarter_starts: tuple[int, int, int, int, int]
+    # Ordinal of the Monday of ISO week 1
+    iso_year_start: int
+
+
+class Period(NamedTuple):
+    # Ordinal of the first day of the period
+    start: int
+    # Ordinal of the first day of the next period
+    end: int
+    # Sequential number of the period, usable as sort/group key
+    index: int
+
+
+# Caches shared by all threads. Entries are computed without locking and added with setdefault, so concurrent threads
+# computing the same entry all end up using the first one stored.
+_year_tables: dict[int, YearTable] = {}
+_fiscal_tables: dict[tuple[int, int], tuple[int, int, int, int, int]] = {}
+
+
+class FiscalCalendar:
+    """
+    Fiscal years starting in start_month (1-12), numbered by the calendar year they start in. Query a calendar
+    directly, or activate it so DatePart.FISCAL_YEAR and DatePart.FISCAL_QUARTER use it in all PyDate methods within
+    the context. Outside of an active calendar, fiscal years start in January.
+
+    >>> calendar = FiscalCalendar(10)
+    >>> calendar.fiscal_year(date(2024, 5, 15)), calendar.fiscal_quarter(date(2024, 5, 15))
+    (2023, 3)
+    """
+    __slots__ = ('start_month',)
+
+    def __init__(self, start_month: int = 1):
+        if not 1 <= start_month <= 12:
+            raise ValueError('Fiscal year start month must be between 1 and 12')
+        self.start_month = start_month
+
+    def period_of(self, value: date, part: DatePart = DatePart.FISCAL_YEAR) -> Period:
+        return period_of(part, value, self.start_month)
+
+    def fiscal_year(self, value: date) -> int:
+        return period_of(DatePart.FISCAL_YEAR, value, self.start_month).index
+
+    def fiscal_quarter(self, value: date) -> int:
+        """
+        Quarter (1-4) of the fiscal year value is in.
+        """
+        return period_of(DatePart.FISCAL_QUARTER, value, self.start_month).index % quarters_in_year + 1
+
+    def start_of(self, value: "PyDate", part: DatePart = DatePart.FISCAL_YEAR) -> "PyDate":
+        with self.activate():
+            return value.start_of(part)
+
+    def end_of(self, value: "PyDate", part: DatePart = DatePart.FISCAL_YEAR) -> "PyDate":
+        with self.activate():
+            return value.end_of(part)
+
+    @contextmanager
+    def activate(self) -> Generator["FiscalCalendar", None, None]:
+        """
+        Use this calendar for the fiscal date parts within the context. The setting is local to the current thread or
+        asyncio task, so callers with different fiscal calendars don't affect each other.
+        """
+        token = _fiscal_year_start_month.set(self.start_month)
+        try:
+            yield self
+        finally:
+            _fiscal_year_start_month.reset(token)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, FiscalCalendar):
+            return NotImplemented
+        return self.start_month == other.start_month
+
+    def __hash__(self) -> int:
+        return hash(self.start_month)
+
+    def __repr__(self) -> str:
+        return f'FiscalCalendar({self.start_month})'
+
+
+def year_table(year: int) -> YearTable:
+    table = _year_tables.get(year)
+    if table is None:
+        quarter_starts = tuple(_month_start(year, month) for month in (1, 4, 7, 10, 13))
+        table = _year_tables.setdefault(year, YearTable(quarter_starts, _iso_year_start(year)))
+    return table
+
+
+def fiscal_table(fiscal_year: int, start_month: int = None) -> tuple[int, int, int, int, int]:
+    if start_month is None:
+        start_month = _fiscal_year_start_month.get()
+    key = (fiscal_year, start_month)
+    table = _fiscal_tables.get(key)
+    if table is None:
+        month_index = fiscal_year * 12 + start_month - 1
+        table = tuple(_month_index_start(month_index + quarter * months_in_quarter)
+                      for quarter in range(quarters_in_year + 1))
+        table = _fiscal_tables.setdefault(key, table)
+    return table
+
+
+def period_of(part: DatePart, value: date, fiscal_start_month: int = None) -> Period:
+    """
+    :param fiscal_start_month: start month of fiscal years, the active FiscalCalendar's if omitted
+    """
+    ordinal = value.toordinal()
+    year = value.year
+    if part in quarter_parts:
+        quarter = (value.month - 1) // months_in_quarter
+        starts = year_table(year).quarter_starts
+        return Period(starts[quarter], starts[quarter + 1], year * quarters_in_year + quarter)
+    elif part in iso_year_parts:
+        if ordinal < year_table(year).iso_year_start:
+            year -= 1
+        elif year < MAXYEAR and ordinal >= year_table(year + 1).iso_year_start:
+            year += 1
+        end = year_table(year + 1).iso_year_start if year < MAXYEAR else _end_ordinal
+        return Period(year_table(year).iso_year_start, end, year)
+    elif part in fiscal_year_parts or part in fiscal_quarter_parts:
+        start_month = _fiscal_year_start_month.get() if fiscal_start_month is None else fiscal_start_month
+        months_since_start = value.month - start_month
+        if months_since_start < 0:
+            year -= 1
+            months_since_start += 12
+        starts = fiscal_table(year, start_month)
+        if part in fiscal_year_parts:
+            return Period(starts[0], starts[quarters_in_year], year)
+        quarter = months_since_start // months_in_quarter
+        return Period(starts[quarter], starts[quarter + 1], year * quarters_in_year + quarter)
+    raise KeyError(f'Unsupported period part {part}')
+
+
+def period_position(part: DatePart, value: date) -> float:
+    """
+    Period index plus the elapsed fraction of the period, used to compute diffs in periods of unequal length.
+    """
+    period = period_of(part, value)
+    day_position = value.toordinal()
+    if isinstance(value, datetime):
+        day_position += (value.hour * 3600 + value.minute * 60 + value.second + value.microsecond / 1_000_000) / 86400
+    return period.index + (day_position - period.start) / (period.end - period.start)
+
+
+def iso_weeks_in_year(iso_year: int) -> int:
+    return (_iso_year_start(iso_year + 1) - year_table(iso_year).iso_year_start) // 7
+
+
+def _iso_year_start(year: int) -> int:
+    # Ordinal of the Monday of ISO week 1. Ordinal 1 (0001-01-01) is a Monday
+    january_4th = date(year, 1, 4).toordinal() if year <= MAXYEAR else _end_ordinal + 3
+    return january_4th - (january_4th - 1) % 7
+
+
+def _month_start(year: int, month: int) -> int:
+    # Month 13 is the start of the next year, capped at the ordinal following date.max
+    if month == 13:
+        return date(year + 1, 1, 1).toordinal() if year < MAXYEAR else _end_ordinal
+    return date(year, month, 1).toordinal()
+
+
+def _month_index_start(month_index: int) -> int:
+    year, month = divmod(month_index, 12)
+    return _month_start(year, month + 1) if year <= MAXYEAR else _end_ordinal
@@ -1,17 +1,37 @@
 import math
 from calendar import monthrange
-from datetime import date, timedelta, datetime, tzinfo
-from typing import Self, Generator, TypeAlias, Literal, Any, TYPE_CHECKING
+from datetime import date, timedelta, datetime, tzinfo, timezone
+from typing import Self, Generator, TypeAlias, Literal, Any, TYPE_CHECKING, Iterable
 
 from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.formatting import compile_formatter, format_many
+from dvrd_pydate.interning import active_intern_table
+from dvrd_pydate.periods import period_parts, period_of, period_position, iso_weeks_in_year, year_table, \
+    months_in_quarter
 
 if TYPE_CHECKING:
+    from dvrd_pydate.duration import Duration
+    from dvrd_pydate.grid import MonthGrid
     from pydantic_core import CoreSchema, GetCoreSchemaHandler
 
 days_in_week = 7
 months_in_year = 12
 
 CommonArg: TypeAlias = int | float | str | DatePart | TimePart
+EpochUnit: TypeAlias = Literal['s', 'ms', 'us', 'ns']
+
+# Ordinal of 1970-01-01
+epoch_ordinal = 719163
+microseconds_in_day = 86_400_000_000
+# Unit -> (multiplier, divisor) to convert a value in that unit to microseconds
+epoch_units: dict[str, tuple[int, int]] = {
+    's': (1_000_000, 1),
+    'ms': (1000, 1),
+    'us': (1, 1),
+    'ns': (1, 1000),
+}
+# Set by dvrd_pydate.interning while a global or scoped intern table exists
+_interning_enabled = False
 
 
 class PyDate(date):
@@ -19,20 +39,61 @@ class PyDate(date):
     def from_value(value: date | str | int | float = None) -> "PyDate":
         return PyDate(value)
 
+    @staticmethod
+    def from_epoch(value: int | float, unit: EpochUnit = 's', tz: tzinfo | None = timezone.utc) -> "PyDate":
+        """
+        Get the date of an epoch timestamp in the given timezone, without consulting the local timezone.
+        :param value: amount of units since 1970-01-01 00:00 UTC
+        :param unit: 's', 'ms', 'us' or 'ns'
+        :param tz: timezone to determine the date in. None and UTC are the fastest
+        :return: new PyDate
+        """
+        microseconds = _epoch_to_microseconds(value, unit)
+        if tz is None or tz is timezone.utc:
+            return PyDate.fromordinal(microseconds // microseconds_in_day + epoch_ordinal)
+        from dvrd_pydate.pydatetime import PyDateTime
+        return PyDateTime.from_epoch(microseconds, 'us', tz).py_date()
+
+    @staticmethod
+    def from_epoch_many(values: Iterable[int | float], unit: EpochUnit = 's',
+                        tz: tzinfo | None = timezone.utc) -> list["PyDate"]:
+        if tz is None or tz is timezone.utc:
+            multiplier, divisor = _epoch_unit(unit)
+            day_size = microseconds_in_day * divisor
+            fromordinal = PyDate.fromordinal
+            return [fromordinal(_round_microseconds(value * multiplier) // day_size + epoch_ordinal)
+                    for value in values]
+        return [PyDate.from_epoch(value, unit, tz) for value in values]
+
+    @staticmethod
+    def month_grid(year: int, month: int, week_start: int = 0) -> "MonthGrid":
+        """
+        Weeks x days calendar page for given month, see dvrd_pydate.grid.MonthGrid.
+        :param week_start: weekday the weeks start on, 0 (Monday) - 6 (Sunday)
+        """
+        from dvrd_pydate.grid import month_grid
+        return month_grid(year, month, week_start)
+
     @staticmethod
     def parse_date(*, value: str, fmt: str) -> "PyDate":
         parsed = datetime.strptime(value, fmt)
         return PyDate(parsed.year, parsed.month, parsed.day)
 
+    compile_formatter = staticmethod(compile_formatter)
+    format_many = staticmethod(format_many)
+
     @staticmethod
     def iter(*, start: date | str = None, end: date | str | None = None,
-             step: DatePart | TimePart | tuple[int | float, DatePart | TimePart] = DatePart.DAY,
+             step: "DatePart | TimePart | tuple[int | float, DatePart | TimePart] | Duration" = DatePart.DAY,
              max_steps: int = None) -> \
             Generator["PyDate", None, None]:
+        from dvrd_pydate.duration import Duration
         if max_steps == 0:
             # Raises StopIteration
             return
-        if isinstance(step, TimePart):
+        if isinstance(step, Duration):
+            step_value, step_key = step, None
+        elif isinstance(step, TimePart):
             raise KeyError('Cannot use time parts in PyDate')
         elif isinstance(step, tuple):
             if isinstance((step_key := step[1]), TimePart):
@@ -52,7 +113,7 @@ class PyDate(date):
             current_step += 1
             if max_steps is not None and current_step == max_steps:
                 break
-            current = current.add(step_value, step_key)
+            current = step_value.apply(current) if step_key is None else current.add(step_value, step_key)
 
     def __new__(cls, *args, **kwargs):
         if len(args) == 1:
@@ -62,17 +123,33 @@ class PyDate(date):
             if isinstance(arg, str):
                 return PyDate.fromisoformat(args[0])
             elif isinstance(arg, date):
-                return date.__new__(cls, arg.year, arg.month, arg.day)
+                value = date.__new__(cls, arg.year, arg.month, arg.day)
             elif isinstance(arg, (int, float)):
                 return PyDate.fromtimestamp(arg)
             elif isinstance(arg, tuple):
                 if len(arg) < 3:
                     arg = (*arg, *([1] * (3 - len(arg))))
-                return date.__new__(cls, *arg)
-        if not args and not kwargs:
+                value = date.__new__(cls, *arg)
+            else:
+                from dvrd_pydate.pydatetime import LazyPyDateTime
+                if isinstance(arg, LazyPyDateTime):
+                    arg = arg.resolve()
+                    value = date.__new__(cls, arg.year, arg.month, arg.day)
+                else:
+                    value = date.__new__(cls, *args, **kwargs)
+        elif not args and not kwargs:
             now = date.today()
-            return date.__new__(cls, now.year, now.month, now.day)
-        return date.__new__(cls, *args, **kwargs)
+            value = date.__new__(cls, now.year, now.month, now.day)
+        else:
+            value = date.__new__(cls, *args, **kwargs)
+        # Interning is opt-in, when it is off construction only pays for this check
+        return _intern(cls, value) if _interning_enabled else value
+
+    def replace(self, year: int = None, month: int = None, day: int = None) -> Self:
+        # date.replace doesn't construct through __new__, intern the result here
+        value = date.replace(self, self.year if year is None else year, self.month if month is None else month,
+                             self.day if day is None else day)
+        return _intern(type(self), value) if _interning_enabled else value
 
     @property
     def max_day(self) -> int:
@@ -95,6 +172,12 @@ class PyDate(date):
         match key:
             case DatePart.YEARS | DatePart.YEAR:
                 return self.add_years(value)
+            case DatePart.ISO_YEAR | DatePart.ISO_YEARS:
+                return self.add_iso_years(value)
+            case DatePart.FISCAL_YEAR | DatePart.FISCAL_YEARS:
+                return self.add_months(value * months_in_year)
+            case DatePart.QUARTER | DatePart.QUARTERS | DatePart.FISCAL_QUARTER | DatePart.FISCAL_QUARTERS:
+                return self.add_quarters(value)
             case DatePart.MONTH | DatePart.MONTHS:
                 return self.add_months(value)
             case DatePart.WEEK | DatePart.WEEKS:
@@ -109,6 +192,12 @@ class PyDate(date):
         match key:
             case DatePart.YEARS | DatePart.YEAR:
                 return self.subtract_years(value)
+            case DatePart.ISO_YEAR | DatePart.ISO_YEARS:
+                return self.subtract_iso_years(value)
+            case DatePart.FISCAL_YEAR | DatePart.FISCAL_YEARS:
+                return self.subtract_months(value * months_in_year)
+            case DatePart.QUARTER | DatePart.QUARTERS | DatePart.FISCAL_QUARTER | DatePart.FISCAL_QUARTERS:
+                return self.subtract_quarters(value)
             case DatePart.MONTH | DatePart.MONTHS:
                 return self.subtract_months(value)
             case DatePart.WEEK | DatePart.WEEKS:
@@ -137,6 +226,21 @@ class PyDate(date):
     def subtract_year(self) -> Self:
         return self.subtract_years(1)
 
+    def add_iso_years(self, value: int) -> Self:
+        """
+        Move to the same ISO week and weekday in another ISO year. Week 53 becomes week 52 in years without week 53.
+        :param value: amount of ISO years to add
+        :return: new PyDate
+        """
+        iso_year, week, weekday = self.isocalendar()
+        target_year = iso_year + value
+        week = min(week, iso_weeks_in_year(target_year))
+        ordinal = year_table(target_year).iso_year_start + (week - 1) * days_in_week + weekday - 1
+        return self + timedelta(days=ordinal - self.toordinal())
+
+    def subtract_iso_years(self, value: int) -> Self:
+        return self.add_iso_years(-value)
+
     def set_month(self, month: int) -> Self:
         """
         Set the month
@@ -177,6 +281,22 @@ class PyDate(date):
     def subtract_month(self) -> Self:
         return self.subtract_months(1)
 
+    def add_quarters(self, value: int) -> Self:
+        if value < 0:
+            return self.subtract_quarters(-value)
+        return self.add_months(value * months_in_quarter)
+
+    def add_quarter(self) -> Self:
+        return self.add_quarters(1)
+
+    def subtract_quarters(self, value: int) -> Self:
+        if value < 0:
+            return self.add_quarters(-value)
+        return self.subtract_months(value * months_in_quarter)
+
+    def subtract_quarter(self) -> Self:
+        return self.subtract_quarters(1)
+
     def add_weeks(self, value: int) -> Self:
         if value < 0:
             return self.subtract_weeks(-value)
@@ -229,6 +349,8 @@ class PyDate(date):
             return self.subtract_days(current_weekday)
         elif part in [DatePart.DAY, DatePart.DAYS]:
             return self
+        elif part in period_parts:
+            return self.fromordinal(period_of(part, self).start)
         else:
             raise KeyError(f'Unsupported start_of part {part}')
 
@@ -246,9 +368,32 @@ class PyDate(date):
             # return self.replace(day=self.day + 6 - current_day)
         elif part in [DatePart.DAY, DatePart.DAYS]:
             return self
+        elif part in period_parts:
+            return self.fromordinal(period_of(part, self).end - 1)
         else:
             raise KeyError(f'Unsupported end_of part {part}')
 
+    def granularity_key(self, granularity: DatePart | TimePart = DatePart.DAY) -> int:
+        """
+        Integer key of the granularity bucket this date is in. Two dates have the same key when is_same returns True for
+        the granularity, and keys sort in the same order as the buckets.
+        """
+        if isinstance(granularity, TimePart):
+            raise KeyError('Time part cannot be used in PyDate')
+        if granularity in [DatePart.DAY, DatePart.DAYS]:
+            return self.toordinal()
+        elif granularity in [DatePart.WEEK, DatePart.WEEKS]:
+            # Ordinal 1 (0001-01-01) is a Monday
+            return (self.toordinal() - 1) // days_in_week
+        elif granularity in [DatePart.MONTH, DatePart.MONTHS]:
+            return self.year * months_in_year + self.month - 1
+        elif granularity in [DatePart.YEAR, DatePart.YEARS]:
+            return self.year
+        elif granularity in period_parts:
+            return period_of(granularity, self).index
+        else:
+            raise KeyError(f'Unsupported granularity {granularity}')
+
     def is_before(self, other: date | str, granularity: DatePart | TimePart = DatePart.DAY) -> bool:
         if not isinstance(other, PyDate):
             other = PyDate.from_value(other)
@@ -295,7 +440,9 @@ class PyDate(date):
         return True
 
     def diff(self, other: date, *, granularity: DatePart = DatePart.DAYS) -> float:
-        other = PyDate(other)
+        other = type(self)(other)
+        if granularity in period_parts:
+            return period_position(granularity, self) - period_position(granularity, other)
         diff_seconds = (self - other).total_seconds()
         if granularity in (DatePart.DAY, DatePart.DAYS):
             return diff_seconds / 86400
@@ -314,6 +461,12 @@ class PyDate(date):
             return math.floor(diff)
         return math.ceil(diff)
 
+    def to_epoch(self, unit: EpochUnit = 's') -> int:
+        """
+        Amount of whole units between 1970-01-01 00:00 UTC and the start of this date in UTC.
+        """
+        return _microseconds_to_epoch((self.toordinal() - epoch_ordinal) * microseconds_in_day, unit)
+
     def py_datetime(self, *, hour: int = 0, minute: int = 0, second: int = 0, microsecond: int = 0,
                     zone_info: tzinfo = None):
         from dvrd_pydate.pydatetime import PyDateTime
@@ -374,6 +527,38 @@ def _determine_key_and_value(arg1: CommonArg, arg2: CommonArg) -> tuple[DatePart
     return key, value
 
 
+def _intern(cls: type, value: PyDate) -> PyDate:
+    if cls is PyDate and (table := active_intern_table()) is not None:
+        return table.intern(value)
+    return value
+
+
+def _set_interning_enabled(enabled: bool):
+    # Called by dvrd_pydate.interning when the first table is activated or the last one deactivated
+    global _interning_enabled
+    _interning_enabled = enabled
+
+
+def _epoch_unit(unit: str) -> tuple[int, int]:
+    if unit not in epoch_units:
+        raise ValueError(f'Unsupported epoch unit {unit}')
+    return epoch_units[unit]
+
+
+def _round_microseconds(value: int | float) -> int:
+    return value if isinstance(value, int) else round(value)
+
+
+def _epoch_to_microseconds(value: int | float, unit: str) -> int:
+    multiplier, divisor = _epoch_unit(unit)
+    return _round_microseconds(value * multiplier) // divisor
+
+
+def _microseconds_to_epoch(value: int, unit: str) -> int:
+    multiplier, divisor = _epoch_unit(unit)
+    return value * divisor // multiplier
+
+
 def _number_or_date_part(arg: CommonArg) -> int | float | DatePart | TimePart:
     if isinstance(arg, str):
         return DatePart.get_item(arg)
@@ -1,15 +1,45 @@
 import math
-from datetime import datetime, timedelta, date
-from typing import Self, Generator, Literal
+from datetime import datetime, timedelta, date, tzinfo, timezone
+from typing import Self, Generator, Literal, Iterable, Callable, TYPE_CHECKING
 
 from dvrd_pydate.enums import DatePart, TimePart
-from dvrd_pydate.pydate import PyDate, CommonArg
+from dvrd_pydate.pydate import PyDate, CommonArg, months_in_year, EpochUnit, epoch_ordinal, microseconds_in_day, \
+    _epoch_unit, _epoch_to_microseconds, _microseconds_to_epoch, _round_microseconds
+
+if TYPE_CHECKING:
+    from dvrd_pydate.duration import Duration
 
 hours_in_day = 24
 minutes_in_hour = 60
 seconds_in_minute = 60
 microseconds_in_second = 1000
 
+step_microseconds = {
+    DatePart.WEEK: 7 * microseconds_in_day,
+    DatePart.WEEKS: 7 * microseconds_in_day,
+    DatePart.DAY: microseconds_in_day,
+    DatePart.DAYS: microseconds_in_day,
+    TimePart.HOUR: 3_600_000_000,
+    TimePart.HOURS: 3_600_000_000,
+    TimePart.MINUTE: 60_000_000,
+    TimePart.MINUTES: 60_000_000,
+    TimePart.SECOND: 1_000_000,
+    TimePart.SECONDS: 1_000_000,
+    TimePart.MICROSECOND: 1,
+    TimePart.MICROSECONDS: 1,
+}
+step_months = {
+    DatePart.MONTH: 1,
+    DatePart.MONTHS: 1,
+    DatePart.QUARTER: 3,
+    DatePart.QUARTERS: 3,
+    DatePart.YEAR: 12,
+    DatePart.YEARS: 12,
+}
+
+RoundMethod = Literal['floor', 'ceil', 'round']
+StepArg = DatePart | TimePart | tuple[int | float, DatePart | TimePart]
+
 
 class PyDateTime(datetime, PyDate):
     def __new__(cls, *args, **kwargs):
@@ -17,6 +47,8 @@ class PyDateTime(datetime, PyDate):
             arg = args[0]
             if arg is None:
                 return PyDateTime.now()
+            if isinstance(arg, LazyPyDateTime):
+                arg = arg.resolve()
             if isinstance(arg, str):
                 return PyDateTime.fromisoformat(arg)
             elif isinstance(arg, datetime):
@@ -45,11 +77,30 @@ class PyDateTime(datetime, PyDate):
     def from_value(value: datetime | date | str | int | float = None) -> "PyDateTime":
         return PyDateTime(value)
 
+    @staticmethod
+    def from_epoch(value: int | float, unit: EpochUnit = 's', tz: tzinfo | None = timezone.utc) -> "PyDateTime":
+        """
+        Construct from an epoch timestamp using integer arithmetic only, without consulting the local timezone.
+        :param value: amount of units since 1970-01-01 00:00 UTC
+        :param unit: 's', 'ms', 'us' or 'ns'. Integer nanoseconds are floored to whole microseconds, float values
+        are rounded to the nearest microsecond (like fromtimestamp) to absorb float representation errors
+        :param tz: timezone of the result. If None, a naive datetime in UTC is returned
+        :return: new PyDateTime
+        """
+        return _from_epoch_microseconds(_epoch_to_microseconds(value, unit), tz)
+
+    @staticmethod
+    def from_epoch_many(values: Iterable[int | float], unit: EpochUnit = 's',
+                        tz: tzinfo | None = timezone.utc) -> list["PyDateTime"]:
+        multiplier, divisor = _epoch_unit(unit)
+        return [_from_epoch_microseconds(_round_microseconds(value * multiplier) // divisor, tz) for value in values]
+
     @staticmethod
     def iter(*, start: date | str = None, end: date | str | None = None,
-             step: DatePart | TimePart | tuple[int | float, DatePart | TimePart] = DatePart.DAY,
+             step: "DatePart | TimePart | tuple[int | float, DatePart | TimePart] | Duration" = DatePart.DAY,
              max_steps: int = None) -> \
             Generator["PyDateTime", None, None]:
+        from dvrd_pydate.duration import Duration
         if max_steps == 0:
             # Raises StopIteration
             return
@@ -57,7 +108,9 @@ class PyDateTime(datetime, PyDate):
             start = datetime.now()
         current = PyDateTime.from_value(start)
         end_value = None if end is None else PyDateTime.from_value(end)
-        if isinstance(step, tuple):
+        if isinstance(step, Duration):
+            step_value, step_key = step, None
+        elif isinstance(step, tuple):
             step_value = step[0]
             step_key = step[1]
         else:
@@ -69,7 +122,13 @@ class PyDateTime(datetime, PyDate):
             current_step += 1
             if max_steps is not None and current_step == max_steps:
                 break
-            current = current.add(step_value, step_key)
+            current = step_value.apply(current) if step_key is None else current.add(step_value, step_key)
+
+    @staticmethod
+    def align_many(values: Iterable[datetime | date | str], step: StepArg, *, round_method: RoundMethod = 'floor',
+                   origin: datetime | date | str = None) -> list["PyDateTime"]:
+        align = _alignment(step, origin, round_method)
+        return [align(value if isinstance(value, datetime) else PyDateTime.from_value(value)) for value in values]
 
     def set(self, value_or_key: CommonArg, key_or_value: CommonArg) -> Self:
         key, value = _determine_key_and_value(value_or_key, key_or_value)
@@ -229,6 +288,30 @@ class PyDateTime(datetime, PyDate):
         else:
             raise KeyError(f'Unsupported end_of part {part}')
 
+    def floor_to(self, step: StepArg, *, origin: datetime | date | str = None) -> "PyDateTime":
+        return _alignment(step, origin, 'floor')(self)
+
+    def ceil_to(self, step: StepArg, *, origin: datetime | date | str = None) -> "PyDateTime":
+        return _alignment(step, origin, 'ceil')(self)
+
+    def round_to(self, step: StepArg, *, origin: datetime | date | str = None) -> "PyDateTime":
+        return _alignment(step, origin, 'round')(self)
+
+    def granularity_key(self, granularity: DatePart | TimePart = TimePart.MICROSECOND) -> int:
+        if isinstance(granularity, DatePart):
+            return super().granularity_key(granularity)
+        if granularity in [TimePart.HOUR, TimePart.HOURS]:
+            return self.toordinal() * hours_in_day + self.hour
+        elif granularity in [TimePart.MINUTE, TimePart.MINUTES]:
+            return (self.toordinal() * hours_in_day + self.hour) * minutes_in_hour + self.minute
+        elif granularity in [TimePart.SECOND, TimePart.SECONDS]:
+            return ((self.toordinal() * hours_in_day + self.hour) * minutes_in_hour + self.minute) * \
+                seconds_in_minute + self.second
+        elif granularity in [TimePart.MICROSECOND, TimePart.MICROSECONDS]:
+            return _wall_microseconds(self)
+        else:
+            raise KeyError(f'Unsupported granularity {granularity}')
+
     def is_before(self, other: datetime | str, granularity: DatePart | TimePart = TimePart.MICROSECOND) -> bool:
         if not isinstance(other, PyDateTime):
             other = PyDateTime.from_value(other)
@@ -300,10 +383,131 @@ class PyDateTime(datetime, PyDate):
             return math.floor(diff)
         return math.ceil(diff)
 
+    def to_epoch(self, unit: EpochUnit = 's') -> int:
+        """
+        Amount of whole units since 1970-01-01 00:00 UTC. Naive values are interpreted as UTC, not as local time.
+        """
+        return _microseconds_to_epoch(_epoch_microseconds(self), unit)
+
     def py_date(self) -> PyDate:
         return PyDate(self.year, self.month, self.day)
 
 
+_digit_shape = str.maketrans('0123456789', '0000000000')
+
+
+class LazyPyDateTime:
+    """
+    Wrapper around a raw ISO date(time) string that is only parsed into a PyDateTime when needed. Equality and
+    ordering between two lazy values with the same layout (and the same UTC offset, if any) compare the strings
+    directly. Any other attribute access, arithmetic or comparison parses the string once and delegates to the
+    resulting PyDateTime. LazyPyDateTime values are accepted everywhere PyDateTime.from_value is used.
+    """
+    __slots__ = ('raw', '_layout', '_key', '_value')
+
+    def __init__(self, raw: str):
+        self.raw = raw
+        self._layout: str | None = None
+        # Raw string with a space as date-time separator, compared when the layouts match. Set together with _layout
+        self._key: str | None = None
+        self._value: PyDateTime | None = None
+
+    @property
+    def layout(self) -> str:
+        """
+        The raw string with all digits replaced by 0, followed by the UTC offset if the string has one. Lazy values
+        with the same layout can be compared as strings.
+        """
+        if (layout := self._layout) is None:
+            raw = self.raw
+            if len(raw) > 10 and raw[10] == 'T':
+                raw = raw[:10] + ' ' + raw[11:]
+            self._key = raw
+            layout = raw.translate(_digit_shape)
+            if raw[-1:] == 'Z':
+                layout += 'Z'
+            elif (offset_index := max(layout.rfind('+', 10), layout.rfind('-', 10))) != -1:
+                layout += raw[offset_index:]
+            self._layout = layout
+        return layout
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._value is not None
+
+    def resolve(self) -> PyDateTime:
+        if (value := self._value) is None:
+            value = self._value = PyDateTime.fromisoformat(self.raw)
+        return value
+
+    def __getattr__(self, name: str):
+        if name.startswith('__') or name in LazyPyDateTime.__slots__:
+            raise AttributeError(name)
+        return getattr(self.resolve(), name)
+
+    def _compare_raw(self, other) -> bool:
+        return isinstance(other, LazyPyDateTime) and self.layout == other.layout
+
+    def __eq__(self, other) -> bool:
+        if self._compare_raw(other):
+            return self._key == other._key
+        if isinstance(other, LazyPyDateTime):
+            other = other.resolve()
+        elif not isinstance(other, date):
+            return NotImplemented
+        return self.resolve() == other
+
+    def __ne__(self, other) -> bool:
+        result = self.__eq__(other)
+        return result if result is NotImplemented else not result
+
+    def __lt__(self, other) -> bool:
+        if self._compare_raw(other):
+            return self._key < other._key
+        return self.resolve() < _resolve_other(other)
+
+    def __le__(self, other) -> bool:
+        if self._compare_raw(other):
+            return self._key <= other._key
+        return self.resolve() <= _resolve_other(other)
+
+    def __gt__(self, other) -> bool:
+        if self._compare_raw(other):
+            return self._key > other._key
+        return self.resolve() > _resolve_other(other)
+
+    def __ge__(self, other) -> bool:
+        if self._compare_raw(other):
+            return self._key >= other._key
+        return self.resolve() >= _resolve_other(other)
+
+    def __hash__(self) -> int:
+        return hash(self.resolve())
+
+    def __add__(self, other):
+        return self.resolve() + other
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        return self.resolve() - _resolve_other(other)
+
+    def __rsub__(self, other):
+        return other - self.resolve()
+
+    def __str__(self) -> str:
+        return self.raw
+
+    def __repr__(self) -> str:
+        return f'LazyPyDateTime({self.raw!r})'
+
+
+def _resolve_other(other):
+    if isinstance(other, LazyPyDateTime):
+        return other.resolve()
+    return other
+
+
 def _determine_key_and_value(arg1: CommonArg, arg2: CommonArg) -> tuple[DatePart | TimePart, int]:
     arg1 = _number_or_date_time_part(arg1)
     arg2 = _number_or_date_time_part(arg2)
@@ -327,3 +531,114 @@ def _number_or_date_time_part(arg: CommonArg) -> int | float | DatePart | TimePa
     if isinstance(arg, str):
         return DatePart.get_item(arg) or TimePart.get_item(arg)
     return arg
+
+
+def _wall_microseconds(value: datetime) -> int:
+    # Microseconds since 0001-01-01 00:00 (a Monday) in wall-clock time, ignoring tzinfo
+    return (((((value.toordinal() - 1) * hours_in_day + value.hour) * minutes_in_hour + value.minute) * seconds_in_minute +
+             value.second) * 1_000_000 + value.microsecond)
+
+
+def _from_wall_microseconds(value: int, tz) -> PyDateTime:
+    days, remainder = divmod(value, microseconds_in_day)
+    day_value = date.fromordinal(days + 1)
+    seconds, microsecond = divmod(remainder, 1_000_000)
+    minutes, second = divmod(seconds, seconds_in_minute)
+    hour, minute = divmod(minutes, minutes_in_hour)
+    return datetime.__new__(PyDateTime, day_value.year, day_value.month, day_value.day, hour, minute, second,
+                            microsecond, tz)
+
+
+# Wall microseconds (see _wall_microseconds) of 1970-01-01 00:00
+epoch_wall_microseconds = (epoch_ordinal - 1) * microseconds_in_day
+
+
+def _epoch_microseconds(value: datetime) -> int:
+    # Microseconds since 1970-01-01 00:00 UTC, naive values are interpreted as UTC
+    microseconds = _wall_microseconds(value) - epoch_wall_microseconds
+    if value.tzinfo is not None and (offset := value.utcoffset()) is not None:
+        microseconds -= (offset.days * 86400 + offset.seconds) * 1_000_000 + offset.microseconds
+    return microseconds
+
+
+def _from_epoch_microseconds(value: int, tz: tzinfo | None) -> PyDateTime:
+    if tz is None or tz is timezone.utc:
+        return _from_wall_microseconds(value + epoch_wall_microseconds, tz)
+    return tz.fromutc(_from_wall_microseconds(value + epoch_wall_microseconds, tz))
+
+
+def _days_from_civil(year: int, month: int, day: int) -> int:
+    # Days since 1970-01-01 for a proleptic Gregorian date, using integer arithmetic only
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+
+def _epoch_microseconds_from_fields(year: int, month: int, day: int, hour: int = 0, minute: int = 0,
+                                    second: int = 0, microsecond: int = 0) -> int:
+    return ((((_days_from_civil(year, month, day) * hours_in_day + hour) * minutes_in_hour + minute) *
+             seconds_in_minute + second) * 1_000_000 + microsecond)
+
+
+def _alignment(step: StepArg, origin: datetime | date | str | None,
+               round_method: RoundMethod) -> Callable[[datetime], PyDateTime]:
+    if isinstance(step, tuple):
+        key, step_value = _determine_key_and_value(*step)
+    else:
+        key, step_value = _determine_key_and_value(1, step)
+    if step_value <= 0:
+        raise ValueError('Step value must be positive')
+    if round_method not in ('floor', 'ceil', 'round'):
+        raise ValueError(f'Unsupported round method {round_method}')
+    origin_value = None if origin is None else PyDateTime.from_value(origin)
+
+    if key in step_months:
+        if step_value != int(step_value):
+            raise ValueError('Month and year steps must be whole numbers')
+        if origin_value is not None and \
+                any((origin_value.day - 1, origin_value.hour, origin_value.minute, origin_value.second,
+                     origin_value.microsecond)):
+            # Buckets of a month or longer are whole months, so they can't start at another day or time
+            raise ValueError('Month and year steps need an origin at the start of a month')
+        step_size = int(step_value) * step_months[key]
+        origin_month = 0 if origin_value is None else origin_value.year * months_in_year + origin_value.month - 1
+
+        def align_months(value: datetime) -> PyDateTime:
+            month_index = value.year * months_in_year + value.month - 1
+            floor_index = month_index - (month_index - origin_month) % step_size
+            year, month = divmod(floor_index, months_in_year)
+            floored = datetime.__new__(PyDateTime, year, month + 1, 1, 0, 0, 0, 0, value.tzinfo)
+            if round_method == 'floor':
+                return floored
+            value_us = _wall_microseconds(value)
+            floor_us = _wall_microseconds(floored)
+            if value_us == floor_us:
+                return floored
+            year, month = divmod(floor_index + step_size, months_in_year)
+            ceiled = datetime.__new__(PyDateTime, year, month + 1, 1, 0, 0, 0, 0, value.tzinfo)
+            if round_method == 'ceil' or _wall_microseconds(ceiled) - value_us <= value_us - floor_us:
+                return ceiled
+            return floored
+
+        return align_months
+
+    if key not in step_microseconds:
+        raise KeyError(f'Unsupported alignment part {key}')
+    step_size = round(step_value * step_microseconds[key])
+    if step_size <= 0:
+        raise ValueError('Step must be at least one microsecond')
+    origin_us = 0 if origin_value is None else _wall_microseconds(origin_value)
+
+    def align_microseconds(value: datetime) -> PyDateTime:
+        value_us = _wall_microseconds(value)
+        remainder = (value_us - origin_us) % step_size
+        if remainder and (round_method == 'ceil' or (round_method == 'round' and remainder * 2 >= step_size)):
+            value_us += step_size - remainder
+        else:
+            value_us -= remainder
+        return _from_wall_microseconds(value_us, value.tzinfo)
+
+    return align_microseconds
@@ -0,0 +1,92 @@
+import re
+from datetime import date
+from functools import lru_cache
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.offset import Offset
+from dvrd_pydate.pydate import PyDate
+
+weekday_names: dict[str, int] = {
+    'monday': 0, 'mon': 0,
+    'tuesday': 1, 'tue': 1,
+    'wednesday': 2, 'wed': 2,
+    'thursday': 3, 'thu': 3,
+    'friday': 4, 'fri': 4,
+    'saturday': 5, 'sat': 5,
+    'sunday': 6, 'sun': 6,
+}
+
+_clause_separator = re.compile(r'\s*(?:,|\bthen\b|\band\b)\s*')
+_amount_clause = re.compile(r'^(?:in\s+)?([+-]?)\s*(\d+)\s+(.+?)(\s+ago)?$')
+_business_unit = re.compile(r'^(?:business|working)\s+days?$')
+_direction_clause = re.compile(r'^(next|last|previous)\s+(.+)$')
+_boundary_clause = re.compile(r'^(start|beginning|end)\s+of\s+(?:the\s+)?(?:(this|next|last|previous)\s+)?(.+)$')
+_fixed_clauses: dict[str, tuple[int, DatePart]] = {
+    'today': (0, DatePart.DAYS),
+    'now': (0, DatePart.DAYS),
+    'tomorrow': (1, DatePart.DAYS),
+    'yesterday': (-1, DatePart.DAYS),
+}
+
+
+@lru_cache(maxsize=256)
+def compile_relative(expression: str) -> Offset:
+    """
+    Compile a relative date expression into a (cached) Offset. An expression consists of clauses separated by ',',
+    'then' or 'and', applied in order. Units are the DatePart/TimePart names accepted by add and start_of, with
+    spaces instead of underscores ('fiscal quarter'). Supported clauses:
+    - 'today', 'now', 'tomorrow', 'yesterday'
+    - amounts: '+3 days', '-2 weeks', 'in 4 hours', '1 month ago', '3 business days'
+    - 'next monday', 'last friday': the first such weekday after/before the value
+    - 'next month', 'last year': one unit forward/backward
+    - 'start of month', 'end of the next quarter', 'beginning of week'
+
+    >>> compile_relative('+3 business days, end of month')(PyDate(2024, 5, 30))
+    PyDate(2024, 6, 30)
+    """
+    normalized = ' '.join(expression.lower().split())
+    if not normalized:
+        raise ValueError('Relative expression cannot be empty')
+    offset = Offset()
+    for clause in _clause_separator.split(normalized):
+        offset = _apply_clause(offset, clause, expression)
+    return offset
+
+
+def apply_relative(expression: str, value: date | str) -> PyDate:
+    return compile_relative(expression)(value)
+
+
+def _apply_clause(offset: Offset, clause: str, expression: str) -> Offset:
+    if clause in _fixed_clauses:
+        amount, part = _fixed_clauses[clause]
+        return offset.add(amount, part) if amount else offset
+    if match := _amount_clause.match(clause):
+        sign, amount, unit, ago = match.groups()
+        amount = int(amount)
+        if (sign == '-') != (ago is not None):
+            amount = -amount
+        if _business_unit.match(unit):
+            return offset.add_business_days(amount)
+        return offset.add(amount, _unit(unit, expression))
+    if match := _boundary_clause.match(clause):
+        boundary, direction, unit = match.groups()
+        part = _unit(unit, expression)
+        if direction in ('next', 'last', 'previous'):
+            offset = offset.add(1 if direction == 'next' else -1, part)
+        return offset.end_of(part) if boundary == 'end' else offset.start_of(part)
+    if match := _direction_clause.match(clause):
+        direction, target = match.groups()
+        if target in weekday_names:
+            weekday = weekday_names[target]
+            return offset.next_weekday(weekday) if direction == 'next' else offset.previous_weekday(weekday)
+        return offset.add(1 if direction == 'next' else -1, _unit(target, expression))
+    raise ValueError(f'Invalid clause {clause!r} in relative expression {expression!r}')
+
+
+def _unit(unit: str, expression: str) -> DatePart | TimePart:
+    name = unit.replace(' ', '_')
+    part = DatePart.get_item(name) or TimePart.get_item(name)
+    if part is None:
+        raise ValueError(f'Unsupported unit {unit!r} in relative expression {expression!r}')
+    return part
@@ -0,0 +1,177 @@
+import mmap
+import re
+from datetime import datetime, date, timedelta, timezone
+from functools import lru_cache
+from typing import Generator, NamedTuple, TypeAlias
+
+from dvrd_pydate.formatting import tokenize_format
+from dvrd_pydate.pydatetime import PyDateTime, _epoch_microseconds_from_fields
+
+Buffer: TypeAlias = bytes | bytearray | memoryview | mmap.mmap
+
+# Directive -> (index in (year, month, day, hour, minute, second, microsecond), width)
+_fixed_width_directives: dict[str, tuple[int, int]] = {
+    'Y': (0, 4),
+    'y': (0, 2),
+    'm': (1, 2),
+    'd': (2, 2),
+    'H': (3, 2),
+    'M': (4, 2),
+    'S': (5, 2),
+    'f': (6, 6),
+}
+
+
+class TimestampLayout(NamedTuple):
+    # Byte pattern matching the timestamp, anchored at the start of a line
+    pattern: re.Pattern
+    # (field index, offset from the start of the line, width)
+    fields: tuple[tuple[int, int, int], ...]
+    # ISO layouts have an optional fraction of variable width (group 1) and UTC offset (group 2) after the seconds
+    iso_fraction_offset: int | None = None
+    # Two-digit year (%y), mapped like strptime does
+    short_year: bool = False
+
+
+@lru_cache(maxsize=64)
+def compile_layout(fmt: str = 'iso', *, field_offset: int = 0) -> TimestampLayout:
+    """
+    Compile a timestamp layout for scan_timestamps. fmt is either 'iso' (YYYY-MM-DD[T ]HH:MM:SS[.ffffff][Z|±hh:mm])
+    or a strftime pattern consisting of fixed-width directives (%Y, %y, %m, %d, %H, %M, %S, %f) and literals.
+    field_offset is the amount of characters preceding the timestamp on each line.
+    """
+    prefix = rb'(?m)^' + (rb'[^\n]{%d}' % field_offset if field_offset else b'')
+    if fmt == 'iso':
+        pattern = re.compile(prefix + rb'\d{4}-\d\d-\d\d[T ]\d\d:\d\d:\d\d(?:\.(\d{1,6}))?'
+                             rb'(Z|[+-]\d\d:?\d\d)?')
+        fields = ((0, 0, 4), (1, 5, 2), (2, 8, 2), (3, 11, 2), (4, 14, 2), (5, 17, 2))
+        return TimestampLayout(pattern, _offset_fields(fields, field_offset), field_offset + 20)
+
+    regex = [prefix]
+    fields = []
+    position = 0
+    short_year = False
+    for is_directive, text in tokenize_format(fmt):
+        if not is_directive:
+            encoded = text.encode()
+            regex.append(re.escape(encoded))
+            position += len(encoded)
+            continue
+        if text not in _fixed_width_directives:
+            raise ValueError(f'Unsupported directive %{text} in timestamp layout')
+        index, width = _fixed_width_directives[text]
+        short_year = short_year or text == 'y'
+        regex.append(rb'\d{%d}' % width)
+        fields.append((index, position, width))
+        position += width
+    if not {0, 1, 2}.issubset(index for index, _, _ in fields):
+        raise ValueError('Timestamp layout must contain a year, month and day')
+    return TimestampLayout(re.compile(b''.join(regex)), _offset_fields(tuple(fields), field_offset),
+                           short_year=short_year)
+
+
+def scan_timestamps(buffer: Buffer, layout: str | TimestampLayout = 'iso', *, start: int = 0,
+                    until: datetime | date | str | int | None = None, as_epoch: bool = False) -> \
+        Generator[tuple[int, PyDateTime | int], None, None]:
+    """
+    Find the timestamp at the start of each line in buffer and yield (line offset, value) pairs. Digits are read
+    directly from the buffer, no intermediate strings are created. Lines without a (valid) timestamp are skipped.
+    :param buffer: bytes, bytearray, memoryview or mmap to scan
+    :param layout: 'iso', a strftime pattern or a layout from compile_layout
+    :param start: offset in the buffer to start scanning at
+    :param until: stop once a timestamp after this value is found, for sorted logs. Integers are epoch microseconds
+    :param as_epoch: yield the timestamps as integer microseconds since 1970-01-01. Timestamps with a UTC offset are
+    converted to UTC, timestamps without one are taken as is
+    :return: generator of (offset, PyDateTime or int)
+    """
+    if not isinstance(layout, TimestampLayout):
+        layout = compile_layout(layout)
+    until_value = _until_microseconds(until)
+    fields = layout.fields
+    fraction_offset = layout.iso_fraction_offset
+    short_year = layout.short_year
+    for match in layout.pattern.finditer(buffer, start):
+        offset = match.start()
+        parts = [0, 1, 1, 0, 0, 0, 0]
+        for index, field_offset, width in fields:
+            position = offset + field_offset
+            value = 0
+            for digit_index in range(position, position + width):
+                value = value * 10 + buffer[digit_index] - 48
+            parts[index] = value
+        if short_year:
+            parts[0] += 2000 if parts[0] < 69 else 1900
+        utc_offset = None
+        if fraction_offset is not None:
+            fraction_start, fraction_end = match.span(1)
+            if fraction_start != -1:
+                value = 0
+                for digit_index in range(fraction_start, fraction_end):
+                    value = value * 10 + buffer[digit_index] - 48
+                parts[6] = value * 10 ** (6 - fraction_end + fraction_start)
+            offset_start, offset_end = match.span(2)
+            if offset_start != -1:
+                utc_offset = _utc_offset_minutes(buffer, offset_start, offset_end)
+                if utc_offset is None:
+                    continue
+        if not valid_fields(*parts):
+            continue
+        if as_epoch or until_value is not None:
+            epoch_value = _epoch_microseconds_from_fields(*parts)
+            if utc_offset:
+                epoch_value -= utc_offset * 60_000_000
+            if until_value is not None and epoch_value > until_value:
+                return
+            if as_epoch:
+                yield offset, epoch_value
+                continue
+        if utc_offset is None:
+            yield offset, datetime.__new__(PyDateTime, *parts)
+        else:
+            yield offset, datetime.__new__(PyDateTime, *parts, _timezone(utc_offset))
+
+
+def valid_fields(year: int, month: int, day: int, hour: int = 0, minute: int = 0, second: int = 0,
+                 microsecond: int = 0) -> bool:
+    """
+    Whether the fields form a valid datetime, checked without constructing one.
+    """
+    if not (1 <= month <= 12 and 1 <= day and hour < 24 and minute < 60 and second < 60 and year >= 1):
+        return False
+    if day <= 28:
+        return True
+    if month == 2:
+        return day == 29 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    return day <= (30 if month in (4, 6, 9, 11) else 31)
+
+
+def _offset_fields(fields: tuple[tuple[int, int, int], ...], field_offset: int) -> tuple[tuple[int, int, int], ...]:
+    return tuple((index, offset + field_offset, width) for index, offset, width in fields)
+
+
+def _utc_offset_minutes(buffer: Buffer, start: int, end: int) -> int | None:
+    # Z or ±hh[:]mm, None if the hours or minutes are out of range
+    if end - start == 1:
+        return 0
+    hours = (buffer[start + 1] - 48) * 10 + buffer[start + 2] - 48
+    minutes = (buffer[end - 2] - 48) * 10 + buffer[end - 1] - 48
+    if hours > 23 or minutes > 59:
+        return None
+    minutes += hours * 60
+    return -minutes if buffer[start] == 45 else minutes
+
+
+@lru_cache(maxsize=None)
+def _timezone(minutes: int) -> timezone:
+    return timezone.utc if minutes == 0 else timezone(timedelta(minutes=minutes))
+
+
+def _until_microseconds(until: datetime | date | str | int | None) -> int | None:
+    if until is None or isinstance(until, int):
+        return until
+    until = PyDateTime.from_value(until)
+    value = _epoch_microseconds_from_fields(until.year, until.month, until.day, until.hour, until.minute, until.second,
+                                            until.microsecond)
+    if (utc_offset := until.utcoffset()) is not None:
+        value -= utc_offset // timedelta(microseconds=1)
+    return value
@@ -0,0 +1,174 @@
+import re
+from datetime import date
+from itertools import chain, islice
+from typing import Callable, Generator, Iterable, NamedTuple, Sequence
+
+from dvrd_pydate.pydate import PyDate
+from dvrd_pydate.pydatetime import PyDateTime
+from dvrd_pydate.scanner import valid_fields
+
+
+class DateFormat(NamedTuple):
+    name: str
+    pattern: re.Pattern
+    # Builds the value from a full match, None if the matched fields are not a valid date
+    parse: Callable[[re.Match], date | None]
+
+
+class FormatGuess(NamedTuple):
+    name: str
+    # Fraction of the sample matching the format
+    confidence: float
+    # Every matching value is also a valid date in another format, e.g. '05/01/2024' for day_first and month_first
+    ambiguous: bool = False
+
+
+def _parse_ymd(match: re.Match) -> PyDate | None:
+    year, month, day = int(match[1]), int(match[2]), int(match[3])
+    return PyDate(year, month, day) if valid_fields(year, month, day) else None
+
+
+def _parse_day_first(match: re.Match) -> PyDate | None:
+    day, month, year = int(match[1]), int(match[3]), int(match[4])
+    return PyDate(year, month, day) if valid_fields(year, month, day) else None
+
+
+def _parse_month_first(match: re.Match) -> PyDate | None:
+    month, day, year = int(match[1]), int(match[3]), int(match[4])
+    return PyDate(year, month, day) if valid_fields(year, month, day) else None
+
+
+def _parse_iso_datetime(match: re.Match) -> PyDateTime | None:
+    if not valid_fields(int(match[1]), int(match[2]), int(match[3]), int(match[4]), int(match[5]), int(match[6] or 0)):
+        return None
+    # UTC offsets must be less than 24 hours
+    if match[7] is not None and (int(match[7]) > 23 or int(match[8]) > 59):
+        return None
+    return PyDateTime.fromisoformat(match[0])
+
+
+def _parse_epoch_seconds(match: re.Match) -> PyDateTime:
+    return PyDateTime.from_epoch(float(match[0]) if '.' in match[0] else int(match[0]), 's')
+
+
+def _parse_epoch_milliseconds(match: re.Match) -> PyDateTime:
+    return PyDateTime.from_epoch(int(match[0]), 'ms')
+
+
+# Known formats, in order of preference when the confidence is equal
+# Format -> format with the other day and month order
+_day_month_formats: dict[str, str] = {'day_first': 'month_first', 'month_first': 'day_first'}
+
+known_formats: dict[str, DateFormat] = {fmt.name: fmt for fmt in (
+    DateFormat('iso_date', re.compile(r'(\d{4})-(\d\d)-(\d\d)'), _parse_ymd),
+    DateFormat('iso_datetime', re.compile(r'(\d{4})-(\d\d)-(\d\d)[T ](\d\d):(\d\d)(?::(\d\d)(?:\.\d{1,6})?)?'
+                                          r'(?:Z|[+-](\d\d):?(\d\d))?'), _parse_iso_datetime),
+    DateFormat('compact', re.compile(r'(\d{4})(\d\d)(\d\d)'), _parse_ymd),
+    DateFormat('day_first', re.compile(r'(\d\d?)([/.-])(\d\d?)\2(\d{4})'), _parse_day_first),
+    DateFormat('month_first', re.compile(r'(\d\d?)([/.-])(\d\d?)\2(\d{4})'), _parse_month_first),
+    DateFormat('epoch_seconds', re.compile(r'-?\d{9,10}(?:\.\d{1,9})?'), _parse_epoch_seconds),
+    DateFormat('epoch_milliseconds', re.compile(r'-?\d{12,13}'), _parse_epoch_milliseconds),
+)}
+
+
+def sniff_formats(sample: Iterable[str], *, min_confidence: float = 0.01) -> list[FormatGuess]:
+    """
+    Determine which known formats the values in sample use. Each value counts for every format it is a valid date in,
+    so ambiguous values such as '05/01/2024' count for both 'day_first' and 'month_first'. A guess is flagged
+    ambiguous when none of its values rule out the other formats, i.e. the sample can't tell them apart.
+    :return: guesses with at least min_confidence, highest confidence first
+    """
+    sample = [value.strip() for value in sample]
+    if not sample:
+        return []
+    counts = dict.fromkeys(known_formats, 0)
+    # Values that are a valid date in this format only
+    exclusive_counts = dict.fromkeys(known_formats, 0)
+    for value in sample:
+        matched = [fmt.name for fmt in known_formats.values()
+                   if (match := fmt.pattern.fullmatch(value)) is not None and fmt.parse(match) is not None]
+        for name in matched:
+            counts[name] += 1
+        if len(matched) == 1:
+            exclusive_counts[matched[0]] += 1
+    guesses = [FormatGuess(name, count / len(sample), exclusive_counts[name] == 0) for name, count in counts.items()]
+    # Stable sort keeps the preference order of known_formats for equal confidence
+    guesses.sort(key=lambda guess: guess.confidence, reverse=True)
+    return [guess for guess in guesses if guess.confidence >= min_confidence and guess.confidence > 0]
+
+
+class StreamParser:
+    """
+    Parser trying the given formats in order, then the remaining known formats. Values are matched with compiled
+    patterns, so rows never raise and catch exceptions while parsing. fallbacks counts the values in none of the given
+    formats.
+    :param day_first: order for values like '05/01/2024' that aren't in the given formats. If omitted and formats
+    contains neither 'day_first' nor 'month_first', such values are not guessed: ValueError is raised, or None is
+    returned when not strict. Values valid in one order only (e.g. '13/01/2024') are always parsed
+    """
+
+    def __init__(self, formats: Sequence[str], *, strict: bool = True, day_first: bool = None):
+        unknown = [name for name in formats if name not in known_formats]
+        if unknown:
+            raise KeyError(f'Unsupported format(s) {", ".join(unknown)}')
+        self.formats = tuple(formats)
+        self.strict = strict
+        self.day_first = day_first
+        self.fallbacks = 0
+        self._formats = tuple(known_formats[name] for name in formats)
+        fallback_names = [name for name in known_formats if name not in formats]
+        if day_first is False and 'day_first' in fallback_names and 'month_first' in fallback_names:
+            fallback_names.remove('day_first')
+            fallback_names.insert(fallback_names.index('month_first') + 1, 'day_first')
+        self._fallback_formats = tuple(known_formats[name] for name in fallback_names)
+        # The day/month order is neither given nor implied by the formats, ambiguous values must be refused
+        self._refuse_ambiguous = day_first is None and not _day_month_formats.keys() & set(formats)
+
+    def __call__(self, value: str) -> PyDate | PyDateTime | None:
+        for fmt in self._formats:
+            if (match := fmt.pattern.fullmatch(value)) is not None and (result := fmt.parse(match)) is not None:
+                return result
+        return self._fallback(value)
+
+    def map(self, values: Iterable[str]) -> Generator[PyDate | PyDateTime | None, None, None]:
+        for value in values:
+            yield self(value)
+
+    def _fallback(self, value: str) -> PyDate | PyDateTime | None:
+        self.fallbacks += 1
+        stripped = value.strip()
+        for fmt in chain(self._formats, self._fallback_formats):
+            if (match := fmt.pattern.fullmatch(stripped)) is not None and (result := fmt.parse(match)) is not None:
+                if self._refuse_ambiguous and fmt.name in _day_month_formats and \
+                        (other := known_formats[_day_month_formats[fmt.name]].parse(match)) is not None and \
+                        other != result:
+                    if self.strict:
+                        raise ValueError(f'Ambiguous day and month order in {value!r}, pass day_first')
+                    return None
+                return result
+        if self.strict:
+            raise ValueError(f'Could not parse {value!r} as date')
+        return None
+
+
+def parse_stream(values: Iterable[str], *, sample_size: int = 100, strict: bool = True, day_first: bool = None) -> \
+        Generator[PyDate | PyDateTime | None, None, None]:
+    """
+    Sniff the formats of the first sample_size values, then parse all values with a StreamParser for the detected
+    formats. Date formats yield PyDate, date-time and epoch formats yield PyDateTime (epoch values in UTC).
+    :param strict: raise ValueError for values in none of the known formats. Otherwise, None is yielded for them
+    :param day_first: whether values like '05/01/2024' are day first. If omitted, ValueError is raised when the sample
+    can't tell day first from month first, or when such a value follows a sample without any (see StreamParser)
+    """
+    iterator = iter(values)
+    sample = list(islice(iterator, sample_size))
+    guesses = sniff_formats(sample)
+    if day_first is not None:
+        excluded = 'month_first' if day_first else 'day_first'
+        guesses = [guess for guess in guesses if guess.name != excluded]
+    elif sum(guess.ambiguous for guess in guesses) > 1:
+        names = ', '.join(guess.name for guess in guesses if guess.ambiguous)
+        raise ValueError(f'Sample is ambiguous between {names}, pass day_first')
+    parser = StreamParser([guess.name for guess in guesses], strict=strict, day_first=day_first)
+    yield from parser.map(sample)
+    yield from parser.map(iterator)
@@ -0,0 +1,87 @@
+from collections import Counter
+from datetime import date, datetime
+from typing import Iterable, Sequence
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydate import PyDate
+from dvrd_pydate.pydatetime import PyDateTime
+from dvrd_pydate.streams import timestamp_key
+
+# Use bucket sort when there are at most this many values per distinct key on average
+bucket_sort_ratio = 4
+
+
+def sort(values: Iterable[date], *, granularity: DatePart | TimePart = None, reverse: bool = False) -> list[date]:
+    """
+    Sort date(time)s, stable. With a granularity, values are sorted on the start of that part (as in start_of) using
+    integer keys extracted once per value (see sort_keys). Values with many duplicate keys are then bucket sorted in
+    linear time. Without a granularity, values are compared directly (which happens in C), unless they mix dates,
+    naive and aware datetimes; then they are sorted on integer keys as well.
+    :return: new list of the same values
+    """
+    values = values if isinstance(values, list) else list(values)
+    if granularity is None:
+        try:
+            return sorted(values, reverse=reverse)
+        except TypeError:
+            # Mixed dates, naive and aware datetimes can't be compared with each other
+            pass
+    keys = sort_keys(values, granularity)
+    if len(values) >= bucket_sort_ratio * 2 and len(set(keys)) * bucket_sort_ratio <= len(values):
+        buckets: dict[int, list[date]] = {}
+        for key, value in zip(keys, values):
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = [value]
+            else:
+                bucket.append(value)
+        result = []
+        for key in sorted(buckets, reverse=reverse):
+            result.extend(buckets[key])
+        return result
+    indexes = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    return [values[index] for index in indexes]
+
+
+def unique(values: Iterable[date], granularity: DatePart | TimePart = None) -> list[PyDate]:
+    """
+    Distinct values in ascending order. With a granularity, values are truncated to the start of that part first, so
+    unique(values, DatePart.DAY) returns every day occurring in values.
+    """
+    values = values if isinstance(values, list) else list(values)
+    representatives = dict(zip(sort_keys(values, granularity), values))
+    return [_truncate(representatives[key], granularity) for key in sorted(representatives)]
+
+
+def value_counts(values: Iterable[date], granularity: DatePart | TimePart = None) -> dict[PyDate, int]:
+    """
+    Amount of occurrences per distinct (truncated) value, in ascending order of the values.
+    """
+    values = values if isinstance(values, list) else list(values)
+    keys = sort_keys(values, granularity)
+    counts = Counter(keys)
+    representatives = dict(zip(keys, values))
+    return {_truncate(representatives[key], granularity): counts[key] for key in sorted(counts)}
+
+
+def sort_keys(values: Sequence[date], granularity: DatePart | TimePart = None) -> list[int]:
+    """
+    Integer key per value: microseconds since 1970-01-01 UTC (see timestamp_key) without granularity, the ordinal
+    for days and granularity_key for other parts.
+    """
+    if granularity is None:
+        return list(map(timestamp_key, values))
+    if granularity in (DatePart.DAY, DatePart.DAYS):
+        return list(map(date.toordinal, values))
+    return [_as_py(value).granularity_key(granularity) for value in values]
+
+
+def _as_py(value: date) -> PyDate:
+    if isinstance(value, PyDate):
+        return value
+    return PyDateTime(value) if isinstance(value, datetime) else PyDate(value)
+
+
+def _truncate(value: date, granularity: DatePart | TimePart | None) -> PyDate:
+    value = _as_py(value)
+    return value if granularity is None else value.start_of(granularity)
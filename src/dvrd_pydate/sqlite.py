@@ -0,0 +1,78 @@
+import sqlite3
+from datetime import tzinfo
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydate import PyDate
+from dvrd_pydate.pydatetime import PyDateTime
+
+
+def register_sqlite(connection: sqlite3.Connection = None, *, tz: tzinfo | None = None):
+    """
+    Store PyDate values as integer ordinals and PyDateTime values as integer microseconds since 1970-01-01 UTC.
+    Columns declared as PYDATE or PYDATETIME are converted back when the connection is opened with
+    detect_types=sqlite3.PARSE_DECLTYPES. Adapters and converters are registered for the whole sqlite3 module.
+    :param connection: if given, the pydate_* SQL functions are installed on this connection
+    :param tz: timezone of PyDateTime values read from the database. If None, naive UTC values are returned
+    """
+    sqlite3.register_adapter(PyDate, _adapt_date)
+    sqlite3.register_adapter(PyDateTime, _adapt_datetime)
+    sqlite3.register_converter('pydate', _convert_date)
+    sqlite3.register_converter('pydatetime', lambda value: PyDateTime.from_epoch(int(value), 'us', tz))
+    if connection is not None:
+        install_functions(connection)
+
+
+def install_functions(connection: sqlite3.Connection):
+    """
+    Install SQL functions for bucketing stored values inside queries:
+    - pydate_start_of(ordinal, part) / pydate_end_of(ordinal, part)
+    - pydatetime_start_of(microseconds, part) / pydatetime_end_of(microseconds, part)
+    part is any DatePart or TimePart name, e.g. 'month'.
+    """
+    connection.create_function('pydate_start_of', 2, _date_start_of, deterministic=True)
+    connection.create_function('pydate_end_of', 2, _date_end_of, deterministic=True)
+    connection.create_function('pydatetime_start_of', 2, _datetime_start_of, deterministic=True)
+    connection.create_function('pydatetime_end_of', 2, _datetime_end_of, deterministic=True)
+
+
+def _adapt_date(value: PyDate) -> int:
+    return value.toordinal()
+
+
+def _adapt_datetime(value: PyDateTime) -> int:
+    return value.to_epoch('us')
+
+
+def _convert_date(value: bytes) -> PyDate:
+    return PyDate.fromordinal(int(value))
+
+
+def _part(name: str) -> DatePart | TimePart:
+    part = DatePart.get_item(name) or TimePart.get_item(name)
+    if part is None:
+        raise KeyError(f'Unsupported part {name}')
+    return part
+
+
+def _date_start_of(value: int | None, part: str) -> int | None:
+    if value is None:
+        return None
+    return PyDate.fromordinal(value).start_of(_part(part)).toordinal()
+
+
+def _date_end_of(value: int | None, part: str) -> int | None:
+    if value is None:
+        return None
+    return PyDate.fromordinal(value).end_of(_part(part)).toordinal()
+
+
+def _datetime_start_of(value: int | None, part: str) -> int | None:
+    if value is None:
+        return None
+    return PyDateTime.from_epoch(value, 'us', None).start_of(_part(part)).to_epoch('us')
+
+
+def _datetime_end_of(value: int | None, part: str) -> int | None:
+    if value is None:
+        return None
+    return PyDateTime.from_epoch(value, 'us', None).end_of(_part(part)).to_epoch('us')
@@ -0,0 +1,278 @@
+import heapq
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Generator, Iterable, Literal, NamedTuple, TypeAlias, TypeVar
+
+from dvrd_pydate.duration import Duration
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydate import PyDate, epoch_ordinal, microseconds_in_day
+from dvrd_pydate.pydatetime import PyDateTime, StepArg, step_microseconds, _epoch_microseconds, \
+    _determine_key_and_value
+
+Record = TypeVar('Record')
+Other = TypeVar('Other')
+KeyFunction = Callable[[Any], date]
+JoinDirection: TypeAlias = Literal['backward', 'forward', 'nearest']
+Tolerance: TypeAlias = tuple[int | float, DatePart | TimePart] | timedelta
+GapKind: TypeAlias = Literal['missing', 'duplicate', 'out_of_order', 'unaligned']
+
+
+class Gap(NamedTuple):
+    kind: GapKind
+    # First missing point, or the offending value for the other kinds
+    start: PyDate
+    # Last missing point, equal to start for the other kinds
+    end: PyDate
+    count: int = 1
+
+
+class Session(NamedTuple):
+    user: Any
+    # Timestamps of the first and last event, as given
+    start: date
+    end: date
+    count: int
+
+
+def timestamp_key(value: date) -> int:
+    """
+    Integer sort key of a date(time): microseconds since 1970-01-01 00:00 UTC. Naive values are interpreted as UTC,
+    dates as midnight.
+    """
+    if isinstance(value, datetime):
+        return _epoch_microseconds(value)
+    return (value.toordinal() - epoch_ordinal) * microseconds_in_day
+
+
+def merge(*iterables: Iterable[Record], key: KeyFunction = None, granularity: DatePart | TimePart = None) -> \
+        Generator[Record, None, None]:
+    """
+    Merge iterables that are each sorted by timestamp into one sorted stream. Only one item per iterable is held in
+    memory. Items are ordered by integer keys (see timestamp_key), items with equal timestamps in order of the
+    iterables they came from.
+    :param key: function returning the timestamp of an item, items are timestamps themselves if omitted
+    :param granularity: drop items that are the same (as in is_same) in this granularity as the previous item
+    :return: generator of the merged items
+    """
+    decorated = [_decorate(iterable, index, key) for index, iterable in enumerate(iterables)]
+    merged = heapq.merge(*decorated)
+    if granularity is None:
+        for _, _, item in merged:
+            yield item
+        return
+    previous_key = None
+    for _, _, item in merged:
+        timestamp = item if key is None else key(item)
+        if not isinstance(timestamp, PyDate):
+            timestamp = PyDateTime(timestamp) if isinstance(timestamp, datetime) else PyDate(timestamp)
+        granularity_key = timestamp.granularity_key(granularity)
+        if granularity_key != previous_key:
+            previous_key = granularity_key
+            yield item
+
+
+def asof_join(left: Iterable[Record], right: Iterable[Other], *, key: KeyFunction = None,
+              right_key: KeyFunction = None, direction: JoinDirection = 'backward', tolerance: Tolerance = None) -> \
+        Generator[tuple[Record, Other | None], None, None]:
+    """
+    Match every item of left with an item of right by timestamp, in a single pass over both. Both iterables must be
+    sorted by timestamp and may be streams; right items that can no longer match are discarded.
+    :param key: function returning the timestamp of an item, items are timestamps themselves if omitted
+    :param right_key: key for right items, defaults to key
+    :param direction: 'backward' matches the last right item at or before the left item, 'forward' the first right
+    item at or after it, 'nearest' the closest of both (backward on ties)
+    :param tolerance: maximum distance between matched items, e.g. (0.5, TimePart.SECONDS) or a timedelta
+    :return: generator of (left item, matched right item or None)
+    """
+    if direction not in ('backward', 'forward', 'nearest'):
+        raise ValueError(f'Unsupported join direction {direction}')
+    if right_key is None:
+        right_key = key
+    max_distance = _tolerance_microseconds(tolerance)
+    right_items = _decorate_pairs(right, right_key)
+    previous = None
+    upcoming = next(right_items, None)
+    for item in left:
+        item_key = timestamp_key(item if key is None else key(item))
+        if direction == 'backward':
+            while upcoming is not None and upcoming[0] <= item_key:
+                previous = upcoming
+                upcoming = next(right_items, None)
+            match = previous
+        else:
+            while upcoming is not None and upcoming[0] < item_key:
+                previous = upcoming
+                upcoming = next(right_items, None)
+            match = upcoming
+            if direction == 'nearest' and previous is not None and \
+                    (upcoming is None or item_key - previous[0] <= upcoming[0] - item_key):
+                match = previous
+        if match is not None and max_distance is not None and abs(item_key - match[0]) > max_distance:
+            match = None
+        yield item, None if match is None else match[1]
+
+
+def detect_gaps(values: Iterable[date], step: StepArg | Duration = DatePart.DAY) -> Generator[Gap, None, None]:
+    """
+    Check a sorted series against the expected step (as in iter, each point is the previous point plus step) in a
+    single pass. Yields a Gap for every run of missing points, for values equal to the previous value ('duplicate'),
+    values before it ('out_of_order') and values between it and the next expected point ('unaligned'). After a run
+    of missing points the series continues from the value that ended it.
+    """
+    # Not a generator itself, so an invalid step raises here instead of on the first next()
+    return _walk_series(values, *_series_step(step), False)
+
+
+def fill_gaps(values: Iterable[date], step: StepArg | Duration = DatePart.DAY) -> Generator[PyDate, None, None]:
+    """
+    Yield the sorted series with missing points inserted, generated lazily. Duplicate, out of order and unaligned
+    values are skipped.
+    """
+    return _walk_series(values, *_series_step(step), True)
+
+
+def sessionize(events: Iterable[Record], gap: Tolerance = (30, TimePart.MINUTES), *, key: KeyFunction = None,
+               user: Callable[[Record], Any] = None) -> Generator[Session, None, None]:
+    """
+    Split a stream of events, sorted by timestamp, into sessions per user: a session closes when the next event of
+    the same user is more than gap after its last event. Closed sessions are yielded as soon as an event (of any user)
+    shows they can't continue, in order of their last event; sessions still open at the end of the stream are yielded
+    last. Only the open sessions are held in memory.
+    :param events: (user, timestamp) pairs, or records with key and user
+    :param gap: maximum time between events in a session, e.g. (30, TimePart.MINUTES) or a timedelta
+    :param key: function returning the timestamp of an event
+    :param user: function returning the user of an event
+    :return: generator of Session(user, start, end, count)
+    """
+    max_gap = _tolerance_microseconds(gap)
+    # User: [last event key, start, end, count], least recently active first
+    open_sessions: OrderedDict[Any, list] = OrderedDict()
+    for event in events:
+        if key is None and user is None:
+            event_user, moment = event
+        else:
+            event_user = event[0] if user is None else user(event)
+            moment = event[1] if key is None else key(event)
+        event_key = timestamp_key(moment)
+        # Close every session whose last event is too long ago, including a previous session of this user
+        while open_sessions:
+            oldest_user, oldest = next(iter(open_sessions.items()))
+            if event_key - oldest[0] <= max_gap:
+                break
+            del open_sessions[oldest_user]
+            yield Session(oldest_user, oldest[1], oldest[2], oldest[3])
+        session = open_sessions.get(event_user)
+        if session is None:
+            open_sessions[event_user] = [event_key, moment, moment, 1]
+            continue
+        session[3] += 1
+        if event_key >= session[0]:
+            session[0] = event_key
+            session[2] = moment
+            open_sessions.move_to_end(event_user)
+    for session_user, session in open_sessions.items():
+        yield Session(session_user, session[1], session[2], session[3])
+
+
+def _series_step(step: StepArg | Duration) -> tuple[int | float | Duration, DatePart | TimePart | None]:
+    if isinstance(step, Duration):
+        if not step or step.months < 0 or step.days < 0 or step.microseconds < 0:
+            raise ValueError('Step value must be positive')
+        return step, None
+    if isinstance(step, tuple):
+        step_key, step_value = _determine_key_and_value(*step)
+    else:
+        step_key, step_value = _determine_key_and_value(1, step)
+    if step_value <= 0:
+        raise ValueError('Step value must be positive')
+    return step_value, step_key
+
+
+def _walk_series(values: Iterable[date], step_value: int | float | Duration, step_key: DatePart | TimePart | None,
+                 fill: bool) -> \
+        Generator[Gap | PyDate, None, None]:
+    fixed_step = step_microseconds.get(step_key)
+    delta = None if fixed_step is None else timedelta(microseconds=step_value * fixed_step)
+    previous = previous_key = expected = expected_key = None
+    for value in values:
+        if not isinstance(value, PyDate):
+            value = PyDateTime(value) if isinstance(value, datetime) else PyDate(value)
+        value_key = timestamp_key(value)
+        if previous is not None and value_key != expected_key:
+            if value_key > expected_key:
+                if fill:
+                    yield from _series_points(expected, value_key, delta, step_value, step_key)
+                else:
+                    yield _missing_gap(expected, expected_key, value_key, delta, step_value, step_key)
+            else:
+                if not fill:
+                    kind = 'duplicate' if value_key == previous_key else \
+                        'out_of_order' if value_key < previous_key else 'unaligned'
+                    yield Gap(kind, value, value)
+                continue
+        if fill:
+            yield value
+        previous, previous_key = value, value_key
+        expected = _advance(value, delta, step_value, step_key)
+        expected_key = timestamp_key(expected)
+
+
+def _series_points(start: PyDate, until_key: int, delta: timedelta | None, step_value: int | float | Duration,
+                   step_key: DatePart | TimePart | None) -> Generator[PyDate, None, None]:
+    # Points from start up to (excluding) until_key
+    current = start
+    while timestamp_key(current) < until_key:
+        yield current
+        current = _advance(current, delta, step_value, step_key)
+
+
+def _missing_gap(start: PyDate, start_key: int, until_key: int, delta: timedelta | None,
+                 step_value: int | float | Duration, step_key: DatePart | TimePart | None) -> Gap:
+    if delta is not None:
+        step_size = (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+        count = -((start_key - until_key) // step_size)
+        return Gap('missing', start, start + delta * (count - 1), count)
+    count = 0
+    end = start
+    for end in _series_points(start, until_key, None, step_value, step_key):
+        count += 1
+    return Gap('missing', start, end, count)
+
+
+def _advance(value: PyDate, delta: timedelta | None, step_value: int | float | Duration,
+             step_key: DatePart | TimePart | None) -> PyDate:
+    if delta is not None:
+        return value + delta
+    # Duration steps have no key, like in iter
+    return step_value.apply(value) if step_key is None else value.add(step_value, step_key)
+
+
+def _tolerance_microseconds(tolerance: Tolerance | None) -> int | None:
+    if tolerance is None:
+        return None
+    if isinstance(tolerance, timedelta):
+        return (tolerance.days * 86400 + tolerance.seconds) * 1_000_000 + tolerance.microseconds
+    part, value = _determine_key_and_value(*tolerance)
+    if part not in step_microseconds:
+        raise KeyError(f'Unsupported tolerance part {part}')
+    return round(value * step_microseconds[part])
+
+
+def _decorate_pairs(iterable: Iterable[Record], key: KeyFunction | None) -> Generator[tuple[int, Record], None, None]:
+    if key is None:
+        for item in iterable:
+            yield timestamp_key(item), item
+    else:
+        for item in iterable:
+            yield timestamp_key(key(item)), item
+
+
+def _decorate(iterable: Iterable[Record], index: int, key: KeyFunction | None) -> \
+        Generator[tuple[int, int, Record], None, None]:
+    # The iterable index breaks ties, so items themselves are never compared
+    if key is None:
+        for item in iterable:
+            yield timestamp_key(item), index, item
+    else:
+        for item in iterable:
+            yield timestamp_key(key(item)), index, item
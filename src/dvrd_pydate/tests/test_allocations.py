@@ -0,0 +1,201 @@
+import gc
+import math
+import sys
+import tracemalloc
+import unittest
+from datetime import date, datetime
+from typing import Callable, Any
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart, TimePart
+
+py_date = PyDate(2024, 5, 15)
+other_date = PyDate(2024, 3, 1)
+py_datetime = PyDateTime(2024, 5, 15, 10, 37, 31, 5)
+other_datetime = PyDateTime(2024, 3, 1, 8)
+
+# Public method -> (call, block budget, byte budget), see measure. The block budget counts the objects a call leaves
+# allocated, the byte budget is the peak traced during the call, so it also covers temporaries. Budgets are the
+# measurements on CPython 3.11; the test allows budget_headroom on top, so patch releases and running under
+# python -X tracemalloc pass, while a few extra objects per call (e.g. a clone() and a timedelta) still fail. When a
+# change needs more, raise the budget deliberately in the same change.
+budget_headroom = 1.25
+
+pydate_budgets: dict[str, tuple[Callable[[], Any], int, int]] = {
+    'abs_diff': (lambda: py_date.abs_diff(other_date), 8, 124),
+    'add': (lambda: py_date.add(1, DatePart.MONTH), 8, 184),
+    'add_day': (py_date.add_day, 10, 88),
+    'add_days': (lambda: py_date.add_days(3), 10, 88),
+    'add_iso_years': (lambda: py_date.add_iso_years(1), 10, 184),
+    'add_month': (py_date.add_month, 8, 184),
+    'add_months': (lambda: py_date.add_months(3), 8, 184),
+    'add_quarter': (py_date.add_quarter, 8, 184),
+    'add_quarters': (lambda: py_date.add_quarters(2), 8, 184),
+    'add_week': (py_date.add_week, 10, 88),
+    'add_weeks': (lambda: py_date.add_weeks(2), 10, 88),
+    'add_year': (py_date.add_year, 3, 136),
+    'add_years': (lambda: py_date.add_years(2), 3, 136),
+    'clone': (py_date.clone, 6, 104),
+    'compile_formatter': (lambda: PyDate.compile_formatter('%Y-%m-%d'), 1, 0),
+    'diff': (lambda: py_date.diff(other_date), 8, 124),
+    'end_of': (lambda: py_date.end_of(DatePart.MONTH), 5, 80),
+    'format_many': (lambda: PyDate.format_many([py_date, other_date], '%Y-%m-%d'), 6, 510),
+    'from_epoch': (lambda: PyDate.from_epoch(1704103200), 9, 240),
+    'from_epoch_many': (lambda: PyDate.from_epoch_many([1704103200, 1704189600]), 14, 764),
+    'from_value': (lambda: PyDate.from_value(date(2024, 5, 15)), 6, 136),
+    'granularity_key': (lambda: py_date.granularity_key(DatePart.MONTH), 3, 16),
+    'is_after': (lambda: py_date.is_after(other_date), 2, 16),
+    'is_before': (lambda: py_date.is_before(other_date), 2, 16),
+    'is_between': (lambda: py_date.is_between(other_date, py_date), 2, 16),
+    'is_same': (lambda: py_date.is_same(other_date, DatePart.MONTH), 4, 152),
+    'is_same_or_after': (lambda: py_date.is_same_or_after(other_date), 2, 16),
+    'is_same_or_before': (lambda: py_date.is_same_or_before(other_date), 2, 16),
+    'iter': (lambda: list(PyDate.iter(start=py_date, max_steps=3)), 16, 632),
+    'max_day': (lambda: py_date.max_day, 2, 8),
+    'month_grid': (lambda: PyDate.month_grid(2024, 5), 2, 240),
+    'parse_date': (lambda: PyDate.parse_date(value='15-05-2024', fmt='%d-%m-%Y'), 15, 1326),
+    'py_datetime': (lambda: py_date.py_datetime(hour=10), 14, 436),
+    'replace': (lambda: py_date.replace(day=1), 3, 136),
+    'rounded_diff': (lambda: py_date.rounded_diff(other_date), 8, 124),
+    'set': (lambda: py_date.set(DatePart.DAY, 1), 5, 80),
+    'set_day': (lambda: py_date.set_day(1), 3, 136),
+    'set_days': (lambda: py_date.set_days(1), 3, 136),
+    'set_month': (lambda: py_date.set_month(1), 3, 136),
+    'set_months': (lambda: py_date.set_months(1), 3, 136),
+    'set_year': (lambda: py_date.set_year(2020), 3, 104),
+    'set_years': (lambda: py_date.set_years(2020), 3, 104),
+    'start_of': (lambda: py_date.start_of(DatePart.WEEK), 11, 88),
+    'subtract': (lambda: py_date.subtract(1, DatePart.MONTH), 8, 152),
+    'subtract_day': (py_date.subtract_day, 10, 88),
+    'subtract_days': (lambda: py_date.subtract_days(3), 10, 88),
+    'subtract_iso_years': (lambda: py_date.subtract_iso_years(1), 10, 184),
+    'subtract_month': (py_date.subtract_month, 8, 152),
+    'subtract_months': (lambda: py_date.subtract_months(3), 8, 152),
+    'subtract_quarter': (py_date.subtract_quarter, 8, 152),
+    'subtract_quarters': (lambda: py_date.subtract_quarters(2), 8, 152),
+    'subtract_week': (py_date.subtract_week, 10, 88),
+    'subtract_weeks': (lambda: py_date.subtract_weeks(2), 10, 88),
+    'subtract_year': (py_date.subtract_year, 3, 136),
+    'subtract_years': (lambda: py_date.subtract_years(2), 3, 136),
+    'to_epoch': (py_date.to_epoch, 1, 104),
+}
+
+pydatetime_budgets: dict[str, tuple[Callable[[], Any], int, int]] = {
+    'abs_diff': (lambda: py_datetime.abs_diff(other_datetime), 10, 173),
+    'add': (lambda: py_datetime.add(30, TimePart.MINUTES), 11, 296),
+    'add_hour': (py_datetime.add_hour, 10, 296),
+    'add_hours': (lambda: py_datetime.add_hours(3), 10, 296),
+    'add_microsecond': (py_datetime.add_microsecond, 10, 296),
+    'add_microseconds': (lambda: py_datetime.add_microseconds(3), 10, 296),
+    'add_minute': (py_datetime.add_minute, 10, 296),
+    'add_minutes': (lambda: py_datetime.add_minutes(3), 10, 296),
+    'add_second': (py_datetime.add_second, 10, 296),
+    'add_seconds': (lambda: py_datetime.add_seconds(3), 10, 296),
+    'align_many': (lambda: PyDateTime.align_many([py_datetime, other_datetime], (15, TimePart.MINUTES)), 13, 988),
+    'ceil_to': (lambda: py_datetime.ceil_to((15, TimePart.MINUTES)), 8, 648),
+    'diff': (lambda: py_datetime.diff(other_datetime), 9, 173),
+    'end_of': (lambda: py_datetime.end_of(TimePart.HOUR), 6, 152),
+    'floor_to': (lambda: py_datetime.floor_to((15, TimePart.MINUTES)), 8, 644),
+    'from_epoch': (lambda: PyDateTime.from_epoch(1704103200), 5, 344),
+    'from_epoch_many': (lambda: PyDateTime.from_epoch_many([1704103200, 1704189600]), 10, 800),
+    'from_value': (lambda: PyDateTime.from_value(datetime(2024, 5, 15, 10)), 9, 269),
+    'granularity_key': (lambda: py_datetime.granularity_key(TimePart.HOUR), 3, 16),
+    'is_after': (lambda: py_datetime.is_after(other_datetime), 2, 16),
+    'is_before': (lambda: py_datetime.is_before(other_datetime), 2, 16),
+    'is_between': (lambda: py_datetime.is_between(other_datetime, py_datetime), 2, 16),
+    'is_same': (lambda: py_datetime.is_same(other_datetime, TimePart.HOUR), 5, 236),
+    'is_same_or_after': (lambda: py_datetime.is_same_or_after(other_datetime), 2, 16),
+    'is_same_or_before': (lambda: py_datetime.is_same_or_before(other_datetime), 2, 16),
+    'iter': (lambda: list(PyDateTime.iter(start=py_datetime, step=TimePart.HOUR, max_steps=3)), 16, 872),
+    'py_date': (py_datetime.py_date, 8, 104),
+    'round_to': (lambda: py_datetime.round_to((15, TimePart.MINUTES)), 8, 648),
+    'rounded_diff': (lambda: py_datetime.rounded_diff(other_datetime), 10, 173),
+    'set': (lambda: py_datetime.set(TimePart.HOUR, 1), 6, 142),
+    'set_hour': (lambda: py_datetime.set_hour(1), 4, 198),
+    'set_hours': (lambda: py_datetime.set_hours(1), 4, 198),
+    'set_microsecond': (lambda: py_datetime.set_microsecond(1), 4, 204),
+    'set_microseconds': (lambda: py_datetime.set_microseconds(1), 4, 204),
+    'set_minute': (lambda: py_datetime.set_minute(1), 4, 199),
+    'set_minutes': (lambda: py_datetime.set_minutes(1), 4, 199),
+    'set_second': (lambda: py_datetime.set_second(1), 4, 199),
+    'set_seconds': (lambda: py_datetime.set_seconds(1), 4, 199),
+    'start_of': (lambda: py_datetime.start_of(DatePart.DAY), 16, 380),
+    'subtract': (lambda: py_datetime.subtract(30, TimePart.MINUTES), 11, 296),
+    'subtract_hour': (py_datetime.subtract_hour, 10, 296),
+    'subtract_hours': (lambda: py_datetime.subtract_hours(3), 10, 296),
+    'subtract_microsecond': (py_datetime.subtract_microsecond, 10, 296),
+    'subtract_microseconds': (lambda: py_datetime.subtract_microseconds(3), 10, 296),
+    'subtract_minute': (py_datetime.subtract_minute, 10, 296),
+    'subtract_minutes': (lambda: py_datetime.subtract_minutes(3), 10, 296),
+    'subtract_second': (py_datetime.subtract_second, 10, 296),
+    'subtract_seconds': (lambda: py_datetime.subtract_seconds(3), 10, 296),
+    'to_epoch': (py_datetime.to_epoch, 1, 100),
+}
+
+
+def measure(call: Callable[[], Any]) -> tuple[int, int]:
+    """
+    :return: (allocated blocks still in use after the call, peak bytes traced during the call), both relative to the
+    same measurement of a call doing nothing, so the overhead of calling and tracing isn't counted
+    """
+    blocks, peak = _measure(call)
+    baseline_blocks, baseline_peak = _measure(_no_op)
+    return blocks - baseline_blocks, peak - baseline_peak
+
+
+def _no_op():
+    return None
+
+
+def _measure(call: Callable[[], Any]) -> tuple[int, int]:
+    # Warm up caches (lru_cache, period tables, interned strings) so only per-call allocations are measured
+    call()
+    call()
+    gc.collect()
+    gc.disable()
+    # Already tracing when run with python -X tracemalloc, keep it running then
+    started = not tracemalloc.is_tracing()
+    try:
+        before = sys.getallocatedblocks()
+        result = call()
+        blocks = sys.getallocatedblocks() - before
+        del result
+        if started:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = call()
+        peak = tracemalloc.get_traced_memory()[1] - baseline
+        del result
+    finally:
+        if started and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        gc.enable()
+    return blocks, peak
+
+
+# Object sizes and allocator behaviour differ between Python versions
+@unittest.skipUnless(sys.implementation.name == 'cpython' and sys.version_info[:2] == (3, 11),
+                     'allocation budgets are measured on CPython 3.11')
+class TestAllocations(unittest.TestCase):
+    def _test_budgets(self, cls: type, budgets: dict[str, tuple[Callable[[], Any], int, int]]):
+        public_methods = {name for name in vars(cls) if not name.startswith('_')}
+        self.assertEqual(set(), public_methods - set(budgets), f'{cls.__name__} methods without allocation budget')
+        for name, (call, block_budget, byte_budget) in budgets.items():
+            with self.subTest(method=f'{cls.__name__}.{name}'):
+                blocks, peak = measure(call)
+                block_limit = math.ceil(block_budget * budget_headroom)
+                byte_limit = math.ceil(byte_budget * budget_headroom)
+                self.assertLessEqual(blocks, block_limit,
+                                     f'{cls.__name__}.{name} left {blocks} blocks allocated, budget is {block_budget}')
+                self.assertLessEqual(peak, byte_limit,
+                                     f'{cls.__name__}.{name} allocated {peak} bytes at peak, budget is {byte_budget}')
+
+    def test_pydate(self):
+        self._test_budgets(PyDate, pydate_budgets)
+
+    def test_pydatetime(self):
+        self._test_budgets(PyDateTime, pydatetime_budgets)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+import threading
+import unittest
+from datetime import datetime
+from zoneinfo import ZoneInfo
+
+from dvrd_pydate import PyDateTime, DatePart, TimePart
+from dvrd_pydate.caching import cache_per_period
+
+
+class TestCaching(unittest.TestCase):
+    def setUp(self):
+        self.now = PyDateTime(2024, 1, 1, 23, 59, 59, 999)
+        self.calls = 0
+
+    def clock(self) -> datetime:
+        return self.now
+
+    def test_expires_at_boundary(self):
+        @cache_per_period(DatePart.DAY, clock=self.clock)
+        def rate(currency: str) -> tuple[str, int]:
+            self.calls += 1
+            return currency, self.calls
+
+        self.assertEqual(('EUR', 1), rate('EUR'))
+        # 23:59:59.999 is not the end of the day yet, end_of(DAY) would expire here
+        self.now = PyDateTime(2024, 1, 1, 23, 59, 59, 999_999)
+        self.assertEqual(('EUR', 1), rate('EUR'))
+        self.assertEqual(('USD', 2), rate(currency='USD'))
+        info = rate.cache_info()
+        self.assertEqual((1, 2, 2), (info.hits, info.misses, info.currsize))
+        self.assertEqual(datetime(2024, 1, 2), info.expires_at)
+        self.now = PyDateTime(2024, 1, 2)
+        self.assertEqual(('EUR', 3), rate('EUR'))
+        self.assertEqual(1, rate.cache_info().currsize)
+        # Clock going back starts a new period as well
+        self.now = PyDateTime(2024, 1, 1, 12)
+        self.assertEqual(('EUR', 4), rate('EUR'))
+        rate.cache_clear()
+        self.assertEqual((0, 0, 0, None), tuple(rate.cache_info())[:2] + tuple(rate.cache_info())[3:])
+        self.assertEqual('rate', rate.__name__)
+
+    def test_bounded(self):
+        @cache_per_period(TimePart.HOUR, maxsize=2, clock=self.clock)
+        def square(value: int) -> int:
+            self.calls += 1
+            return value * value
+
+        square(1)
+        square(2)
+        square(1)
+        square(3)
+        self.assertEqual(2, square.cache_info().currsize)
+        calls = self.calls
+        square(1)
+        self.assertEqual(calls, self.calls)
+        square(2)
+        self.assertEqual(calls + 1, self.calls)
+
+    def test_timezone(self):
+        zone = ZoneInfo('Europe/Amsterdam')
+        # 23:30 UTC is already the next day in Amsterdam
+        self.now = PyDateTime(2024, 1, 1, 23, 30, tzinfo=ZoneInfo('UTC'))
+        cached = cache_per_period(DatePart.DAY, tz=zone, clock=lambda: self.now.astimezone(zone))(lambda: 1)
+        cached()
+        self.assertEqual(datetime(2024, 1, 3, tzinfo=zone), cached.cache_info().expires_at)
+        # Across a DST change the period ends at local midnight
+        self.now = PyDateTime(2024, 3, 31, 12, tzinfo=ZoneInfo('UTC'))
+        cached()
+        self.assertEqual(datetime(2024, 3, 31, 22, tzinfo=ZoneInfo('UTC')), cached.cache_info().expires_at)
+        self.assertIsInstance(cache_per_period(DatePart.DAY, tz=zone)(lambda: 1)(), int)
+
+    def test_threads(self):
+        @cache_per_period(DatePart.DAY, clock=self.clock)
+        def value(number: int) -> int:
+            return number
+
+        threads = [threading.Thread(target=lambda: [value(number % 10) for number in range(1000)]) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = value.cache_info()
+        self.assertEqual(4000, info.hits + info.misses)
+        self.assertEqual(10, info.currsize)
+
+    def test_validation(self):
+        self.assertRaises(ValueError, cache_per_period, DatePart.DAY, maxsize=0)
+        self.assertRaises(KeyError, cache_per_period, 'day')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import random
+import unittest
+from datetime import date, timedelta
+
+from dvrd_pydate import PyDate
+from dvrd_pydate.dateset import DateSet
+
+
+class TestDateSet(unittest.TestCase):
+    def test_basics(self):
+        values = DateSet([PyDate(2024, 1, 5), date(2024, 1, 3), '2024-01-04', date(2024, 1, 3)])
+        self.assertEqual(3, len(values))
+        self.assertIn(date(2024, 1, 4), values)
+        self.assertIn('2024-01-05', values)
+        self.assertNotIn(date(2024, 1, 2), values)
+        self.assertNotIn(date(2024, 1, 6), values)
+        self.assertEqual([date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5)], list(values))
+        self.assertIsInstance(next(iter(values)), PyDate)
+        values.add(date(2023, 12, 30))
+        values.discard(date(2024, 1, 3))
+        values.discard(date(2020, 1, 1))
+        self.assertEqual([date(2023, 12, 30), date(2024, 1, 4), date(2024, 1, 5)], list(values))
+        self.assertEqual(date(2023, 12, 30), values.first())
+        self.assertEqual(date(2024, 1, 5), values.last())
+        empty = DateSet()
+        self.assertFalse(empty)
+        self.assertEqual(0, len(empty))
+        self.assertIsNone(empty.first())
+        self.assertIsNone(empty.last())
+        self.assertEqual([], list(empty))
+        self.assertEqual(DateSet(), DateSet([date(2024, 1, 1)]) - DateSet([date(2024, 1, 1)]))
+
+    def test_operations(self):
+        rng = random.Random(7)
+        start = date(2023, 6, 1)
+        samples = [{start + timedelta(days=rng.randrange(400)) for _ in range(150)} for _ in range(3)]
+        first, second, third = (DateSet(sample) for sample in samples)
+        self.assertEqual(sorted(samples[0] | samples[1]), list(first | second))
+        self.assertEqual(sorted(samples[0] & samples[1] & samples[2]), list(first.intersection(second, third)))
+        self.assertEqual(sorted(samples[0] - samples[1]), list(first - second))
+        self.assertEqual(sorted(samples[0] ^ samples[2]), list(first ^ third))
+        self.assertTrue((first & second) <= first)
+        self.assertTrue(first.union(second) >= second)
+        self.assertFalse(first <= second)
+        self.assertEqual(first, DateSet(sorted(samples[0], reverse=True)))
+        self.assertEqual(first | DateSet(), first)
+        self.assertEqual(DateSet(), first & DateSet())
+        # Operations return new sets
+        copy = first.copy()
+        first.add(date(2030, 1, 1))
+        self.assertNotIn(date(2030, 1, 1), copy)
+
+    def test_free_days(self):
+        booked = DateSet.from_range('2024-01-01', '2024-01-05') | DateSet([date(2024, 1, 6)])
+        self.assertEqual(date(2024, 1, 5), booked.next_free(date(2024, 1, 1)))
+        self.assertEqual(date(2024, 1, 7), booked.next_free(date(2024, 1, 6)))
+        self.assertEqual(date(2023, 12, 1), booked.next_free(date(2023, 12, 1)))
+        self.assertEqual(date(2024, 2, 1), booked.next_free(date(2024, 2, 1)))
+        self.assertEqual(date(2024, 1, 6), booked.next_in(date(2024, 1, 5)))
+        self.assertEqual(date(2024, 1, 1), booked.next_in(date(2023, 1, 1)))
+        self.assertIsNone(booked.next_in(date(2024, 1, 7)))
+        self.assertEqual(date(2024, 1, 1), DateSet().next_free(date(2024, 1, 1)))
+
+    def test_intervals(self):
+        intervals = [(date(2024, 1, 1), date(2024, 1, 3)), (date(2024, 1, 10), date(2024, 2, 1))]
+        values = DateSet.from_intervals(intervals + [(date(2024, 1, 20), date(2024, 1, 20))])
+        self.assertEqual(2 + 22, len(values))
+        self.assertEqual(intervals, values.intervals())
+        self.assertEqual(intervals, DateSet(values).intervals())
+        self.assertEqual([], DateSet().intervals())
+        self.assertEqual("DateSet(['2024-01-01', '2024-01-02'])", repr(DateSet.from_range('2024-01-01', '2024-01-03')))
+
+
+if __name__ == '__main__':
+    unittest.main()
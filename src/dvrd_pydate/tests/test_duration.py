@@ -0,0 +1,96 @@
+import copy
+import pickle
+import unittest
+from datetime import date, datetime
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart
+from dvrd_pydate.duration import Duration, Interval, parse_duration, parse_interval
+
+
+class TestDuration(unittest.TestCase):
+    def test_parse(self):
+        self.assertEqual(Duration(1, 2, 3 * 3_600_000_000), parse_duration('P1M2DT3H'))
+        self.assertEqual(Duration(14, 21, 0), parse_duration('P1Y2M3W'))
+        self.assertEqual(Duration(0, 0, 90_500_000), parse_duration('PT1M30.5S'))
+        self.assertEqual(Duration(0, 1, 43_200_000_000), parse_duration('P1,5D'))
+        self.assertEqual(Duration(-1, -1, 0), parse_duration('-P1M1D'))
+        self.assertIs(parse_duration('P1M2DT3H'), parse_duration('P1M2DT3H'))
+        for invalid in ('P', 'PT', 'P1MT', '1M', 'P1.5M', 'P1H', 'PT1D', ''):
+            self.assertRaises(ValueError, parse_duration, invalid)
+
+    def test_isoformat(self):
+        for text in ('P1Y2M3DT4H5M6.5S', 'P3M', 'PT0.000001S', '-P1DT1S', 'PT0S', 'P10D'):
+            self.assertEqual(text, parse_duration(text).isoformat())
+        self.assertEqual('P1Y1M', str(parse_duration('P13M')))
+        self.assertEqual('P14D', parse_duration('P2W').isoformat())
+
+        # Differences round-trip with a single sign
+        start = PyDateTime(2024, 1, 31, 12)
+        for first, second in (('P1D', 'PT1H'), ('PT1H', 'P2DT2H'), ('P1Y', 'P1M'), ('P1D', 'PT24H')):
+            duration = parse_duration(first) - parse_duration(second)
+            self.assertEqual(duration(start), parse_duration(duration.isoformat())(start))
+        self.assertEqual('PT23H', (parse_duration('P1D') - parse_duration('PT1H')).isoformat())
+        self.assertEqual('-P1DT23H', (parse_duration('PT1H') - parse_duration('P2D')).isoformat())
+        # Months and days of different signs can't be written as one duration
+        self.assertRaises(ValueError, (parse_duration('P1M') - parse_duration('P1D')).isoformat)
+
+    def test_apply(self):
+        duration = parse_duration('P1M2DT3H')
+        self.assertEqual(datetime(2024, 3, 2, 13), duration(PyDateTime(2024, 1, 31, 10)))
+        self.assertIsInstance(duration(datetime(2024, 1, 31, 10)), PyDateTime)
+        self.assertEqual(date(2024, 3, 2), parse_duration('P1M2D')(PyDate(2024, 1, 31)))
+        self.assertEqual(date(2023, 12, 31), parse_duration('-P1M')(PyDate(2024, 1, 31)))
+        self.assertEqual(date(2023, 2, 28), parse_duration('-P1Y')(date(2024, 2, 29)))
+        self.assertEqual(date(2024, 2, 29), parse_duration('P1M')('2024-01-31'))
+        self.assertEqual(datetime(2024, 1, 31, 1), parse_duration('PT1H')('2024-01-31'))
+        self.assertRaises(TypeError, parse_duration('PT1H'), PyDate(2024, 1, 31))
+        self.assertEqual(date(2024, 1, 1), (-(-parse_duration('P1D')))(date(2023, 12, 31)))
+
+    def test_arithmetic(self):
+        first, second = parse_duration('P1M'), parse_duration('P2DT1H')
+        self.assertEqual(Duration(1, 2, 3_600_000_000), first + second)
+        self.assertEqual(Duration(1, -2, -3_600_000_000), first - second)
+        self.assertNotEqual((1, 0, 0), first)
+        self.assertNotIsInstance(first, tuple)
+        self.assertEqual(hash(Duration(1)), hash(first))
+        self.assertFalse(Duration())
+        self.assertEqual({first}, {Duration(months=1)})
+        with self.assertRaises(AttributeError):
+            first.months = 2
+        self.assertEqual(first, pickle.loads(pickle.dumps(first)))
+        self.assertEqual(first, copy.deepcopy(first))
+        self.assertEqual('Duration(months=1, days=0, microseconds=0)', repr(first))
+        self.assertRaises(TypeError, lambda: first + (1, 0, 0))
+
+    def test_iter(self):
+        self.assertEqual([date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 29)],
+                         list(PyDate.iter(start=PyDate(2024, 1, 31), step=parse_duration('P1M'), max_steps=3)))
+        self.assertEqual([datetime(2024, 1, 1), datetime(2024, 1, 1, 1, 30), datetime(2024, 1, 1, 3)],
+                         list(PyDateTime.iter(start=PyDateTime(2024, 1, 1), end=PyDateTime(2024, 1, 1, 4),
+                                              step=parse_duration('PT1H30M'))))
+
+    def test_interval(self):
+        self.assertEqual(Interval(date(2024, 1, 1), date(2024, 2, 1)), parse_interval('2024-01-01/P1M'))
+        self.assertEqual(Interval(date(2024, 1, 1), date(2024, 1, 3)), parse_interval('2024-01-01/2024-01-03'))
+        self.assertEqual(Interval(datetime(2024, 1, 1, 22), datetime(2024, 1, 2)),
+                         parse_interval('PT2H/2024-01-02T00:00:00'))
+        # Dates with a time duration are promoted to PyDateTime
+        interval = parse_interval('2024-01-01/PT12H')
+        self.assertEqual(Interval(datetime(2024, 1, 1), datetime(2024, 1, 1, 12)), interval)
+        self.assertIsInstance(interval.start, PyDateTime)
+        self.assertEqual(Interval(datetime(2023, 12, 30, 12), datetime(2024, 1, 1)), parse_interval('P1DT12H/2024-01-01'))
+        interval = parse_interval('2024-01-01/P1W')
+        self.assertIs(interval, parse_interval('2024-01-01/P1W'))
+        self.assertEqual(7, len(list(interval.iter())))
+        self.assertEqual([date(2024, 1, 1), date(2024, 1, 4), date(2024, 1, 7)],
+                         list(interval.iter(parse_duration('P3D'))))
+        self.assertEqual(2, len(list(parse_interval('2024-01-01T00:00/P1D').iter((12, 'hours')))))
+        self.assertEqual(1, len(list(interval.iter(DatePart.WEEK))))
+        self.assertIn(date(2024, 1, 7), interval)
+        self.assertNotIn(date(2024, 1, 8), interval)
+        for invalid in ('2024-01-01', '/P1D', 'P1D/P1D', '2024-01-01/'):
+            self.assertRaises(ValueError, parse_interval, invalid)
+
+
+if __name__ == '__main__':
+    unittest.main()
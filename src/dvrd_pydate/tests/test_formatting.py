@@ -0,0 +1,44 @@
+import io
+import unittest
+from datetime import date, datetime
+
+from dvrd_pydate import PyDate, PyDateTime
+from dvrd_pydate.formatting import compile_formatter, format_many, tokenize_format
+
+
+class TestFormatting(unittest.TestCase):
+    def test_tokenize_format(self):
+        self.assertEqual([(True, 'Y'), (False, '-'), (True, 'm')], tokenize_format('%Y-%m'))
+        self.assertEqual([(False, '%Y at '), (True, 'H')], tokenize_format('%%Y at %H'))
+
+    def test_compile_formatter(self):
+        patterns = ['%Y-%m-%d %H:%M:%S.%f', '%d/%m/%y %I%p', '%a %A %b %B %j %w %u', '%%Y literal %', '%z %Y', 'text',
+                    '%H']
+        values = [PyDateTime(2024, 3, 5, 13, 4, 5, 12), PyDate(2024, 12, 31), datetime(2024, 1, 7),
+                  date(2023, 2, 28), date(35, 1, 2), PyDateTime(999, 12, 31, 23)]
+        for pattern in patterns:
+            formatter = compile_formatter(pattern)
+            for value in values:
+                self.assertEqual(value.strftime(pattern), formatter(value))
+
+        # Cached per pattern
+        self.assertIs(compile_formatter('%Y-%m-%d'), PyDate.compile_formatter('%Y-%m-%d'))
+        self.assertEqual('2024-01-01T12:00:00', compile_formatter()(PyDateTime(2024, 1, 1, 12)))
+
+    def test_format_many(self):
+        values = [PyDate(2024, 1, 1), PyDate(2024, 1, 2), PyDate(2024, 1, 3)]
+        self.assertEqual('01-01-2024,02-01-2024,03-01-2024', format_many(values, '%d-%m-%Y', separator=','))
+        self.assertEqual('2024-01-01\n2024-01-02\n2024-01-03', PyDate.format_many(values))
+        self.assertEqual('', format_many([], '%Y'))
+
+        out = io.StringIO()
+        self.assertIsNone(format_many(values, '%Y%m%d', out=out, chunk_size=2))
+        self.assertEqual('20240101\n20240102\n20240103', out.getvalue())
+
+        out = io.BytesIO()
+        format_many(values, out=out, chunk_size=1)
+        self.assertEqual(b'2024-01-01\n2024-01-02\n2024-01-03', out.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+from datetime import date
+
+from dvrd_pydate import PyDate, DatePart
+from dvrd_pydate.grid import month_grid
+
+
+class TestGrid(unittest.TestCase):
+    def test_month_grid(self):
+        grid = PyDate.month_grid(2024, 2)
+        self.assertEqual(5, len(grid.weeks))
+        self.assertEqual(date(2024, 1, 29), grid.weeks[0][0])
+        self.assertEqual(date(2024, 3, 3), grid.weeks[-1][-1])
+        self.assertEqual((5, 6, 7, 8, 9), grid.week_numbers)
+        self.assertEqual((False, False, False, True, True, True, True), grid.in_month[0])
+        self.assertEqual(29, sum(day for week in grid.in_month for day in week))
+        for week in grid.weeks:
+            self.assertEqual(week[0].start_of(DatePart.WEEK), week[0])
+            self.assertIsInstance(week[0], PyDate)
+
+    def test_week_start(self):
+        # 2024-09-01 is a Sunday
+        grid = month_grid(2024, 9, week_start=6)
+        self.assertEqual(date(2024, 9, 1), grid.weeks[0][0])
+        self.assertEqual(5, len(grid.weeks))
+        self.assertEqual(36, grid.week_numbers[0])
+        self.assertEqual(6, len(month_grid(2024, 9).weeks))
+        self.assertRaises(ValueError, month_grid, 2024, 9, 7)
+
+    def test_cached(self):
+        self.assertIs(PyDate.month_grid(2024, 5), month_grid(2024, 5, 0))
+        self.assertIsNot(month_grid(2024, 5), month_grid(2024, 5, 6))
+
+
+if __name__ == '__main__':
+    unittest.main()
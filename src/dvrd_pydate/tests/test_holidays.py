@@ -0,0 +1,74 @@
+import unittest
+from datetime import date, datetime
+
+from dvrd_pydate import PyDate, PyDateTime
+from dvrd_pydate.holidays import HolidayCalendar, FixedHoliday, EasterHoliday, NthWeekdayHoliday, easter
+
+
+class TestHolidays(unittest.TestCase):
+    def test_easter(self):
+        known = {1818: date(1818, 3, 22), 1943: date(1943, 4, 25), 2019: date(2019, 4, 21), 2024: date(2024, 3, 31),
+                 2025: date(2025, 4, 20), 2038: date(2038, 4, 25), 2285: date(2285, 3, 22)}
+        for year, expected in known.items():
+            self.assertEqual(expected, easter(year))
+        self.assertIsInstance(easter(2024), PyDate)
+
+    def test_nth_weekday(self):
+        # Fourth Thursday of November, last Monday of May
+        self.assertEqual(date(2024, 11, 28), NthWeekdayHoliday('Thanksgiving', 11, 3, 4).date_in(2024))
+        self.assertEqual(date(2024, 5, 27), NthWeekdayHoliday('Memorial Day', 5, 0, -1).date_in(2024))
+        self.assertEqual(date(2024, 5, 20), NthWeekdayHoliday('', 5, 0, -2).date_in(2024))
+        self.assertEqual(date(2024, 9, 2), NthWeekdayHoliday('Labor Day', 9, 0, 1).date_in(2024))
+        self.assertIsNone(NthWeekdayHoliday('', 2, 0, 5).date_in(2024))
+        self.assertIsNone(FixedHoliday('', 2, 29).date_in(2023))
+        for year in range(2000, 2030):
+            for n in (1, 2, 3, 4, -1):
+                mondays = [day for day in PyDate.iter(start=PyDate(year, 1, 1), end=PyDate(year, 2, 1))
+                           if day.weekday() == 0]
+                self.assertEqual(mondays[n if n < 0 else n - 1], NthWeekdayHoliday('', 1, 0, n).date_in(year))
+
+    def test_calendar(self):
+        calendar = HolidayCalendar([
+            FixedHoliday('New Year', 1, 1, 'nearest_weekday'),
+            EasterHoliday('Good Friday', -2),
+            EasterHoliday('Easter Monday', 1),
+            FixedHoliday('Independence Day', 7, 4, 'nearest_weekday'),
+            FixedHoliday('Christmas Day', 12, 25, 'next_weekday'),
+            FixedHoliday('Boxing Day', 12, 26, 'next_weekday'),
+        ])
+        self.assertTrue(calendar.is_holiday(PyDate(2024, 3, 29)))
+        self.assertTrue(calendar.is_holiday('2024-04-01'))
+        self.assertFalse(calendar.is_holiday(date(2024, 4, 2)))
+        # 2026-07-04 is a Saturday
+        self.assertEqual('Independence Day (observed)', calendar.holiday_name(date(2026, 7, 3)))
+        self.assertEqual('Independence Day', calendar.holiday_name(date(2026, 7, 4)))
+        # 2021-12-25 is a Saturday, Boxing Day a Sunday and the Monday is taken
+        self.assertEqual('Christmas Day (observed)', calendar.holiday_name(date(2021, 12, 27)))
+        self.assertEqual('Boxing Day (observed)', calendar.holiday_name(date(2021, 12, 28)))
+        # 2022-01-01 is a Saturday, observed in the previous year
+        self.assertEqual('New Year (observed)', calendar.holiday_name(date(2021, 12, 31)))
+        self.assertIsNone(calendar.holiday_name(date(2021, 12, 30)))
+        # Datetimes are looked up by their day
+        self.assertTrue(calendar.is_holiday(PyDateTime(2024, 12, 25, 10)))
+        self.assertEqual('Christmas Day', calendar.holiday_name(datetime(2024, 12, 25)))
+        self.assertFalse(calendar.is_holiday(datetime(2024, 12, 24, 23, 59)))
+        holidays = calendar.holidays(2024)
+        self.assertEqual(sorted(holidays), list(holidays))
+        self.assertIs(holidays, calendar.holidays(2024))
+        # Computed per calendar
+        self.assertEqual(holidays, HolidayCalendar(calendar.rules).holidays(2024))
+        with self.assertRaises(TypeError):
+            holidays[date(2024, 1, 2)] = 'x'
+        self.assertEqual([(date(2024, 3, 29), 'Good Friday'), (date(2024, 4, 1), 'Easter Monday')],
+                         calendar.between(date(2024, 3, 1), date(2024, 7, 4)))
+
+    def test_combine(self):
+        first = HolidayCalendar([FixedHoliday('A', 5, 5)])
+        second = HolidayCalendar([FixedHoliday('B', 5, 5)])
+        self.assertEqual('A, B', (first + second).holiday_name(date(2024, 5, 5)))
+        self.assertEqual(first, HolidayCalendar([FixedHoliday('A', 5, 5)]))
+        self.assertEqual(hash(first), hash(HolidayCalendar([FixedHoliday('A', 5, 5)])))
+
+
+if __name__ == '__main__':
+    unittest.main()
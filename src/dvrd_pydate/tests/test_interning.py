@@ -0,0 +1,82 @@
+import threading
+import unittest
+from datetime import timedelta
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart
+from dvrd_pydate.interning import interning, enable_interning, disable_interning, active_intern_table, InternTable
+
+
+class TestInterning(unittest.TestCase):
+    def test_scoped(self):
+        self.assertIsNot(PyDate(2024, 1, 1), PyDate(2024, 1, 1))
+        with interning() as table:
+            value = PyDate(2024, 1, 1)
+            self.assertIs(value, PyDate('2024-01-01'))
+            self.assertIs(value, PyDate(2023, 12, 31) + timedelta(days=1))
+            self.assertIs(value, PyDate(2024, 1, 2).subtract(1, DatePart.DAY))
+            self.assertIs(value, PyDate(2024, 1, 15).start_of(DatePart.MONTH))
+            self.assertIn(value, table)
+            # PyDateTime is never interned
+            self.assertIsNot(PyDateTime(2024, 1, 1), PyDateTime(2024, 1, 1))
+
+            stats = table.stats()
+            self.assertEqual(4, stats.hits)
+            self.assertGreater(stats.saved_bytes, 0)
+        self.assertIsNone(active_intern_table())
+        # Without a table nothing is interned, the class itself is never changed
+        replace = PyDate.__dict__['replace']
+        self.assertIsNot(PyDate(2024, 1, 2).replace(day=1), PyDate(2024, 1, 1))
+        with interning():
+            self.assertIs(replace, PyDate.__dict__['replace'])
+            self.assertIs(PyDate(2024, 1, 2).replace(day=1), PyDate(2024, 2, 1).replace(month=1))
+        self.assertIs(replace, PyDate.__dict__['replace'])
+
+    def test_bounded(self):
+        with interning(maxsize=2) as table:
+            values = [PyDate(2024, 1, day) for day in range(1, 6)]
+            self.assertEqual(2, len(table))
+            self.assertIs(values[0], PyDate(2024, 1, 1))
+            self.assertIsNot(values[4], PyDate(2024, 1, 5))
+            table.clear()
+            self.assertEqual(0, len(table))
+            self.assertEqual(0, table.stats().hits)
+
+    def test_global(self):
+        table = enable_interning()
+        try:
+            self.assertIs(PyDate(2024, 1, 1), PyDate(2024, 1, 1))
+            with interning() as scoped:
+                PyDate(2024, 1, 1)
+                self.assertIs(scoped, active_intern_table())
+            self.assertIs(table, active_intern_table())
+        finally:
+            disable_interning()
+        self.assertIsNone(active_intern_table())
+
+    def test_threads(self):
+        table = InternTable()
+        barrier = threading.Barrier(4)
+        results = [[] for _ in range(4)]
+
+        def work(index: int):
+            barrier.wait()
+            for day in range(1, 29):
+                results[index].append(table.intern(PyDate(2024, 2, day)))
+
+        threads = [threading.Thread(target=work, args=(index,)) for index in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # Every thread got the same canonical instances
+        for result in results[1:]:
+            for first, value in zip(results[0], result):
+                self.assertIs(first, value)
+        self.assertEqual(28, len(table))
+        self.assertEqual(4 * 28, table.hits + table.misses)
+        table.clear()
+        self.assertEqual(0, table.hits + table.misses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import io
+import json
+import unittest
+from datetime import date, datetime
+
+from dvrd_pydate import PyDate, PyDateTime, LazyPyDateTime
+from dvrd_pydate.json_io import dumps, dump, loads, load
+
+
+class TestJsonIO(unittest.TestCase):
+    def setUp(self):
+        self.payload = {
+            'day': PyDate(2024, 5, 15),
+            'items': [{'created': PyDateTime(2024, 5, 15, 10, 30), 'name': 'a'},
+                      {'created': datetime(2024, 5, 16, 8), 'name': 'b', 'day': date(2024, 5, 16)}],
+            'raw': LazyPyDateTime('2024-05-15T10:30:00'),
+        }
+
+    def test_dumps(self):
+        expected = json.dumps(self.payload, default=lambda value: str(value) if isinstance(value, LazyPyDateTime)
+                              else value.isoformat())
+        self.assertEqual(expected, dumps(self.payload))
+        self.assertFalse(self.payload['raw'].is_resolved)
+        self.assertEqual('["15-05-2024", "2024-05-15 10:30"]',
+                         dumps([PyDate(2024, 5, 15), PyDateTime(2024, 5, 15, 10, 30)], date_format='%d-%m-%Y',
+                               datetime_format='%Y-%m-%d %H:%M'))
+        self.assertRaises(TypeError, dumps, {'value': object()})
+
+    def test_dump(self):
+        values = [{'day': PyDate(2024, 1, day)} for day in range(1, 8)]
+        out = io.StringIO()
+        dump(values, out, chunk_size=3)
+        self.assertEqual(dumps(values), out.getvalue())
+        out = io.StringIO()
+        dump(self.payload, out, indent=2)
+        self.assertEqual(dumps(self.payload, indent=2), out.getvalue())
+        out = io.StringIO()
+        dump([], out)
+        self.assertEqual('[]', out.getvalue())
+
+    def test_loads_keys(self):
+        text = dumps(self.payload)
+        result = loads(text, fields={'created': PyDateTime, 'day': PyDate})
+        self.assertEqual(date(2024, 5, 15), result['day'])
+        self.assertIsInstance(result['day'], PyDate)
+        created = result['items'][0]['created']
+        self.assertIsInstance(created, LazyPyDateTime)
+        self.assertFalse(created.is_resolved)
+        self.assertEqual(datetime(2024, 5, 15, 10, 30), created)
+        self.assertEqual(date(2024, 5, 16), result['items'][1]['day'])
+        # Not listed
+        self.assertEqual('2024-05-15T10:30:00', result['raw'])
+
+        result = loads(text, fields={'created': PyDateTime}, lazy=False)
+        self.assertIsInstance(result['items'][0]['created'], PyDateTime)
+
+    def test_round_trip(self):
+        # Lazy values are written back exactly as read, whichever separator the document uses
+        text = '{"a": "2024-01-05T10:00:00", "b": "2024-01-05 10:00:00", "c": "2024-01-05T10:00:00.500+01:00"}'
+        self.assertEqual(text, dumps(loads(text, fields={'a': PyDateTime, 'b': PyDateTime, 'c': PyDateTime})))
+        text = dumps(self.payload)
+        self.assertEqual(text, dumps(loads(text, fields={'created': PyDateTime, 'raw': PyDateTime})))
+
+    def test_loads_paths(self):
+        text = dumps(self.payload)
+        result = loads(text, fields={'items.*.created': PyDateTime, 'items.1.day': PyDate, 'raw': PyDateTime})
+        self.assertEqual(datetime(2024, 5, 16, 8), result['items'][1]['created'])
+        self.assertEqual(date(2024, 5, 16), result['items'][1]['day'])
+        # Only the given path is converted
+        self.assertEqual('2024-05-15', result['day'])
+        self.assertIsInstance(result['raw'], LazyPyDateTime)
+        self.assertEqual({'a': None}, loads('{"a": null}', fields={'a.*.b': PyDate}))
+
+        result = load(io.StringIO(text), fields={'day': PyDate})
+        self.assertEqual(date(2024, 5, 15), result['day'])
+        self.assertRaises(TypeError, loads, text, fields={'day': str})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from dvrd_pydate import PyDate, PyDateTime, Offset
+from dvrd_pydate.enums import DatePart, TimePart
+
+
+class TestOffset(unittest.TestCase):
+    def test_apply(self):
+        offset = Offset().add(1, DatePart.MONTH).start_of(DatePart.WEEK).set(DatePart.DAY, 1)
+        expected = PyDate(2024, 1, 15).add(1, DatePart.MONTH).start_of(DatePart.WEEK).set(DatePart.DAY, 1)
+        self.assertEqual(expected, offset(PyDate(2024, 1, 15)))
+        self.assertIsInstance(offset(date(2024, 1, 15)), PyDate)
+
+        offset = Offset().add('days', 2).add(3, TimePart.HOURS).subtract(1, DatePart.DAY).end_of(TimePart.HOUR)
+        result = offset(datetime(2024, 1, 1, 10, 30))
+        self.assertEqual(datetime(2024, 1, 2, 13, 59, 59, 999), result)
+        self.assertIsInstance(result, PyDateTime)
+        self.assertEqual(datetime(2024, 1, 2, 13, 59, 59, 999), offset('2024-01-01 10:30:00'))
+
+        # Month clamping matches add
+        self.assertEqual([date(2024, 2, 29), date(2024, 4, 30)],
+                         list(Offset().add(1, DatePart.MONTH).map([PyDate(2024, 1, 31), '2024-03-31'])))
+        self.assertEqual(date(2024, 2, 29), Offset().subtract(1, DatePart.QUARTER)(PyDate(2024, 5, 31)))
+        self.assertEqual(PyDate(2024, 5, 15), Offset()(PyDate(2024, 5, 15)))
+
+    def test_compose(self):
+        first = Offset().add(1, DatePart.DAY)
+        second = Offset().start_of(DatePart.MONTH)
+        self.assertEqual(date(2024, 2, 1), first.then(second)(PyDate(2024, 1, 31)))
+        self.assertEqual(date(2024, 1, 2), (second + first)(PyDate(2024, 1, 31)))
+        self.assertEqual(first, Offset().add(DatePart.DAY, 1))
+        self.assertEqual(hash(first), hash(Offset().add(DatePart.DAY, 1)))
+        # Building a new step does not change the original offset
+        self.assertEqual(1, len(first.steps))
+
+    def test_business_days(self):
+        # 2024-05-17 is a Friday
+        friday = PyDate(2024, 5, 17)
+        self.assertEqual(date(2024, 5, 20), Offset().add_business_days(1)(friday))
+        self.assertEqual(date(2024, 5, 24), Offset().add_business_days(5)(friday))
+        self.assertEqual(date(2024, 5, 16), Offset().add_business_days(-1)(friday))
+        self.assertEqual(date(2024, 5, 20), Offset().add_business_days(1)(PyDate(2024, 5, 18)))
+        self.assertEqual(date(2024, 5, 17), Offset().add_business_days(-1)(PyDate(2024, 5, 19)))
+        self.assertEqual(date(2024, 5, 13), Offset().add_business_days(-5)(PyDate(2024, 5, 20)))
+        self.assertEqual(datetime(2024, 5, 21, 9), Offset().add_business_days(2)(PyDateTime(2024, 5, 17, 9)))
+        # Matches stepping one business day at a time
+        for start in PyDate.iter(start=PyDate(2024, 5, 1), max_steps=14):
+            for days in range(-12, 13):
+                current = start
+                for _ in range(abs(days)):
+                    current = current + timedelta(days=1 if days > 0 else -1)
+                    while current.weekday() >= 5:
+                        current = current + timedelta(days=1 if days > 0 else -1)
+                self.assertEqual(current, Offset().add_business_days(days)(start), (start, days))
+
+    def test_weekdays(self):
+        wednesday = PyDate(2024, 5, 15)
+        self.assertEqual(date(2024, 5, 20), Offset().next_weekday(0)(wednesday))
+        self.assertEqual(date(2024, 5, 22), Offset().next_weekday(2)(wednesday))
+        self.assertEqual(date(2024, 5, 13), Offset().previous_weekday(0)(wednesday))
+        self.assertEqual(date(2024, 5, 8), Offset().previous_weekday(2)(wednesday))
+        self.assertRaises(ValueError, Offset().next_weekday, 7)
+
+    def test_validation(self):
+        self.assertRaises(ValueError, Offset().add, 1, 'not_a_part')
+        self.assertRaises(KeyError, Offset().start_of, 'not_a_part')
+        self.assertRaises(KeyError, Offset().set, 1, DatePart.WEEK)
+        self.assertRaises(TypeError, Offset().add(1, TimePart.HOUR), PyDate(2024, 1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
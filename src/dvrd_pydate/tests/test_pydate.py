@@ -1,8 +1,10 @@
+import threading
 import unittest
 from calendar import monthrange
 from datetime import date, timedelta
+from zoneinfo import ZoneInfo
 
-from dvrd_pydate import PyDateTime
+from dvrd_pydate import PyDateTime, FiscalCalendar
 from dvrd_pydate.enums import DatePart, TimePart
 from dvrd_pydate.pydate import PyDate
 
@@ -464,6 +466,91 @@ class TestPyDate(unittest.TestCase):
     def test_py_datetime(self):
         self.assertEqual(PyDateTime(2024, 1, 1, 0, 0, 0), PyDate(2024, 1, 1).py_datetime())
 
+    def test_periods(self):
+        value = PyDate(2024, 5, 15)
+
+        # Quarter
+        self.assertEqual(date(2024, 4, 1), value.start_of(DatePart.QUARTER))
+        self.assertEqual(date(2024, 6, 30), value.end_of(DatePart.QUARTERS))
+        self.assertEqual(date(2024, 8, 15), value.add(1, DatePart.QUARTER))
+        self.assertEqual(date(2023, 11, 15), value.subtract(2, 'quarters'))
+        self.assertEqual([date(2024, 1, 31), date(2024, 4, 30), date(2024, 7, 30)],
+                         list(PyDate.iter(start='2024-01-31', step=DatePart.QUARTER, max_steps=3)))
+        self.assertEqual(1, PyDate(2024, 7, 1).diff(PyDate(2024, 4, 1), granularity=DatePart.QUARTER))
+        self.assertEqual(value.granularity_key(DatePart.QUARTER), PyDate(2024, 4, 1).granularity_key(DatePart.QUARTER))
+        self.assertLess(value.granularity_key(DatePart.QUARTER), PyDate(2024, 7, 1).granularity_key(DatePart.QUARTER))
+
+        # ISO year, 2026-12-31 is in ISO week 53 of 2026
+        self.assertEqual(date(2025, 12, 29), PyDate(2026, 12, 31).start_of(DatePart.ISO_YEAR))
+        self.assertEqual(date(2027, 1, 3), PyDate(2026, 12, 31).end_of(DatePart.ISO_YEAR))
+        self.assertEqual(2026, PyDate(2027, 1, 2).granularity_key(DatePart.ISO_YEAR))
+        # 2021 has no week 53
+        self.assertEqual(date(2021, 12, 30), PyDate(2020, 12, 31).add(1, DatePart.ISO_YEAR))
+        self.assertEqual(date(2020, 12, 24), PyDate(2021, 12, 30).subtract(1, DatePart.ISO_YEARS))
+
+        # Fiscal year
+        self.assertEqual(date(2024, 1, 1), value.start_of(DatePart.FISCAL_YEAR))
+        calendar = FiscalCalendar(10)
+        with calendar.activate():
+            self.assertEqual(date(2023, 10, 1), value.start_of(DatePart.FISCAL_YEAR))
+            self.assertEqual(date(2024, 9, 30), value.end_of(DatePart.FISCAL_YEAR))
+            self.assertEqual(date(2024, 4, 1), value.start_of(DatePart.FISCAL_QUARTER))
+            self.assertEqual(2023, value.granularity_key(DatePart.FISCAL_YEAR))
+            self.assertEqual(2024, PyDate(2024, 10, 1).granularity_key(DatePart.FISCAL_YEAR))
+            self.assertEqual(1, PyDate(2024, 10, 1).diff(PyDate(2023, 10, 1), granularity=DatePart.FISCAL_YEAR))
+            self.assertEqual(date(2025, 5, 15), value.add(1, DatePart.FISCAL_YEAR))
+            # Nested calendars and other threads are independent
+            with FiscalCalendar(4).activate():
+                self.assertEqual(date(2024, 4, 1), value.start_of(DatePart.FISCAL_YEAR))
+            results = []
+            thread = threading.Thread(target=lambda: results.append(value.start_of(DatePart.FISCAL_YEAR)))
+            thread.start()
+            thread.join()
+            self.assertEqual([date(2024, 1, 1)], results)
+            self.assertEqual(date(2023, 10, 1), value.start_of(DatePart.FISCAL_YEAR))
+        self.assertEqual(date(2024, 1, 1), value.start_of(DatePart.FISCAL_YEAR))
+        # Without activating
+        self.assertEqual(date(2023, 10, 1), calendar.start_of(value))
+        self.assertEqual(PyDateTime(2024, 6, 30, 23, 59, 59, 999),
+                         calendar.end_of(PyDateTime(2024, 5, 15, 10), DatePart.FISCAL_QUARTER))
+        self.assertEqual((2023, 3), (calendar.fiscal_year(value), calendar.fiscal_quarter(value)))
+        self.assertEqual((2024, 1), (calendar.fiscal_year(date(2024, 10, 1)), calendar.fiscal_quarter(date(2024, 10, 1))))
+        self.assertEqual(date(2024, 1, 1), value.start_of(DatePart.FISCAL_YEAR))
+        self.assertEqual(FiscalCalendar(10), calendar)
+        self.assertRaises(ValueError, FiscalCalendar, 13)
+
+        # Periods running past date.max end at 9999-12-31
+        last = PyDate(9999, 12, 31)
+        for part in (DatePart.QUARTER, DatePart.ISO_YEAR, DatePart.FISCAL_YEAR, DatePart.FISCAL_QUARTER):
+            self.assertEqual(last, last.end_of(part))
+            self.assertEqual(0, last.diff(last, granularity=part))
+        self.assertEqual(date(9999, 10, 1), last.start_of(DatePart.QUARTER))
+        self.assertEqual(date(9999, 1, 4), last.start_of(DatePart.ISO_YEAR))
+        self.assertEqual(9999, last.granularity_key(DatePart.ISO_YEAR))
+        self.assertEqual(date(9999, 3, 31), PyDate(9999, 1, 1).end_of(DatePart.QUARTER))
+        with calendar.activate():
+            self.assertEqual(date(9999, 10, 1), last.start_of(DatePart.FISCAL_YEAR))
+            self.assertEqual(last, last.end_of(DatePart.FISCAL_YEAR))
+
+    def test_granularity_key(self):
+        value = PyDate(2024, 5, 15)
+        self.assertEqual(value.toordinal(), value.granularity_key())
+        self.assertEqual(value.granularity_key(DatePart.WEEK), PyDate(2024, 5, 13).granularity_key(DatePart.WEEK))
+        self.assertNotEqual(value.granularity_key(DatePart.WEEK), PyDate(2024, 5, 12).granularity_key(DatePart.WEEK))
+        self.assertEqual(2024 * 12 + 4, value.granularity_key(DatePart.MONTH))
+        self.assertEqual(2024, value.granularity_key(DatePart.YEAR))
+        self.assertRaises(KeyError, value.granularity_key, TimePart.HOUR)
+
+    def test_epoch(self):
+        self.assertEqual(date(2024, 1, 1), PyDate.from_epoch(1704103200))
+        self.assertEqual(date(2024, 1, 2), PyDate.from_epoch(1704150000, tz=ZoneInfo('Asia/Tokyo')))
+        self.assertEqual(date(1969, 12, 31), PyDate.from_epoch(-1))
+        self.assertEqual([date(1970, 1, 1), date(1970, 1, 2), date(1969, 12, 31)],
+                         PyDate.from_epoch_many([0, 86_400_000, -1], 'ms'))
+        self.assertEqual(86400, PyDate(1970, 1, 2).to_epoch())
+        self.assertEqual(86_400_000, PyDate(1970, 1, 2).to_epoch('ms'))
+        self.assertRaises(ValueError, PyDate(1970, 1, 2).to_epoch, 'days')
+
 
 if __name__ == '__main__':
     unittest.main()
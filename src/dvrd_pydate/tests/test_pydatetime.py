@@ -1,9 +1,10 @@
 import unittest
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, timezone
+from zoneinfo import ZoneInfo
 
 from dvrd_pydate import PyDate
 from dvrd_pydate.enums import DatePart, TimePart
-from dvrd_pydate.pydatetime import PyDateTime
+from dvrd_pydate.pydatetime import PyDateTime, LazyPyDateTime
 
 
 class TestPyDateTime(unittest.TestCase):
@@ -231,6 +232,127 @@ class TestPyDateTime(unittest.TestCase):
         self.assertEqual(datetime(2024, 1, 1, 0, 0, 2), pydate.set(TimePart.SECONDS, 2))
         self.assertEqual(datetime(2024, 1, 1, 0, 0, 0, 2), pydate.set(TimePart.MICROSECOND, 2))
 
+    def test_alignment(self):
+        value = PyDateTime(2024, 5, 15, 10, 37, 31, 5)
+
+        self.assertEqual(datetime(2024, 5, 15, 10, 30), value.floor_to((15, TimePart.MINUTES)))
+        self.assertEqual(datetime(2024, 5, 15, 10, 45), value.ceil_to((15, TimePart.MINUTES)))
+        self.assertEqual(datetime(2024, 5, 15, 10, 45), value.round_to((15, TimePart.MINUTES)))
+        self.assertEqual(datetime(2024, 5, 15, 6), value.floor_to((6, 'hours')))
+        self.assertEqual(datetime(2024, 5, 15, 12), value.round_to((6, TimePart.HOURS)))
+
+        # Weeks align to Monday, like start_of
+        self.assertEqual(value.start_of(DatePart.WEEK), value.floor_to(DatePart.WEEK))
+
+        # Calendar steps
+        self.assertEqual(datetime(2024, 4, 1), value.floor_to((3, DatePart.MONTHS)))
+        self.assertEqual(datetime(2024, 7, 1), value.ceil_to((3, DatePart.MONTHS)))
+        self.assertEqual(datetime(2025, 1, 1), value.ceil_to(DatePart.YEAR))
+        self.assertEqual(datetime(2024, 5, 1), PyDateTime(2024, 5, 1).ceil_to(DatePart.MONTH))
+        self.assertEqual(value.start_of(DatePart.QUARTER), value.floor_to(DatePart.QUARTER))
+        self.assertEqual(datetime(2024, 7, 1), value.ceil_to(DatePart.QUARTER))
+        self.assertEqual(datetime(2024, 4, 1), value.round_to(DatePart.QUARTER))
+        self.assertEqual(datetime(2024, 1, 1), value.floor_to((2, DatePart.QUARTERS)))
+
+        # Already aligned values are kept
+        aligned = PyDateTime(2024, 5, 15, 10, 30)
+        self.assertEqual(aligned, aligned.ceil_to((15, TimePart.MINUTES)))
+
+        # Origin
+        self.assertEqual(datetime(2024, 5, 15, 6), value.floor_to(DatePart.DAY, origin='2024-01-01 06:00:00'))
+        # Month buckets need an origin at the start of a month
+        self.assertEqual(datetime(2024, 5, 1), value.floor_to((2, DatePart.MONTH), origin='2024-03-01'))
+        self.assertRaises(ValueError, value.floor_to, (1, DatePart.MONTH), origin='2024-02-15 06:00:00')
+        self.assertRaises(ValueError, value.ceil_to, DatePart.YEAR, origin='2024-01-01 06:00:00')
+        self.assertEqual(datetime(2024, 5, 15, 10, 37, 30, 5),
+                         value.floor_to((1, TimePart.MINUTE), origin=datetime(2024, 1, 1, 0, 0, 30, 5)))
+
+        # Batch
+        result = PyDateTime.align_many(['2024-01-01 00:07:00', value], (5, TimePart.MINUTE), round_method='round')
+        self.assertEqual([datetime(2024, 1, 1, 0, 5), datetime(2024, 5, 15, 10, 40)], result)
+        self.assertTrue(all(isinstance(item, PyDateTime) for item in result))
+
+        self.assertRaises(ValueError, value.floor_to, (0, TimePart.MINUTES))
+        self.assertRaises(ValueError, value.floor_to, (1.5, DatePart.MONTH))
+        self.assertRaises(ValueError, PyDateTime.align_many, [value], DatePart.DAY, round_method='up')
+
+    def test_granularity_key(self):
+        value = PyDateTime(2024, 5, 15, 10, 37, 31, 5)
+        self.assertEqual(value.granularity_key(TimePart.HOUR), PyDateTime(2024, 5, 15, 10).granularity_key(TimePart.HOUR))
+        self.assertLess(value.granularity_key(TimePart.MINUTE), value.add_minute().granularity_key(TimePart.MINUTE))
+        self.assertEqual(value.granularity_key(TimePart.SECOND),
+                         value.set_microsecond(0).granularity_key(TimePart.SECOND))
+        self.assertNotEqual(value.granularity_key(), value.add_microsecond().granularity_key())
+        self.assertEqual(PyDate(2024, 4, 1).granularity_key(DatePart.QUARTER), value.granularity_key(DatePart.QUARTER))
+
+    def test_periods(self):
+        value = PyDateTime(2024, 5, 15, 12)
+        self.assertEqual(datetime(2024, 4, 1), value.start_of(DatePart.QUARTER))
+        self.assertEqual(datetime(2024, 6, 30, 23, 59, 59, 999), value.end_of(DatePart.QUARTER))
+        self.assertEqual(datetime(2024, 8, 15, 12), value.add(1, DatePart.QUARTER))
+        self.assertEqual(14.5, value.diff(PyDateTime(2024, 5, 1), granularity=DatePart.DAYS))
+
+    def test_lazy(self):
+        first = LazyPyDateTime('2024-01-01T10:00:00')
+        second = LazyPyDateTime('2024-01-01 09:00:00')
+        # The input is kept as is, the separator only matters when comparing
+        self.assertEqual('2024-01-01T10:00:00', first.raw)
+        self.assertEqual('2024-01-01T10:00:00', str(first))
+
+        # Same layout, compared as strings
+        self.assertTrue(first > second)
+        self.assertFalse(first == second)
+        self.assertEqual(first, LazyPyDateTime('2024-01-01 10:00:00'))
+        self.assertEqual([second, first], sorted([first, second]))
+        self.assertFalse(first.is_resolved)
+        self.assertFalse(second.is_resolved)
+
+        # Different layouts or offsets are parsed
+        self.assertEqual(first, LazyPyDateTime('2024-01-01 10:00:00.000'))
+        self.assertEqual(LazyPyDateTime('2024-01-01 10:00:00+01:00'), LazyPyDateTime('2024-01-01 09:00:00Z'))
+        self.assertTrue(LazyPyDateTime('2024-01-01 10:00:00+02:00') < LazyPyDateTime('2024-01-01 09:00:00+00:00'))
+
+        # Mixed with regular datetimes
+        self.assertEqual(datetime(2024, 1, 1, 10), first)
+        self.assertTrue(datetime(2024, 1, 1, 11) > first)
+        self.assertEqual(hash(datetime(2024, 1, 1, 10)), hash(first))
+
+        # Field access, arithmetic and conversion
+        self.assertEqual(10, first.hour)
+        self.assertTrue(first.is_resolved)
+        self.assertEqual(datetime(2024, 1, 2, 10), first + timedelta(days=1))
+        self.assertEqual(timedelta(hours=1), first - second)
+        self.assertEqual(datetime(2024, 1, 1, 10), PyDateTime.from_value(first))
+        self.assertIsInstance(PyDateTime.from_value(first), PyDateTime)
+        self.assertEqual(date(2024, 1, 1), PyDate(first))
+        self.assertTrue(PyDateTime(2024, 1, 2).is_after(first))
+        self.assertRaises(AttributeError, getattr, first, 'not_an_attribute')
+
+    def test_epoch(self):
+        self.assertEqual(datetime(2024, 1, 1, 10, tzinfo=timezone.utc), PyDateTime.from_epoch(1704103200))
+        self.assertEqual(datetime(2024, 1, 1, 10, 0, 0, 123000), PyDateTime.from_epoch(1704103200123, 'ms', None))
+        amsterdam = ZoneInfo('Europe/Amsterdam')
+        value = PyDateTime.from_epoch(1704103200123456789, 'ns', amsterdam)
+        self.assertEqual(datetime(2024, 1, 1, 11, 0, 0, 123456, tzinfo=amsterdam), value)
+        self.assertIsInstance(value, PyDateTime)
+        self.assertEqual(datetime.fromtimestamp(-1.5, timezone.utc), PyDateTime.from_epoch(-1.5))
+        # Floats are rounded to the nearest microsecond, integer nanoseconds floored
+        self.assertEqual(datetime(1970, 1, 1, 0, 0, 2), PyDateTime.from_epoch(1.9999999, 's', None))
+        self.assertEqual(datetime(1970, 1, 1, 0, 0, 0, 1), PyDateTime.from_epoch(1999, 'ns', None))
+        self.assertEqual([datetime(1970, 1, 1, 0, 0, 1), datetime(1970, 1, 1, 0, 0, 2, 500000)],
+                         PyDateTime.from_epoch_many([1, 2.5], tz=None))
+        self.assertEqual([datetime(1970, 1, 1, 1, tzinfo=amsterdam)], PyDateTime.from_epoch_many([0], 'us', amsterdam))
+
+        self.assertEqual(1704103200123456000, value.to_epoch('ns'))
+        self.assertEqual(1704103200123456, value.to_epoch('us'))
+        self.assertEqual(1704103200123, value.to_epoch('ms'))
+        self.assertEqual(1704103200, value.to_epoch())
+        # Naive values are UTC
+        self.assertEqual(1704103200, PyDateTime(2024, 1, 1, 10).to_epoch())
+        self.assertEqual(-2, PyDateTime(1969, 12, 31, 23, 59, 58, 500000).to_epoch())
+
+        self.assertRaises(ValueError, PyDateTime.from_epoch, 1, 'minutes')
+
     def test_py_date(self):
         self.assertEqual(PyDate(2024, 1, 1), PyDateTime(2024, 1, 1, 0, 0, 0).py_date())
         # Test that time doesn't matter here
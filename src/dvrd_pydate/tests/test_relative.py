@@ -0,0 +1,60 @@
+import unittest
+from datetime import date, datetime
+
+from dvrd_pydate import PyDate, PyDateTime, Offset, DatePart, TimePart
+from dvrd_pydate.relative import compile_relative, apply_relative
+
+
+class TestRelative(unittest.TestCase):
+    def test_amounts(self):
+        # 2024-05-15 is a Wednesday
+        value = PyDate(2024, 5, 15)
+        self.assertEqual(date(2024, 5, 18), apply_relative('+3 days', value))
+        self.assertEqual(date(2024, 5, 1), apply_relative('-2 weeks', value))
+        self.assertEqual(date(2024, 4, 15), apply_relative('1 month ago', value))
+        self.assertEqual(date(2024, 8, 15), apply_relative('in 1 quarter', value))
+        self.assertEqual(date(2024, 5, 20), apply_relative('+3 business days', value))
+        self.assertEqual(date(2024, 5, 10), apply_relative('3 Working Days ago', value))
+        self.assertEqual(date(2024, 5, 16), apply_relative('tomorrow', value))
+        self.assertEqual(date(2024, 5, 14), apply_relative('yesterday', value))
+        self.assertEqual(value, apply_relative('today', value))
+        self.assertEqual(datetime(2024, 5, 15, 14), apply_relative('in 4 hours', PyDateTime(2024, 5, 15, 10)))
+
+    def test_directions(self):
+        value = PyDate(2024, 5, 15)
+        self.assertEqual(date(2024, 5, 20), apply_relative('next monday', value))
+        self.assertEqual(date(2024, 5, 22), apply_relative('next wed', value))
+        self.assertEqual(date(2024, 5, 10), apply_relative('last friday', value))
+        self.assertEqual(date(2024, 6, 15), apply_relative('next month', value))
+        self.assertEqual(date(2023, 5, 15), apply_relative('previous year', value))
+
+    def test_boundaries(self):
+        value = PyDate(2024, 5, 15)
+        self.assertEqual(date(2024, 5, 31), apply_relative('end of month', value))
+        self.assertEqual(date(2024, 5, 13), apply_relative('start of week', value))
+        self.assertEqual(date(2024, 7, 1), apply_relative('beginning of the next quarter', value))
+        self.assertEqual(date(2024, 4, 30), apply_relative('end of last month', value))
+        self.assertEqual(date(2024, 6, 30), apply_relative('+3 business days, end of month', PyDate(2024, 5, 30)))
+        self.assertEqual(date(2024, 6, 3), apply_relative('end of month then next monday', value))
+        self.assertEqual(datetime(2024, 5, 15, 23, 59, 59, 999), apply_relative('end of day', PyDateTime(2024, 5, 15)))
+        self.assertEqual(date(2024, 1, 1), apply_relative('start of fiscal year', value))
+
+    def test_compiled(self):
+        offset = compile_relative('+1 month, start of month')
+        self.assertIsInstance(offset, Offset)
+        self.assertIs(offset, compile_relative('+1 month, start of month'))
+        self.assertEqual(Offset().add(1, DatePart.MONTH).start_of(DatePart.MONTH), offset)
+        self.assertEqual([date(2024, 2, 1), date(2024, 3, 1)],
+                         list(offset.map([PyDate(2024, 1, 31), '2024-02-10'])))
+        self.assertEqual(Offset().add(2, TimePart.HOURS), compile_relative('in  2  HOURS'))
+
+    def test_invalid(self):
+        self.assertRaises(ValueError, compile_relative, '')
+        self.assertRaises(ValueError, compile_relative, 'someday')
+        self.assertRaises(ValueError, compile_relative, '+3 fortnights')
+        self.assertRaises(ValueError, compile_relative, 'next funday')
+        self.assertRaises(TypeError, apply_relative, 'in 2 hours', PyDate(2024, 5, 15))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import mmap
+import tempfile
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from dvrd_pydate import PyDateTime
+from dvrd_pydate.scanner import scan_timestamps, compile_layout
+
+log = (b'2024-01-01 10:00:00 first\n'
+       b'no timestamp\n'
+       b'2024-01-01T10:00:01.5 second\n'
+       b'2024-02-30 00:00:00 invalid\n'
+       b'2024-01-02 00:00:00 third\n')
+
+
+class TestScanner(unittest.TestCase):
+    def test_iso(self):
+        result = list(scan_timestamps(log))
+        self.assertEqual([0, 39, 96], [offset for offset, _ in result])
+        self.assertEqual([datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 10, 0, 1, 500000), datetime(2024, 1, 2)],
+                         [value for _, value in result])
+        self.assertTrue(all(isinstance(value, PyDateTime) for _, value in result))
+        self.assertTrue(log[39:].startswith(b'2024-01-01T10:00:01.5'))
+
+        # Start offset
+        self.assertEqual([96], [offset for offset, _ in scan_timestamps(log, start=40)])
+
+    def test_epoch(self):
+        result = list(scan_timestamps(memoryview(log), as_epoch=True))
+        expected = [int((value - datetime(1970, 1, 1)).total_seconds() * 1_000_000) for _, value in
+                    scan_timestamps(log)]
+        self.assertEqual(expected, [value for _, value in result])
+
+    def test_until(self):
+        result = list(scan_timestamps(log, until='2024-01-01 12:00:00'))
+        self.assertEqual(2, len(result))
+        self.assertEqual(1, len(list(scan_timestamps(log, until=datetime(2024, 1, 1, 10), as_epoch=True))))
+
+    def test_utc_offset(self):
+        buffer = (b'2024-01-01T10:00:00Z utc\n'
+                  b'2024-01-01T10:00:00.25+01:30 east\n'
+                  b'2024-01-01 10:00:00-0500 west\n'
+                  b'2024-01-01 10:00:00+24:00 invalid\n'
+                  b'2024-01-01 10:00:00+01:60 invalid\n')
+        result = list(scan_timestamps(buffer))
+        self.assertEqual([datetime(2024, 1, 1, 10, tzinfo=timezone.utc),
+                          datetime(2024, 1, 1, 10, 0, 0, 250000, timezone(timedelta(hours=1, minutes=30))),
+                          datetime(2024, 1, 1, 10, tzinfo=timezone(timedelta(hours=-5)))],
+                         [value for _, value in result])
+        self.assertEqual([int(value.timestamp() * 1_000_000) for _, value in result],
+                         [value for _, value in scan_timestamps(buffer, as_epoch=True)])
+        # Offsets are taken into account when comparing to until
+        self.assertEqual(2, len(list(scan_timestamps(buffer, until='2024-01-01T10:00:00Z'))))
+        self.assertEqual(0, len(list(scan_timestamps(buffer, until='2024-01-01T10:00:00+01:00'))))
+
+    def test_layout(self):
+        with tempfile.TemporaryFile() as file:
+            file.write(b'[05/01/24 10:00] first\n[06/01/24 11:00] second\n')
+            file.flush()
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                self.assertEqual([(0, datetime(2024, 1, 5, 10)), (23, datetime(2024, 1, 6, 11))],
+                                 list(scan_timestamps(buffer, '[%d/%m/%y %H:%M]')))
+                self.assertEqual([(0, datetime(2024, 1, 5)), (23, datetime(2024, 1, 6))],
+                                 list(scan_timestamps(buffer, compile_layout('%d/%m/%y', field_offset=1))))
+
+        self.assertRaises(ValueError, compile_layout, '%d-%m %H')
+        self.assertRaises(ValueError, compile_layout, '%Y-%m-%d %Z')
+
+
+if __name__ == '__main__':
+    unittest.main()
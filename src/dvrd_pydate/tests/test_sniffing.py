@@ -0,0 +1,73 @@
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from dvrd_pydate import PyDate, PyDateTime
+from dvrd_pydate.sniffing import sniff_formats, parse_stream, StreamParser, FormatGuess
+
+
+class TestSniffing(unittest.TestCase):
+    def test_sniff(self):
+        self.assertEqual([FormatGuess('iso_date', 1.0)], sniff_formats(['2024-01-05', '2024-02-29\n']))
+        guesses = sniff_formats(['05/01/2024', '13/01/2024', '20240105', '1704412800'])
+        self.assertEqual(['day_first', 'compact', 'month_first', 'epoch_seconds'], [guess.name for guess in guesses])
+        self.assertEqual(0.5, guesses[0].confidence)
+        self.assertEqual(0.25, guesses[-1].confidence)
+        self.assertEqual([False, False, True, False], [guess.ambiguous for guess in guesses])
+        self.assertEqual([FormatGuess('day_first', 1.0, True), FormatGuess('month_first', 1.0, True)],
+                         sniff_formats(['05/01/2024', '02/03/2024']))
+        self.assertEqual(['month_first', 'day_first'],
+                         [guess.name for guess in sniff_formats(['01/13/2024', '02/05/2024', '12/31/2024'])])
+        self.assertEqual([], sniff_formats(['2024-02-30', 'nonsense']))
+        self.assertEqual([], sniff_formats([]))
+
+    def test_parse_stream(self):
+        values = ['2024-01-05', '05/01/2024', '20240105', '1704412800', '1704412800000', '2024-01-05T10:30:00Z']
+        # The sample can't tell day first from month first
+        self.assertRaises(ValueError, list, parse_stream(values))
+        results = list(parse_stream(values, day_first=True))
+        self.assertEqual([date(2024, 1, 5)] * 3, results[:3])
+        self.assertIsInstance(results[0], PyDate)
+        self.assertEqual([datetime(2024, 1, 5, tzinfo=timezone.utc)] * 2, results[3:5])
+        self.assertEqual(datetime(2024, 1, 5, 10, 30, tzinfo=timezone.utc), results[5])
+        self.assertIsInstance(results[5], PyDateTime)
+        # Month first detected from the sample, ambiguous rows follow it
+        self.assertEqual([date(2024, 1, 13), date(2024, 2, 5), date(2024, 2, 5)],
+                         list(parse_stream(['01/13/2024', '02/05/2024', '02/05/2024'])))
+        self.assertEqual([date(2024, 5, 2)], list(parse_stream(['02/05/2024'], day_first=True)))
+        self.assertEqual([date(2024, 2, 5)], list(parse_stream(['02/05/2024'], day_first=False)))
+        # Ambiguous rows after a sample without day/month values aren't guessed either
+        values = ['2024-01-05', '05/01/2024', '01/05/2024']
+        self.assertRaises(ValueError, list, parse_stream(values, sample_size=1))
+        self.assertEqual([date(2024, 1, 5), None, None, date(2024, 5, 13), date(2024, 5, 5)],
+                         list(parse_stream(values + ['13/05/2024', '05/05/2024'], sample_size=1, strict=False)))
+        self.assertEqual([date(2024, 1, 5), date(2024, 5, 1), date(2024, 1, 5)],
+                         list(parse_stream(values, sample_size=1, day_first=False)))
+        # UTC offsets of 24 hours or more are invalid
+        self.assertEqual([datetime(2024, 1, 5, 10, 30, tzinfo=timezone(timedelta(hours=1, minutes=30))), None, None],
+                         list(parse_stream(['2024-01-05T10:30:00+0130', '2024-01-05T10:30:00+25:00',
+                                            '2024-01-05T10:30:00-01:60'], strict=False)))
+
+        self.assertRaises(ValueError, list, parse_stream(['2024-01-05', 'nonsense']))
+        self.assertEqual([date(2024, 1, 5), None], list(parse_stream(['2024-01-05', 'nonsense'], strict=False)))
+
+    def test_parser(self):
+        parser = StreamParser(['iso_date'])
+        self.assertEqual(date(2024, 1, 5), parser('2024-01-05'))
+        self.assertEqual(0, parser.fallbacks)
+        self.assertEqual(date(2024, 1, 5), parser(' 2024-01-05\n'))
+        self.assertEqual(datetime(2024, 1, 5, 10, 30, 0, 120000), parser('2024-01-05 10:30:00.12'))
+        self.assertEqual(2, parser.fallbacks)
+        parser = StreamParser(['iso_date', 'compact'])
+        self.assertEqual([date(2024, 1, 5), date(2024, 1, 6)], list(parser.map(['2024-01-05', '20240106'])))
+        self.assertEqual(0, parser.fallbacks)
+        self.assertRaises(ValueError, parser, '2024-13-05')
+        # The given formats decide the day/month order of fallback values
+        self.assertEqual(date(2024, 1, 5), StreamParser(['iso_date', 'day_first'])(' 05/01/2024'))
+        self.assertIsNone(StreamParser(['iso_date'], strict=False)('05/01/2024'))
+        self.assertEqual(date(2024, 5, 1), StreamParser(['iso_date'], day_first=False)('05/01/2024'))
+        self.assertRaises(ValueError, parser, '2024-01-05 24:00')
+        self.assertRaises(KeyError, StreamParser, ['unknown'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+import random
+import unittest
+from datetime import date, datetime, timedelta, timezone
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart, TimePart
+from dvrd_pydate.sorting import sort, unique, value_counts, sort_keys
+
+
+class TestSorting(unittest.TestCase):
+    def setUp(self):
+        rng = random.Random(3)
+        base = PyDateTime(2024, 1, 1)
+        self.moments = [base + timedelta(seconds=rng.randrange(10 * 86400)) for _ in range(500)]
+        self.days = [PyDate(moment) for moment in self.moments]
+
+    def test_sort(self):
+        self.assertEqual(sorted(self.moments), sort(self.moments))
+        self.assertEqual(sorted(self.moments, reverse=True), sort(iter(self.moments), reverse=True))
+        # Bucket sort with many duplicates
+        self.assertEqual(sorted(self.days), sort(self.days))
+        self.assertEqual(sorted(self.days, reverse=True), sort(self.days, reverse=True))
+        self.assertEqual([], sort([]))
+        # Stable on truncated keys
+        by_day = sort(self.moments, granularity=DatePart.DAY)
+        self.assertEqual(sorted(self.moments, key=lambda value: value.toordinal()), by_day)
+        self.assertEqual(sorted(self.moments, key=lambda value: value.toordinal(), reverse=True),
+                         sort(self.moments, granularity=DatePart.DAY, reverse=True))
+        mixed = [datetime(2024, 1, 1, 1, tzinfo=timezone(timedelta(hours=2))), date(2024, 1, 1),
+                 datetime(2023, 12, 31, 23, 30)]
+        self.assertEqual([mixed[0], mixed[2], mixed[1]], sort(mixed))
+
+    def test_unique(self):
+        days = unique(self.moments, DatePart.DAY)
+        self.assertEqual(sorted({moment.start_of(DatePart.DAY) for moment in self.moments}), days)
+        self.assertIsInstance(days[0], PyDateTime)
+        self.assertEqual(sorted(set(self.days)), unique(self.days))
+        self.assertIsInstance(unique([date(2024, 1, 1)])[0], PyDate)
+        self.assertEqual([datetime(2024, 1, 1, 10), datetime(2024, 1, 1, 11)],
+                         unique([datetime(2024, 1, 1, 11, 5), PyDateTime(2024, 1, 1, 10, 59), datetime(2024, 1, 1, 11)],
+                                TimePart.HOUR))
+        self.assertEqual([date(2024, 1, 1), date(2024, 2, 1)],
+                         unique([date(2024, 2, 3), date(2024, 1, 5), date(2024, 1, 31)], DatePart.MONTH))
+
+    def test_value_counts(self):
+        counts = value_counts(self.days)
+        self.assertEqual(sorted(set(self.days)), list(counts))
+        self.assertEqual(len(self.days), sum(counts.values()))
+        self.assertEqual(self.days.count(self.days[0]), counts[self.days[0]])
+        weeks = value_counts(self.moments, DatePart.WEEK)
+        self.assertEqual([datetime(2024, 1, 1), datetime(2024, 1, 8)], list(weeks))
+        self.assertEqual({}, value_counts([]))
+
+    def test_sort_keys(self):
+        self.assertEqual([0, 86_400_000_000], sort_keys([datetime(1970, 1, 1), date(1970, 1, 2)]))
+        self.assertEqual([738886], sort_keys([datetime(2024, 1, 1, 12)], DatePart.DAY))
+        self.assertRaises(KeyError, sort_keys, [date(2024, 1, 1)], 'day')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,80 @@
+import sqlite3
+import unittest
+from datetime import date, datetime, timezone
+
+from dvrd_pydate import PyDate, PyDateTime
+from dvrd_pydate.sqlite import register_sqlite
+
+
+class TestSqlite(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(':memory:', detect_types=sqlite3.PARSE_DECLTYPES)
+        register_sqlite(self.connection)
+        self.connection.execute('CREATE TABLE events (day PYDATE, moment PYDATETIME)')
+        self.connection.execute('CREATE INDEX events_moment ON events (moment)')
+
+    def tearDown(self):
+        self.connection.close()
+
+    def test_storage(self):
+        self.connection.execute('INSERT INTO events VALUES (?, ?)',
+                                (PyDate(2024, 5, 15), PyDateTime(2024, 5, 15, 10, 30, 0, 5)))
+        self.assertEqual(('integer', 'integer'),
+                         self.connection.execute('SELECT typeof(day), typeof(moment) FROM events').fetchone())
+        self.assertEqual((PyDate(2024, 5, 15).toordinal(), PyDateTime(2024, 5, 15, 10, 30, 0, 5).to_epoch('us')),
+                         self.connection.execute('SELECT day + 0, moment + 0 FROM events').fetchone())
+
+        day, moment = self.connection.execute('SELECT day, moment FROM events').fetchone()
+        self.assertEqual(date(2024, 5, 15), day)
+        self.assertIsInstance(day, PyDate)
+        self.assertEqual(datetime(2024, 5, 15, 10, 30, 0, 5), moment)
+        self.assertIsInstance(moment, PyDateTime)
+
+        # Aware values are stored as UTC
+        self.connection.execute('DELETE FROM events')
+        self.connection.execute('INSERT INTO events VALUES (?, ?)',
+                                (PyDate(2024, 5, 15), PyDateTime.from_value('2024-05-15 12:00:00+02:00')))
+        self.assertEqual(datetime(2024, 5, 15, 10),
+                         self.connection.execute('SELECT moment FROM events').fetchone()[0])
+
+    def test_range_query(self):
+        values = [PyDateTime(2024, 5, 15, hour) for hour in range(24)]
+        self.connection.executemany('INSERT INTO events VALUES (?, ?)', [(value.py_date(), value) for value in values])
+        rows = self.connection.execute('SELECT moment FROM events WHERE moment >= ? AND moment < ?',
+                                       (PyDateTime(2024, 5, 15, 6), PyDateTime(2024, 5, 15, 12))).fetchall()
+        self.assertEqual(values[6:12], [row[0] for row in rows])
+
+    def test_functions(self):
+        self.connection.execute('INSERT INTO events VALUES (?, ?)',
+                                (PyDate(2024, 5, 15), PyDateTime(2024, 5, 15, 10, 30)))
+        self.connection.execute('INSERT INTO events VALUES (NULL, NULL)')
+        query = ('SELECT pydate_start_of(day, \'month\') AS "a [pydate]", pydate_end_of(day, \'week\') AS "b [pydate]", '
+                 'pydatetime_start_of(moment, \'hour\') AS "c [pydatetime]", '
+                 'pydatetime_end_of(moment, \'day\') AS "d [pydatetime]" FROM events')
+        connection = sqlite3.connect(':memory:', detect_types=sqlite3.PARSE_COLNAMES)
+        register_sqlite(connection)
+        connection.execute('CREATE TABLE events (day PYDATE, moment PYDATETIME)')
+        connection.executemany('INSERT INTO events VALUES (?, ?)',
+                               [(PyDate(2024, 5, 15), PyDateTime(2024, 5, 15, 10, 30)), (None, None)])
+        rows = connection.execute(query).fetchall()
+        connection.close()
+        self.assertEqual((date(2024, 5, 1), date(2024, 5, 19), datetime(2024, 5, 15, 10),
+                          datetime(2024, 5, 15, 23, 59, 59, 999)), rows[0])
+        self.assertEqual((None, None, None, None), rows[1])
+
+        grouped = self.connection.execute('SELECT pydate_start_of(day, \'month\'), count(*) FROM events '
+                                          'WHERE day IS NOT NULL GROUP BY 1').fetchall()
+        self.assertEqual([(PyDate(2024, 5, 1).toordinal(), 1)], grouped)
+
+    def test_timezone(self):
+        register_sqlite(tz=timezone.utc)
+        try:
+            self.connection.execute('INSERT INTO events VALUES (?, ?)', (None, PyDateTime(2024, 5, 15, 10)))
+            moment = self.connection.execute('SELECT moment FROM events').fetchone()[0]
+            self.assertEqual(datetime(2024, 5, 15, 10, tzinfo=timezone.utc), moment)
+        finally:
+            register_sqlite()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,138 @@
+import unittest
+from operator import itemgetter
+from datetime import date, datetime, timedelta, timezone
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart, TimePart
+from dvrd_pydate.duration import Duration, parse_duration
+from dvrd_pydate.streams import merge, timestamp_key, asof_join, detect_gaps, fill_gaps, Gap, \
+    sessionize, Session
+
+
+class TestStreams(unittest.TestCase):
+    def test_timestamp_key(self):
+        self.assertEqual(0, timestamp_key(datetime(1970, 1, 1)))
+        self.assertEqual(0, timestamp_key(PyDate(1970, 1, 1)))
+        self.assertEqual(86_400_000_000, timestamp_key(date(1970, 1, 2)))
+        self.assertEqual(-3_600_000_000, timestamp_key(datetime(1970, 1, 1, tzinfo=timezone(timedelta(hours=1)))))
+        self.assertEqual(1, timestamp_key(PyDateTime(1970, 1, 1, 0, 0, 0, 1)))
+
+    def test_merge(self):
+        first = [PyDateTime(2024, 1, 1, hour) for hour in range(0, 24, 3)]
+        second = [PyDateTime(2024, 1, 1, hour) for hour in range(0, 24, 2)]
+        third = [datetime(2024, 1, 1, 5, tzinfo=timezone.utc), PyDateTime(2024, 1, 2)]
+        merged = list(merge(iter(first), iter(second), iter(third)))
+        self.assertEqual(sorted(first + second + third, key=timestamp_key), merged)
+        # Stable for equal timestamps
+        self.assertIs(first[0], merged[0])
+        self.assertIs(second[0], merged[1])
+        self.assertEqual([], list(merge()))
+        self.assertEqual([], list(merge([], [])))
+
+    def test_merge_records(self):
+        first = [('a', PyDateTime(2024, 1, 1, 10, 0, 1)), ('b', PyDateTime(2024, 1, 1, 10, 1))]
+        second = [('c', PyDateTime(2024, 1, 1, 10, 0, 30)), ('d', datetime(2024, 1, 1, 10, 1, 20))]
+        key = itemgetter(1)
+        self.assertEqual(['a', 'c', 'b', 'd'], [name for name, _ in merge(first, second, key=key)])
+        self.assertEqual(['a', 'b'], [name for name, _ in merge(first, second, key=key, granularity=TimePart.MINUTE)])
+        days = merge([PyDate(2024, 1, 1), PyDate(2024, 1, 3)], [date(2024, 1, 2), date(2024, 1, 8)],
+                     granularity=DatePart.WEEK)
+        self.assertEqual([date(2024, 1, 1), date(2024, 1, 8)], list(days))
+
+    def test_asof_join(self):
+        base = PyDateTime(2024, 1, 1, 10)
+        trades = [('t1', base + timedelta(milliseconds=100)), ('t2', base + timedelta(milliseconds=900)),
+                  ('t3', base + timedelta(seconds=5)), ('t4', base + timedelta(seconds=5))]
+        quotes = [('q0', base), ('q1', base + timedelta(milliseconds=700)), ('q2', base + timedelta(seconds=1)),
+                  ('q3', base + timedelta(seconds=6))]
+        key = itemgetter(1)
+
+        def names(**kwargs) -> list[tuple[str, str | None]]:
+            return [(trade[0], None if quote is None else quote[0])
+                    for trade, quote in asof_join(iter(trades), iter(quotes), key=key, **kwargs)]
+
+        self.assertEqual([('t1', 'q0'), ('t2', 'q1'), ('t3', 'q2'), ('t4', 'q2')], names())
+        self.assertEqual([('t1', 'q0'), ('t2', 'q1'), ('t3', None), ('t4', None)],
+                         names(tolerance=(0.5, TimePart.SECONDS)))
+        self.assertEqual([('t1', 'q1'), ('t2', 'q2'), ('t3', 'q3'), ('t4', 'q3')], names(direction='forward'))
+        self.assertEqual([('t1', 'q0'), ('t2', 'q2'), ('t3', 'q3'), ('t4', 'q3')], names(direction='nearest'))
+        self.assertEqual([('t1', 'q0'), ('t2', 'q2'), ('t3', None), ('t4', None)],
+                         names(direction='nearest', tolerance=timedelta(milliseconds=500)))
+        # Exact matches, right items without a key function
+        moments = [base, base + timedelta(seconds=1)]
+        self.assertEqual(list(zip(moments, moments)), list(asof_join(moments, moments, direction='forward')))
+        self.assertEqual([(base, None)], list(asof_join([base], [], direction='nearest')))
+        self.assertEqual([(base, None)], list(asof_join([base], moments[1:])))
+        self.assertRaises(ValueError, list, asof_join([base], moments, direction='sideways'))
+        self.assertRaises(KeyError, list, asof_join([base], moments, tolerance=(1, DatePart.MONTH)))
+
+    def test_detect_gaps(self):
+        days = [PyDate(2024, 1, 1), PyDate(2024, 1, 2), PyDate(2024, 1, 5), PyDate(2024, 1, 5), date(2024, 1, 4),
+                PyDate(2024, 1, 6)]
+        self.assertEqual([Gap('missing', date(2024, 1, 3), date(2024, 1, 4), 2),
+                          Gap('duplicate', date(2024, 1, 5), date(2024, 1, 5)),
+                          Gap('out_of_order', date(2024, 1, 4), date(2024, 1, 4))], list(detect_gaps(days)))
+        self.assertEqual([], list(detect_gaps(PyDate.iter(start=PyDate(2024, 1, 1), max_steps=50))))
+        self.assertEqual([], list(detect_gaps([])))
+
+        base = PyDateTime(2024, 1, 1)
+        moments = [base, base + timedelta(minutes=15), base + timedelta(minutes=20), base + timedelta(minutes=70),
+                   base + timedelta(minutes=85)]
+        self.assertEqual([Gap('unaligned', base + timedelta(minutes=20), base + timedelta(minutes=20)),
+                          Gap('missing', base + timedelta(minutes=30), base + timedelta(minutes=60), 3)],
+                         list(detect_gaps(moments, (15, TimePart.MINUTES))))
+
+        # Calendar steps follow iter, month ends are clamped
+        months = [PyDate(2024, 1, 31), PyDate(2024, 2, 29), PyDate(2024, 5, 29)]
+        self.assertEqual([Gap('missing', date(2024, 3, 29), date(2024, 4, 29), 2)],
+                         list(detect_gaps(months, DatePart.MONTH)))
+
+    def test_fill_gaps(self):
+        days = [PyDate(2024, 1, 1), PyDate(2024, 1, 4), PyDate(2024, 1, 4), PyDate(2024, 1, 5)]
+        expected = list(PyDate.iter(start=PyDate(2024, 1, 1), end=PyDate(2024, 1, 6)))
+        self.assertEqual(expected, list(fill_gaps(days)))
+        filled = fill_gaps(iter(days))
+        self.assertEqual([date(2024, 1, 1), date(2024, 1, 2)], [next(filled), next(filled)])
+        hours = [PyDateTime(2024, 1, 1, 0), PyDateTime(2024, 1, 1, 3, 30)]
+        self.assertEqual([datetime(2024, 1, 1, hour) for hour in range(4)] + [datetime(2024, 1, 1, 3, 30)],
+                         list(fill_gaps(hours, TimePart.HOUR)))
+        self.assertEqual(list(fill_gaps(hours, TimePart.HOUR)), list(fill_gaps(hours, (1, 'hours'))))
+        self.assertEqual(list(fill_gaps(hours, TimePart.HOUR)), list(fill_gaps(hours, 'hour')))
+        # ISO durations as step
+        months = [PyDate(2024, 1, 31), PyDate(2024, 4, 29)]
+        self.assertEqual([date(2024, 1, 31), date(2024, 2, 29), date(2024, 3, 29), date(2024, 4, 29)],
+                         list(fill_gaps(months, parse_duration('P1M'))))
+        self.assertEqual([Gap('missing', date(2024, 2, 29), date(2024, 3, 29), 2)],
+                         list(detect_gaps(months, parse_duration('P1M'))))
+        for step in ((0, TimePart.HOURS), (-1, DatePart.DAY), (0.0, 'days'), Duration(), parse_duration('-P1D')):
+            self.assertRaises(ValueError, fill_gaps, hours, step)
+            self.assertRaises(ValueError, detect_gaps, hours, step)
+
+    def test_sessionize(self):
+        base = PyDateTime(2024, 1, 1, 10)
+        events = [('a', base), ('b', base.add(5, TimePart.MINUTES)), ('a', base.add(20, TimePart.MINUTES)),
+                  ('b', base.add(40, TimePart.MINUTES)), ('a', base.add(50, TimePart.MINUTES)),
+                  ('b', base.add(70, TimePart.MINUTES)), ('a', base.add(81, TimePart.MINUTES))]
+        sessions = sessionize(iter(events))
+        # The first session of b is closed by its event at 10:40, 35 minutes later
+        self.assertEqual(Session('b', base.add(5, TimePart.MINUTES), base.add(5, TimePart.MINUTES), 1), next(sessions))
+        self.assertEqual([Session('a', base, base.add(50, TimePart.MINUTES), 3),
+                          Session('b', base.add(40, TimePart.MINUTES), base.add(70, TimePart.MINUTES), 2),
+                          Session('a', base.add(81, TimePart.MINUTES), base.add(81, TimePart.MINUTES), 1)],
+                         list(sessions))
+        # Exactly the gap apart stays one session
+        self.assertEqual([Session('a', base, base.add(1, TimePart.HOUR), 2)],
+                         list(sessionize([('a', base), ('a', base.add(1, TimePart.HOUR))], (1, TimePart.HOUR))))
+        self.assertEqual([], list(sessionize([])))
+
+    def test_sessionize_records(self):
+        base = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+        records = [{'user': 1, 'at': base}, {'user': 2, 'at': base + timedelta(seconds=10)},
+                   {'user': 1, 'at': base + timedelta(seconds=50)}]
+        sessions = list(sessionize(records, timedelta(seconds=30), key=itemgetter('at'), user=itemgetter('user')))
+        self.assertEqual([(1, 1), (2, 1), (1, 1)], [(session.user, session.count) for session in sessions])
+        with self.assertRaises(KeyError):
+            list(sessionize(records, (1, DatePart.MONTH), key=itemgetter('at'), user=itemgetter('user')))
+
+
+if __name__ == '__main__':
+    unittest.main()
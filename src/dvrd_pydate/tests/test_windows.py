@@ -0,0 +1,54 @@
+import unittest
+from datetime import date, datetime, timedelta
+
+from dvrd_pydate import PyDate, PyDateTime, DatePart, TimePart
+from dvrd_pydate.windows import SlidingWindowCounter
+
+
+class TestWindows(unittest.TestCase):
+    def test_minutes(self):
+        counter = SlidingWindowCounter(TimePart.MINUTE, 60)
+        base = PyDateTime(2024, 1, 1, 10)
+        self.assertEqual(1, counter.increment(base))
+        self.assertEqual(3, counter.increment(base + timedelta(minutes=30), 2))
+        self.assertEqual(4, counter.increment(base + timedelta(minutes=59, seconds=59)))
+        # 10:00 bucket leaves the window at 11:00
+        self.assertEqual(3, counter.total(base + timedelta(hours=1)))
+        self.assertEqual(3, len(counter))
+        # Older events are ignored, events within the window are counted
+        self.assertEqual(3, counter.increment(base))
+        self.assertEqual(4, counter.increment(datetime(2024, 1, 1, 10, 45)))
+        self.assertEqual(0, counter.total(base + timedelta(hours=5)))
+        counter.clear()
+        self.assertEqual(0, counter.total(base))
+
+    def test_matches_brute_force(self):
+        counter = SlidingWindowCounter(TimePart.SECOND, 10)
+        base = PyDateTime(2024, 1, 1)
+        events = []
+        for step in range(200):
+            moment = base + timedelta(milliseconds=step * 370)
+            events.append(moment)
+            expected = sum(1 for event in events
+                           if event.start_of(TimePart.SECOND) > moment.start_of(TimePart.SECOND) - timedelta(seconds=10))
+            self.assertEqual(expected, counter.increment(moment))
+
+    def test_calendar(self):
+        counter = SlidingWindowCounter(DatePart.MONTH, 3)
+        counter.increment(PyDate(2024, 1, 31))
+        counter.increment(date(2024, 2, 1))
+        self.assertEqual(3, counter.increment(PyDateTime(2024, 3, 15, 12)))
+        self.assertEqual(2, counter.total(PyDate(2024, 4, 1)))
+        weeks = SlidingWindowCounter(DatePart.WEEK, 1)
+        # 2024-01-07 is a Sunday
+        weeks.increment(PyDate(2024, 1, 7))
+        self.assertEqual(0, weeks.total(PyDate(2024, 1, 8)))
+        self.assertIsInstance(SlidingWindowCounter().total(), int)
+
+    def test_validation(self):
+        self.assertRaises(ValueError, SlidingWindowCounter, TimePart.MINUTE, 0)
+        self.assertRaises(KeyError, SlidingWindowCounter, 'minute', 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,92 @@
+from datetime import date, datetime
+
+from dvrd_pydate.enums import DatePart, TimePart
+from dvrd_pydate.pydate import PyDate
+from dvrd_pydate.pydatetime import PyDateTime
+
+
+class SlidingWindowCounter:
+    """
+    Event counter over the last `buckets` periods of given granularity, e.g. the last 60 minutes with
+    (TimePart.MINUTE, 60). Periods start as in start_of, the current (partial) period included. Counts are kept in a
+    ring buffer of one count per period, so memory is fixed and increments and queries are O(1) (amortized over the
+    periods that expire).
+
+    >>> counter = SlidingWindowCounter(TimePart.MINUTE, 60)
+    >>> counter.increment(PyDateTime(2024, 1, 1, 10, 0))
+    1
+    >>> counter.increment(PyDateTime(2024, 1, 1, 10, 59, 59))
+    2
+    >>> counter.total(PyDateTime(2024, 1, 1, 11, 0))
+    1
+    """
+    __slots__ = ('granularity', 'buckets', '_counts', '_newest', '_total')
+
+    def __init__(self, granularity: DatePart | TimePart = TimePart.SECOND, buckets: int = 60):
+        if buckets < 1:
+            raise ValueError('buckets must be at least 1')
+        # Raises KeyError for unsupported granularities
+        PyDateTime(2000, 1, 1).granularity_key(granularity)
+        self.granularity = granularity
+        self.buckets = buckets
+        self._counts = [0] * buckets
+        # Key (see granularity_key) of the newest period in the window
+        self._newest: int | None = None
+        self._total = 0
+
+    def increment(self, moment: date | None = None, amount: int = 1) -> int:
+        """
+        Count amount events at moment (now if omitted) and return the total of the window ending at the newest
+        period. Events in periods that already left the window are ignored.
+        """
+        key = self._key(moment)
+        self._advance(key)
+        if key > self._newest - self.buckets:
+            self._counts[key % self.buckets] += amount
+            self._total += amount
+        return self._total
+
+    def total(self, moment: date | None = None) -> int:
+        """
+        Total of the window ending at the period of moment (now if omitted), or at the newest period counted so far if
+        that is later.
+        """
+        self._advance(self._key(moment))
+        return self._total
+
+    def clear(self):
+        self._counts = [0] * self.buckets
+        self._newest = None
+        self._total = 0
+
+    def __len__(self) -> int:
+        return self._total
+
+    def __repr__(self) -> str:
+        return f'SlidingWindowCounter({self.granularity}, {self.buckets}, total={self._total})'
+
+    def _key(self, moment: date | None) -> int:
+        if moment is None:
+            moment = PyDateTime.now()
+        elif not isinstance(moment, PyDate):
+            moment = PyDateTime(moment) if isinstance(moment, datetime) else PyDate(moment)
+        return moment.granularity_key(self.granularity)
+
+    def _advance(self, key: int):
+        newest = self._newest
+        if newest is None:
+            self._newest = key
+            return
+        if key <= newest:
+            return
+        buckets = self.buckets
+        if key - newest >= buckets:
+            self._counts = [0] * buckets
+            self._total = 0
+        else:
+            counts = self._counts
+            for expired in range(newest + 1, key + 1):
+                slot = expired % buckets
+                self._total -= counts[slot]
+                counts[slot] = 0
+        self._newest = key